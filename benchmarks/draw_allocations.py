@@ -0,0 +1,93 @@
+# benchmarks/draw_allocations.py
+#
+# Liczy powierzchnie tworzone w ścieżce rysowania przeciwników, wież i pocisków
+# (wywołania pygame.transform) oraz mierzy czas rysowania klatki, np.:
+#   python benchmarks/draw_allocations.py --enemies 500 --towers 15 --frames 200
+
+import os, sys, time, math, random, argparse
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+os.chdir(ROOT) # ścieżki do grafik są względne
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import pygame
+from config import WIDTH, HEIGHT
+from game.level import TOWER_SLOTS
+
+
+def count_transforms():
+    """Podmienia funkcje pygame.transform na wersje zliczające utworzone powierzchnie."""
+    counter = {"surfaces": 0}
+    for name in ("flip", "rotate", "rotozoom", "scale", "smoothscale"):
+        original = getattr(pygame.transform, name)
+        def counted(*args, _original=original, **kwargs):
+            counter["surfaces"] += 1
+            return _original(*args, **kwargs)
+        setattr(pygame.transform, name, counted)
+    return counter
+
+
+def build_scene(enemy_count, tower_count, rng):
+    """Tworzy przeciwników we wszystkich kierunkach, wieże i lecące pociski."""
+    from game.enemy import Enemy, FastEnemy, TankEnemy
+    from game.tower import Tower
+    from game.bullet import Bullet
+
+    enemies = []
+    for i in range(enemy_count):
+        enemy = rng.choice([Enemy, FastEnemy, TankEnemy])()
+        enemy.x, enemy.y = rng.uniform(0, WIDTH), rng.uniform(0, HEIGHT)
+        enemy.direction = ("up", "down", "left", "right")[i % 4]
+        enemies.append(enemy)
+
+    towers = [Tower(x, y) for x, y in TOWER_SLOTS[:tower_count]]
+    bullets = []
+    for i, tower in enumerate(towers):
+        # Cele dookoła wieży - łucznik patrzy w każdą stronę
+        angle = i * math.pi / 2
+        target = enemies[i % len(enemies)] if enemies else None
+        tower.set_direction(type("Point", (), {"x": tower.x + math.cos(angle) * 50,
+                                               "y": tower.y + math.sin(angle) * 50})())
+        tower.archer_state = "attack"
+        if target:
+            x, y = tower.get_bullet_start_pos()
+            bullets.append(Bullet(x, y, target))
+    return enemies, towers, bullets
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Zliczanie alokacji powierzchni w ścieżce rysowania.")
+    parser.add_argument("--enemies", type=int, default=500)
+    parser.add_argument("--towers", type=int, default=15)
+    parser.add_argument("--frames", type=int, default=200)
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    pygame.init()
+    screen = pygame.display.set_mode((WIDTH, HEIGHT))
+
+    from game.bullet import load_arrow_animations
+    load_arrow_animations()
+
+    enemies, towers, bullets = build_scene(args.enemies, args.towers, random.Random(args.seed))
+    counter = count_transforms()
+
+    start = time.perf_counter()
+    for _ in range(args.frames):
+        for tower in towers:
+            tower.draw(screen)
+        for enemy in enemies:
+            enemy.draw(screen)
+        for bullet in bullets:
+            bullet.draw(screen)
+    elapsed = time.perf_counter() - start
+
+    print(f"obiekty: {len(enemies)} przeciwników, {len(towers)} wież, {len(bullets)} pocisków")
+    print(f"powierzchnie z pygame.transform: {counter['surfaces'] / args.frames:.1f} na klatkę")
+    print(f"czas rysowania: {elapsed / args.frames * 1000:.2f} ms na klatkę")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,113 @@
+# benchmarks/entity_memory.py
+#
+# Mierzy pamięć zajmowaną przez obiekty gry (tracemalloc) przy danej liczebności
+# w symulacji bez grafik, np.:
+#   python benchmarks/entity_memory.py --count 10000
+
+import os, sys, argparse, tracemalloc
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+os.chdir(ROOT) # ścieżki do grafik są względne
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+from game.level import TOWER_SLOTS
+
+
+def entity_factories():
+    """Zwraca funkcje tworzące pojedynczy obiekt każdego typu (klucz: nazwa typu)."""
+    from game.enemy import Enemy, FastEnemy, TankEnemy
+    from game.bullet import Bullet, IceBullet
+    from game.effects import FireZone
+    from game.tower import Tower, FireTower, IceTower, SpeedyTower
+
+    target = Enemy()
+    x, y = TOWER_SLOTS[0]
+    return {
+        "Enemy": lambda i: Enemy(),
+        "FastEnemy": lambda i: FastEnemy(),
+        "TankEnemy": lambda i: TankEnemy(),
+        "Bullet": lambda i: Bullet(x, y, target),
+        "IceBullet": lambda i: IceBullet(x, y, target),
+        "FireZone": lambda i: FireZone(x, y),
+        "Tower": lambda i: Tower(x, y),
+        "FireTower": lambda i: FireTower(x, y),
+        "IceTower": lambda i: IceTower(x, y),
+        "SpeedyTower": lambda i: SpeedyTower(x, y),
+    }
+
+
+def measure(create, count):
+    """Zwraca liczbę bajtów zaalokowanych na jeden obiekt (bez listy, która je trzyma)."""
+    create(0) # pierwsze utworzenie wczytuje współdzielone animacje
+    items = [None] * count
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    for i in range(count):
+        items[i] = create(i)
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return (after - before) / count
+
+
+def measure_store(count):
+    """Zwraca liczbę bajtów na przeciwnika w EnemyStore (tablice NumPy i widoki)."""
+    from game.enemy import Enemy
+    from game.enemy_store import EnemyStore
+
+    template = Enemy()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    store = EnemyStore(capacity=count)
+    for _ in range(count):
+        store.add(template)
+    store.enemies()
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return (after - before) / count
+
+
+def measure_simulation(count, ticks, enemy_store):
+    """Zwraca (bajty po dodaniu przeciwników, szczyt w trakcie ticks kroków) dla symulacji bez okna."""
+    from game.simulation import Simulation
+    from game.enemy import Enemy
+
+    tracemalloc.start()
+    sim = Simulation(assets=False, seed=1, fixed_dt=1 / 60, enemy_store=enemy_store)
+    for _ in range(count):
+        sim.add_enemy(Enemy(sim.difficulty))
+    loaded = tracemalloc.get_traced_memory()[0]
+    sim.run(ticks)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return loaded, peak
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Pamięć zajmowana przez obiekty gry.")
+    parser.add_argument("--count", type=int, default=10000, help="liczba obiektów każdego typu")
+    parser.add_argument("--enemy-store", action="store_true", help="zmierz też przeciwników w EnemyStore")
+    parser.add_argument("--ticks", type=int, default=60,
+                        help="kroki symulacji z count przeciwnikami na planszy (0 = bez symulacji)")
+    args = parser.parse_args()
+
+    from game.assets import ASSETS
+    ASSETS.set_headless(True) # jak w symulacji bez okna
+
+    results = {name: measure(create, args.count) for name, create in entity_factories().items()}
+    if args.enemy_store:
+        results["EnemyStore"] = measure_store(args.count)
+
+    print(f"{'typ':<12} {'B/obiekt':>10} {'razem (' + str(args.count) + ')':>16}")
+    for name, size in results.items():
+        print(f"{name:<12} {size:>10.0f} {size * args.count / 2**20:>13.2f} MiB")
+
+    if args.ticks:
+        loaded, peak = measure_simulation(args.count, args.ticks, args.enemy_store)
+        print(f"symulacja z {args.count} przeciwnikami: {loaded / 2**20:.2f} MiB, "
+              f"szczyt w {args.ticks} krokach: {peak / 2**20:.2f} MiB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+# benchmarks/map_render.py
+#
+# Mierzy czas rysowania klatki mapy przewijanej kamerą dla coraz szerszych map
+# (kopie bieżącej mapy obok siebie, na każdej tyle samo przeciwników). Przy rysowaniu
+# w kawałkach czas rysowania mapy nie powinien rosnąć z jej szerokością, a czas
+# rysowania przeciwników tylko o sprawdzenie widoczności każdego z nich, np.:
+#   python benchmarks/map_render.py --copies 1 4 16 64 --frames 300
+
+import os, sys, time, random, argparse
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+os.chdir(ROOT) # ścieżki do grafik są względne
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import pygame
+from config import WIDTH, HEIGHT
+from game.level import LEVEL, repeat_map, map_size
+
+
+def measure(copies, frames, enemies_per_copy, rng):
+    """Zwraca (ms na mapę, ms na przeciwników, wyrenderowane kawałki, średnio rysowani przeciwnicy) na klatkę."""
+    from game.map_builder import MapBuilder
+    from game.camera import Camera
+    from game.enemy import Enemy, FastEnemy, TankEnemy
+
+    level = repeat_map(LEVEL, copies)
+    width, height = map_size(level["tiles"])
+    map_builder = MapBuilder(level["tiles"], level["decorations"])
+    camera = Camera((width, height))
+    camera.pressed.add(pygame.K_RIGHT) # przewijanie w prawo, na końcu mapy z powrotem na początek
+
+    enemies = []
+    for _ in range(enemies_per_copy * copies):
+        enemy = rng.choice([Enemy, FastEnemy, TankEnemy])()
+        enemy.x, enemy.y = rng.uniform(0, width), rng.uniform(0, height)
+        enemies.append(enemy)
+
+    screen = pygame.display.get_surface()
+    dt = 1 / 60
+    drawn = 0
+    map_time = enemy_time = 0.0
+    for _ in range(frames):
+        if not camera.update(dt) and camera.view.right >= width:
+            camera.move_to(0, 0)
+        start = time.perf_counter()
+        map_builder.draw_map(screen, camera.view)
+        middle = time.perf_counter()
+        offset = camera.offset
+        for enemy in enemies:
+            if camera.sees(enemy.x, enemy.y):
+                enemy.draw(screen, offset)
+                drawn += 1
+        map_time += middle - start
+        enemy_time += time.perf_counter() - middle
+    return map_time / frames * 1000, enemy_time / frames * 1000, map_builder.rendered, drawn / frames
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Czas rysowania szerokiej mapy przewijanej kamerą.")
+    parser.add_argument("--copies", type=int, nargs="+", default=[1, 4, 16, 64],
+                        help="szerokości map (liczba kopii bieżącej mapy)")
+    parser.add_argument("--frames", type=int, default=300)
+    parser.add_argument("--enemies", type=int, default=100, help="przeciwnicy na jedną kopię mapy")
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    pygame.init()
+    pygame.display.set_mode((WIDTH, HEIGHT))
+
+    print(f"{'kopie':>6} {'mapa (px)':>12} {'ms mapa':>8} {'ms przeciwnicy':>15} {'kawałki':>8} {'widoczni':>9}")
+    for copies in args.copies:
+        map_ms, enemy_ms, rendered, drawn = measure(copies, args.frames, args.enemies, random.Random(args.seed))
+        width, height = map_size(repeat_map(LEVEL, copies)["tiles"])
+        print(f"{copies:>6} {f'{width}x{height}':>12} {map_ms:>8.2f} {enemy_ms:>15.2f} {rendered:>8} {drawn:>9.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,339 @@
+# benchmarks/scenarios.py
+#
+# Scenariusze wydajnościowe uruchamiane bez okna (SDL dummy). Wynik w JSON:
+# czasy faz (percentyle), czas klatki i alokacje pamięci, np.:
+#   python benchmarks/scenarios.py --frames 600 --output wyniki.json
+#   python benchmarks/scenarios.py --scenario all_speedy --scenario idle_menu
+
+import os, sys, time, json, argparse, platform, subprocess, tracemalloc
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+os.chdir(ROOT) # ścieżki do grafik są względne
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import pygame
+from config import WIDTH, HEIGHT, TOTAL_TOWER_NUMBER
+from game.level import TOWER_SLOTS
+from game.simulation import STEP_PHASES
+
+DT = 1 / 60
+
+SIMULATION_PHASES = STEP_PHASES # fazy symulacji mierzone na instancji GameManager
+DRAW_PHASES = ("draw_entities", "draw_interface")
+
+
+def percentiles(samples):
+    """Zwraca statystyki czasów (w milisekundach)."""
+    if not samples:
+        return {"mean": 0.0, "p50": 0.0, "p95": 0.0, "p99": 0.0, "max": 0.0}
+    ordered = sorted(samples)
+    def pick(q):
+        return ordered[min(len(ordered) - 1, int(q * len(ordered)))] * 1000
+    return {
+        "mean": round(sum(ordered) / len(ordered) * 1000, 4),
+        "p50": round(pick(0.50), 4),
+        "p95": round(pick(0.95), 4),
+        "p99": round(pick(0.99), 4),
+        "max": round(ordered[-1] * 1000, 4),
+    }
+
+
+class PhaseTimer:
+    """Mierzy czas wybranych metod obiektu, podmieniając je na instancji."""
+    def __init__(self):
+        self.current = {}
+
+    def wrap(self, obj, name, phase = None):
+        phase = phase or name
+        method = getattr(obj, name)
+        current = self.current
+        def timed(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return method(*args, **kwargs)
+            finally:
+                current[phase] = current.get(phase, 0.0) + time.perf_counter() - start
+        setattr(obj, name, timed)
+
+    def take(self):
+        """Zwraca czasy faz z ostatniej klatki i zeruje liczniki."""
+        frame = dict(self.current)
+        self.current.clear()
+        return frame
+
+
+# --- Scenariusze ---------------------------------------------------------------
+
+def new_game(screen, difficulty = "Normal", seed = 1, **options):
+    """Tworzy grę z dużym zapasem złota i HP (scenariusz nie kończy się porażką)."""
+    from game.game_manager import GameManager
+    game = GameManager(screen, difficulty, seed=seed, **options)
+    game.gold = 10 ** 9
+    game.hp = 10 ** 9
+    return game
+
+
+def build_towers(game, type_name = None, slots = None, level = 3):
+    """Stawia wieże na slotach, ulepsza je i opcjonalnie ewoluuje."""
+    for x, y in (slots or TOWER_SLOTS)[:TOTAL_TOWER_NUMBER]:
+        tower = game.build_tower(x, y)
+        if tower is None:
+            continue
+        while tower.level < level and game.upgrade_tower(tower):
+            pass
+        if type_name and game.can_evolve(tower):
+            game.evolve_tower(tower, type_name)
+    game.refresh_coverage()
+
+
+def start_wave(game, wave_number, spawn_delay = None):
+    """Przeskakuje do podanej fali."""
+    game.wave_number = wave_number
+    if spawn_delay is not None:
+        game.spawn_delay = spawn_delay
+    game.spawn_wave()
+
+
+def prespawn_enemies(game, wave_number, count, spread = 0.8):
+    """Wprowadza od razu count przeciwników fali, rozłożonych wzdłuż początku ścieżki (spread jej długości)."""
+    from game.pool import acquire
+    from game.waves import wave_weights
+    from game.enemy import ENEMY_TYPES
+
+    for enemy_type in game.rng.choices(ENEMY_TYPES, weights=wave_weights(wave_number), k=count):
+        enemy = acquire(enemy_type, difficulty=game.difficulty)
+        enemy.distance = game.rng.uniform(0, enemy.path.length * spread)
+        enemy.x, enemy.y, enemy.direction, enemy.current_point = enemy.path.sample(enemy.distance)
+        game.add_enemy(enemy)
+
+
+def max_towers_wave40_hard(screen, prespawn = 400, **options):
+    """15 wież na maksymalnym poziomie (mieszane ewolucje), fala 40, poziom Hard, 400 przeciwników na ścieżce."""
+    game = new_game(screen, "Hard", **options)
+    evolutions = ["FireTower", "IceTower", "SpeedyTower"]
+    build_towers(game)
+    for i, tower in enumerate(list(game.towers)):
+        game.evolve_tower(tower, evolutions[i % 3])
+    game.refresh_coverage()
+    prespawn_enemies(game, 40, prespawn)
+    start_wave(game, 40, spawn_delay=0.3)
+    return game
+
+
+def all_speedy(screen, **options):
+    """15 wież SpeedyTower (dużo pocisków), fala 20."""
+    game = new_game(screen, "Normal", **options)
+    build_towers(game, "SpeedyTower")
+    start_wave(game, 20, spawn_delay=0.3)
+    return game
+
+
+def fire_zone_stacking(screen, **options):
+    """15 wież FireTower przy ścieżce - nakładające się strefy ognia, fala 25 Hard."""
+    game = new_game(screen, "Hard", **options)
+    build_towers(game, "FireTower")
+    start_wave(game, 25, spawn_delay=0.2)
+    return game
+
+
+SCENARIOS = \
+{
+    "max_towers_wave40_hard": max_towers_wave40_hard,
+    "all_speedy": all_speedy,
+    "fire_zone_stacking": fire_zone_stacking,
+    "idle_menu": None, # osobna pętla - ekran startowy z animowaną mapą
+}
+
+
+# --- Pomiary ---------------------------------------------------------------
+
+def run_game(factory, screen, frames, warmup, options):
+    """Uruchamia scenariusz gry, mierząc fazy symulacji i rysowania."""
+    game = factory(screen, **options)
+    timer = PhaseTimer()
+    for name in SIMULATION_PHASES:
+        timer.wrap(game, name)
+    for name in DRAW_PHASES:
+        timer.wrap(game, name)
+
+    samples = {phase: [] for phase in SIMULATION_PHASES + DRAW_PHASES + ("map_draw", "update", "draw", "frame")}
+    counts = {"enemies": 0, "bullets": 0}
+
+    for i in range(warmup + frames):
+        start = time.perf_counter()
+        game.update(DT)
+        updated = time.perf_counter()
+        game.draw()
+        end = time.perf_counter()
+
+        phases = timer.take()
+        if i < warmup:
+            continue
+        for phase in SIMULATION_PHASES + DRAW_PHASES:
+            samples[phase].append(phases.get(phase, 0.0))
+        draw = end - updated
+        # Rysowanie mapy = całe rysowanie bez bytów i interfejsu
+        samples["map_draw"].append(max(0.0, draw - phases.get("draw_entities", 0.0)
+                                       - phases.get("draw_interface", 0.0)))
+        samples["update"].append(updated - start)
+        samples["draw"].append(draw)
+        samples["frame"].append(end - start)
+        counts["enemies"] = max(counts["enemies"], len(game.enemies))
+        counts["bullets"] = max(counts["bullets"], len(game.bullets))
+
+    return samples, counts, game
+
+
+def run_menu(screen, frames, warmup):
+    """Mierzy klatkę ekranu startowego (animowana mapa w tle)."""
+    from game.menu import MenuScreen
+    from game.map_builder import MapBuilder
+    from game.game_manager import interface_images
+
+    menu = MenuScreen("Tower Defense Game",
+                      [("Start", pygame.Rect(WIDTH // 2 - 125, 200, 250, 80), (0, 150, 0)),
+                       ("Wyjdź", pygame.Rect(WIDTH // 2 - 125, 320, 250, 80), (150, 0, 0))],
+                      interface_images()[4], (None, 48), map_builder=MapBuilder(), opacity=230)
+
+    samples = {"draw": [], "frame": []}
+    for i in range(warmup + frames):
+        start = time.perf_counter()
+        menu.draw(screen, DT)
+        elapsed = time.perf_counter() - start
+        if i >= warmup:
+            samples["draw"].append(elapsed)
+            samples["frame"].append(elapsed)
+    return samples, {}, menu
+
+
+def measure_allocations(run, frames):
+    """Uruchamia scenariusz pod tracemalloc i zwraca alokacje Pythona na klatkę."""
+    tracemalloc.start()
+    try:
+        per_frame = []
+        def step():
+            tracemalloc.reset_peak()
+            before, _ = tracemalloc.get_traced_memory()
+            run()
+            _, peak = tracemalloc.get_traced_memory()
+            per_frame.append(peak - before)
+
+        base, _ = tracemalloc.get_traced_memory()
+        for _ in range(frames):
+            step()
+        current, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    ordered = sorted(per_frame)
+    return {
+        "frames": frames,
+        "peak_kib_per_frame_mean": round(sum(ordered) / len(ordered) / 1024, 2),
+        "peak_kib_per_frame_p95": round(ordered[int(0.95 * (len(ordered) - 1))] / 1024, 2),
+        "retained_kib": round((current - base) / 1024, 2),
+        "peak_kib": round((peak - base) / 1024, 2),
+    }
+
+
+def run_scenario(name, screen, frames, warmup, alloc_frames, options):
+    """Uruchamia jeden scenariusz i zwraca jego wynik."""
+    from game.pool import pool_stats, reset_pool_stats
+    reset_pool_stats()
+
+    factory = SCENARIOS[name]
+    if factory is None:
+        samples, counts, target = run_menu(screen, frames, warmup)
+        def frame():
+            target.draw(screen, DT)
+    else:
+        samples, counts, target = run_game(factory, screen, frames, warmup, options)
+        def frame():
+            target.update(DT)
+            target.draw()
+
+    frame_times = samples["frame"]
+    result = {
+        "description": (factory.__doc__ if factory else run_menu.__doc__).strip(),
+        "frames": frames,
+        "fps_mean": round(len(frame_times) / sum(frame_times), 1) if sum(frame_times) else None,
+        "phases": {phase: percentiles(times) for phase, times in samples.items()},
+        "max_counts": counts,
+        "allocations": measure_allocations(frame, alloc_frames) if alloc_frames else None,
+        "pools": pool_stats(),
+    }
+    return result
+
+
+def metadata():
+    """Zwraca informacje o środowisku pomiaru."""
+    try:
+        commit = subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True,
+                                text=True, cwd=ROOT).stdout.strip() or None
+    except OSError:
+        commit = None
+    try:
+        import numpy
+        numpy_version = numpy.__version__
+    except ImportError:
+        numpy_version = None
+    return {
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "commit": commit,
+        "python": platform.python_version(),
+        "pygame": pygame.version.ver,
+        "numpy": numpy_version,
+        "platform": platform.platform(),
+        "video_driver": os.environ.get("SDL_VIDEODRIVER"),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Scenariusze wydajnościowe gry (wynik w JSON).")
+    parser.add_argument("--scenario", action="append", choices=list(SCENARIOS),
+                        help="scenariusz do uruchomienia (domyślnie wszystkie)")
+    parser.add_argument("--frames", type=int, default=600, help="liczba mierzonych klatek")
+    parser.add_argument("--warmup", type=int, default=60, help="klatki rozgrzewki (niemierzone)")
+    parser.add_argument("--alloc-frames", type=int, default=120, help="klatki pomiaru alokacji (0 = pomiń)")
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--dirty-rects", action="store_true", help="renderowanie brudnymi prostokątami")
+    parser.add_argument("--enemy-store", action="store_true", help="przeciwnicy w tablicach NumPy")
+    parser.add_argument("--batched-bullets", action="store_true", help="pociski w tablicach NumPy")
+    parser.add_argument("--output", help="plik wynikowy JSON (domyślnie standardowe wyjście)")
+    parser.add_argument("--list", action="store_true", help="wypisuje dostępne scenariusze")
+    args = parser.parse_args()
+
+    if args.list:
+        for name, factory in SCENARIOS.items():
+            print(f"{name:26s} {(factory.__doc__ if factory else run_menu.__doc__).strip()}")
+        return
+
+    pygame.init()
+    pygame.display.set_mode((WIDTH, HEIGHT))
+    screen = pygame.Surface((WIDTH, HEIGHT)).convert()
+
+    from game.assets import load_sounds
+    from game.bullet import load_arrow_animations
+    load_sounds()
+    load_arrow_animations()
+
+    options = {"seed": args.seed, "dirty_rects": args.dirty_rects, "enemy_store": args.enemy_store,
+               "batched_bullets": args.batched_bullets}
+    report = {"meta": metadata(), "settings": dict(vars(args)), "scenarios": {}}
+    for name in args.scenario or list(SCENARIOS):
+        report["scenarios"][name] = run_scenario(name, screen, args.frames, args.warmup,
+                                                 args.alloc_frames, options)
+        print(f"{name}: {report['scenarios'][name]['phases']['frame']['mean']:.2f} ms/klatkę",
+              file=sys.stderr)
+
+    output = json.dumps(report, indent=2, ensure_ascii=False)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(output + "\n")
+    else:
+        print(output)
+
+
+if __name__ == "__main__":
+    main()
@@ -9,88 +9,54 @@ WHITE = (255, 255, 255)
 BLACK = (0, 0, 0)
 
 
-# Punkty ścieżki przeciwników
-ENEMY_PATH = \
-[
-    (0, 395), (210, 395), (210, 717), (336, 717), (336, 203), (79,203), (79,110),
-    (560, 110), (560, 718), (687, 718), (687, 557), (849, 557), (849, 718), 
-    (1010, 718), (1008, 300)
-]
-
-# Pozycje wież
-TOWER_SLOTS = \
-[
-    (158, 512), (383, 447), (287,607), (287, 319), (127, 255), (223, 157),(447,158),
-    (352,63), (512, 288), (511, 544), (512, 672), (607, 415), (640, 608), (735,512),
-    (799,639), (927,672), (1056,607), (959, 511), (1055, 384), (158, 704), (607, 96),
-    (94,64), (95,352), (255, 448)
-]
-
 # Dane gry
 START_GOLD = 300
 START_HP = 100
-TOWER_BASE_COST = 20
+CONTENT_FILE = "data/content.json" # statystyki przeciwników i wież, ulepszenia, fale i nagrody
 TOTAL_TOWER_NUMBER = 15
 GLOBAL_VOLUME = 0.5
 
+# Tryb deterministyczny (None = wyłączony)
+SIMULATION_SEED = None # seed generatora losowego symulacji
+FIXED_TIMESTEP = None  # stały krok symulacji w sekundach, np. 1 / 60
+MAX_STEPS_PER_FRAME = 6 # maksymalna liczba kroków symulacji na klatkę
+
+# Przeciwnicy w tablicach NumPy (wymaga pakietu numpy)
+USE_ENEMY_STORE = False
+BATCHED_PROJECTILES = False # pociski aktualizowane zbiorczo (wymaga pakietu numpy)
+POOL_MAX_FREE = 512 # maksymalna liczba obiektów czekających w puli jednej klasy
+WAVE_PREWARM = True # przygotowanie przeciwników następnej fali w puli w czasie przerwy między falami
+WAVE_PREWARM_PER_STEP = 4 # maksymalna liczba przeciwników tworzonych na zapas w jednym kroku
+
+# Ustawienia renderowania
+TEXT_CACHE_SIZE = 256 # maksymalna liczba zapamiętanych wyrenderowanych napisów
+RANGE_ON_HOVER_ONLY = False # zasięg tylko wieży pod kursorem zamiast wszystkich wież
+ARROW_ROTATION_STEPS = 64 # liczba wstępnie obróconych wariantów klatki strzały (0 = obrót co klatkę)
+DIRTY_RECT_RENDERING = False # odświeżanie tylko zmienionych obszarów ekranu
+ASSET_LOADER_WORKERS = 4 # wątki dekodujące pliki grafik i dźwięków przy starcie
+ASSET_STREAM_BUDGET_MS = 4 # czas na klatkę na przygotowanie zasobów doczytywanych w tle
+ASSET_BUNDLE = True # grafiki z paczki surowych pikseli (game/bundle.py) zamiast z plików PNG
+ASSET_BUNDLE_DIR = ".asset_cache" # katalog paczki (budowanej automatycznie)
+
+# Dźwięki: maksymalna liczba jednocześnie grających kopii każdego dźwięku (kolejność = priorytet)
+SOUND_VOICE_LIMITS = \
+{
+    "wave_start": 1,
+    "wave_cleared": 1,
+    "enemy_death": 3,
+    "arrow": 4,
+}
+SOUND_MAX_VOICES = 8 # łączny limit jednocześnie grających dźwięków efektów
+SOUND_MAX_GAIN = 2.0 # maksymalne wzmocnienie dźwięku scalonego z kilku odtworzeń w jednej klatce
+
+# Profiler klatek (F3 - włącz/wyłącz wykres, F4 - zapis śladu Chrome/Perfetto)
+PROFILER_ENABLED = False
+PROFILER_FRAMES = 600 # liczba ostatnich klatek trzymanych w buforze cyklicznym
+
 
 # Ustawienia mapy
 TILE_SIZE = 32
-
-MAP_DATA = \
-[
-    [0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0],
-    [0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0],
-    [0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0],
-    [0,0,2,18,19,19,20,18,20,20,19,20,18,19,18,18,20,3,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0],
-    [0,0,17,0,0,0,0,0,0,0,0,0,0,0,0,0,0,15,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0],
-    [0,0,15,0,0,0,0,0,0,0,0,0,0,0,0,0,0,16,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0],
-    [0,0,13,19,18,20,18,20,19,18,3,0,0,0,0,0,0,15,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0],
-    [0,0,0,0,0,0,0,0,0,0,16,0,0,0,0,0,0,15,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0],
-    [0,0,0,0,0,0,0,0,0,0,17,0,0,0,0,0,0,16,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0],
-    [0,0,0,0,0,0,0,0,0,0,15,0,0,0,0,0,0,16,0,0,0,0,0,0,0,0,0,0,0,0,0,14,0,0,0,0,0,0],
-    [0,0,0,0,0,0,0,0,0,0,15,0,0,0,0,0,0,17,0,0,0,0,0,0,0,0,0,0,0,0,0,15,0,0,0,0,0,0],
-    [0,0,0,0,0,0,0,0,0,0,16,0,0,0,0,0,0,16,0,0,0,0,0,0,0,0,0,0,0,0,0,16,0,0,0,0,0,0],
-    [20,19,18,18,20,20,3,0,0,0,15,0,0,0,0,0,0,15,0,0,0,0,0,0,0,0,0,0,0,0,0,16,0,0,0,0,0,0],
-    [0,0,0,0,0,0,15,0,0,0,16,0,0,0,0,0,0,17,0,0,0,0,0,0,0,0,0,0,0,0,0,15,0,0,0,0,0,0],
-    [0,0,0,0,0,0,17,0,0,0,17,0,0,0,0,0,0,16,0,0,0,0,0,0,0,0,0,0,0,0,0,15,0,0,0,0,0,0],
-    [0,0,0,0,0,0,16,0,0,0,16,0,0,0,0,0,0,15,0,0,0,0,0,0,0,0,0,0,0,0,0,17,0,0,0,0,0,0],
-    [0,0,0,0,0,0,16,0,0,0,16,0,0,0,0,0,0,15,0,0,0,0,0,0,0,0,0,0,0,0,0,15,0,0,0,0,0,0],
-    [0,0,0,0,0,0,17,0,0,0,15,0,0,0,0,0,0,17,0,0,0,2,20,19,9,18,3,0,0,0,0,17,0,0,0,0,0,0],
-    [0,0,0,2,19,18,10,0,0,0,16,0,0,0,0,0,0,15,0,0,0,15,0,0,0,0,17,0,0,0,0,16,0,0,0,0,0,0],
-    [0,0,0,0,0,0,17,0,0,0,17,0,0,0,0,0,0,16,0,0,0,15,0,0,0,0,16,0,0,0,0,15,0,0,0,0,0,0],
-    [0,0,0,0,0,0,17,0,0,0,15,0,0,0,0,0,0,17,0,0,0,16,0,0,0,0,15,0,0,0,0,16,0,0,0,0,0,0],
-    [0,0,0,0,0,0,15,0,0,0,15,0,0,0,0,0,0,17,0,0,0,15,0,0,0,0,17,0,0,0,0,17,0,0,0,0,0,0],
-    [0,0,0,0,0,0,4,20,18,19,5,0,0,0,0,0,0,4,19,20,18,5,0,0,0,0,4,19,20,19,18,5,0,0,0,0,0,0],
-    [0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0],
-    [0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0],
-]
-
-DECORATIONS_DATA = \
-[
-    [[24],[26],[27],[],[],[],[],[],[],[],[],[],[],[29],[23],[29],[27],[27],[],[],[],[],[],[],[],[],[],[17],[24],[29],[],[],[],[],[],[],[24],[27]],
-    [[28],[29],[26,6],[],[],[],[],[],[],[],[6],[],[],[20],[24],[23],[],[],[],[],[],[],[],[],[],[],[],[17],[28],[25,36],[],[],[],[36],[],[25],[29],[28]],
-    [[25],[27],[24],[],[],[],[],[43],[],[],[],[],[],[],[],[25],[26],[],[6],[],[],[],[30,34],[],[],[],[],[17],[],[],[],[],[],[],[24],[],[26],[25]],
-    [[24],[24],[],[],[],[],[],[],[],[],[],[],[],[],[],[],[],[],[],[],[],[],[],[30,2],[],[],[],[17],[],[],[],[37],[],[5],[35],[],[],[]],
-    [[24],[],[],[],[],[],[6],[],[],[],[],[],[],[6],[],[],[],[],[],[29],[20],[30,34],[],[],[],[],[],[17],[],[],[],[],[],[],[24],[26],[26],[]],
-    [[],[],[],[],[],[],[],[],[],[],[],[],[],[],[],[20],[],[41],[],[30,1],[24],[],[],[],[30,34],[],[],[18],[],[37],[],[],[],[29],[28],[25],[],[]],
-    [[],[],[],[],[],[],[],[],[],[],[],[],[],[],[19],[27],[21],[41],[],[],[27],[25],[30,2],[],[],[],[],[17],[26],[39],[],[37.5],[],[25],[25],[],[38],[39]],
-    [[],[],[],[6],[],[],[],[],[],[],[],[41],[],[24],[23],[24],[24],[],[],[24],[20],[],[],[],[],[],[],[17],[29],[],[27],[24],[],[],[],[],[38],[39]],
-    [[],[],[],[],[],[],[24],[27],[],[],[],[41],[],[],[],[6],[],[],[],[30,34],[],[],[],[30,34],[],[],[],[16],[14],[14],[14],[12],[10],[10],[10],[10],[10],[10]],
-    [[],[],[],[],[],[24],[28],[],[6],[],[],[41],[33],[],[],[],[],[],[],[],[],[],[],[],[],[],[],[15],[13],[13],[13,44],[11],[9],[9],[9],[9],[9],[9]],
-    [[],[],[6],[],[],[],[25],[],[],[],[],[],[],[],[],[],[],[],[],[],[],[30,34],[],[24],[20],[27],[],[],[],[],[],[],[],[],[],[19],[26],[21]],
-    [[],[],[],[],[],[],[43],[],[],[],[],[],[],[],[],[26],[24],[],[],[],[],[],[],[26],[24],[21],[29],[25],[19],[],[],[],[6],[],[],[27],[27],[24]],
-    [[],[],[],[],[],[],[],[],[],[],[],[],[],[],[],[27],[20],[],[6],[],[30,1],[],[24],[26],[],[33],[],[],[30,2],[],[],[],[],[26],[28],[],[24],[]],
-    [[24],[27],[28],[],[28],[],[],[6],[],[],[],[6],[],[],[30,1],[4],[],[],[],[],[],[],[],[],[],[],[],[],[],[],[],[],[],[],[33],[],[],[20]],
-    [[],[26],[29],[24],[],[],[],[],[],[],[],[],[],[],[],[],[],[],[],[],[26],[27],[],[],[],[],[],[],[],[],[],[],[],[],[],[],[],[]],
-    [[],[],[],[24],[6],[],[],[25],[27],[30,1],[],[41],[],[],[],[],[],[],[],[23],[29],[],[6],[],[],[],[],[],[],[6],[],[],[],[],[],[],[26],[25]],
-    [[],[],[],[],[24],[],[],[],[26],[26],[],[41],[],[],[],[6],[],[],[],[24],[24],[20],[],[],[40],[40],[40],[42],[],[],[],[],[],[],[],[27],[27],[]],
-    [[],[],[38],[7],[],[],[],[29],[],[],[],[41],[33],[],[],[],[],[],[],[],[],[],[],[],[],[],[],[],[],[],[],[],[],[],[],[24],[20],[]],
-    [[],[37],[],[],[],[],[],[],[6],[],[],[41],[],[],[],[],[],[],[],[6],[],[],[40],[40],[],[],[],[24],[22],[24],[],[],[6],[],[30,2],[],[],[23]],
-    [[],[39],[],[],[],[],[],[],[],[],[],[],[],[],[],[],[],[],[],[],[],[],[],[],[6],[],[],[],[24],[21],[27],[],[],[],[30,2],[],[19],[24]],
-    [[],[],[],[25],[29],[],[],[],[],[],[],[],[25],[24],[],[6],[],[],[],[],[],[],[],[],[],[],[],[],[6],[],[],[],[],[],[33],[],[],[]],
-    [[],[],[24],[26],[6],[],[],[43],[],[],[26],[33],[],[],[],[],[],[],[42],[],[],[],[],[33],[],[],[],[],[],[],[],[],[],[],[],[],[],[]],
-    [[],[27],[27],[],[],[],[],[],[],[],[],[24],[],[],[],[],[],[],[],[],[],[],[],[],[],[],[],[],[],[],[],[],[],[],[],[],[],[]],
-    [[],[],[],[],[27],[],[29],[],[],[],[],[],[],[28],[],[],[],[],[],[],[],[],[],[],[],[],[],[],[],[],[],[],[],[],[],[],[30,1],[]],
-    [[],[],[],[],[26],[24],[],[],[25],[28],[24],[],[],[],[],[],[],[],[],[],[],[],[],[],[],[],[],[],[],[],[],[],[],[],[],[],[],[]],
-]
\ No newline at end of file
+MAP_FILE = "data/maps/default.json" # kafelki, dekoracje, droga przeciwników i miejsca na wieże
+MAP_CHUNK_SIZE = 256 # bok kawałka mapy renderowanego i trzymanego w pamięci (px)
+MAP_CHUNK_CACHE = 64 # maksymalna liczba wyrenderowanych kawałków mapy w pamięci
+CAMERA_SCROLL_SPEED = 600 # prędkość przewijania mapy strzałkami/WASD (px/s)
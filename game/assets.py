@@ -1,123 +1,318 @@
 #game/assets.py
 
-import pygame, os
+import pygame, os, math
+from config import SOUND_VOICE_LIMITS, SOUND_MAX_VOICES, SOUND_MAX_GAIN
+
+
+class AssetRegistry:
+    """Współdzielony rejestr grafik - każdy arkusz jest wczytywany, konwertowany,
+    cięty i skalowany tylko raz, a obiekty gry trzymają jedynie referencje.
+
+    W trybie headless nie są czytane żadne pliki graficzne, a animacje składają
+    się z pustych klatek (None) - zachowana jest tylko ich liczba."""
+    def __init__(self):
+        self.entries = {}
+        self.decoded = {} # pliki zdekodowane wcześniej przez AssetLoader, klucz: ścieżka
+        self.bundle = None # paczka surowych pikseli (game.bundle), gdy jest używana
+        self.headless = False
+        self.hits = 0
+        self.misses = 0
+        self.disk_loads = 0
+        self.bundle_loads = 0
+
+    def get(self, key, loader):
+        """Zwraca zasób o podanym kluczu, tworząc go funkcją loader przy pierwszym użyciu."""
+        if key in self.entries:
+            self.hits += 1
+            return self.entries[key]
+
+        self.misses += 1
+        value = loader()
+        self.entries[key] = value
+        return value
+
+    def read_image(self, path, alpha=True, colorkey=None):
+        """Wczytuje obraz z dysku (jedyne miejsce, w którym rejestr dotyka plików).
+
+        Obraz zdekodowany już w tle przez AssetLoader albo obecny w paczce
+        grafik jest tylko konwertowany."""
+        image = self.decoded.pop(path, None)
+        if image is None and self.bundle is not None:
+            image = self.bundle.image(path)
+            if image is not None:
+                self.bundle_loads += 1
+        if image is None:
+            self.disk_loads += 1
+            image = pygame.image.load(path)
+        if alpha:
+            return image.convert_alpha()
+        image = image.convert()
+        if colorkey is not None:
+            image.set_colorkey(colorkey)
+        return image
+
+    def resident_bytes(self):
+        """Zwraca liczbę bajtów pikseli trzymanych w rejestrze (bez podwójnego liczenia podpowierzchni)."""
+        seen = set()
+        return sum(surface_bytes(value, seen) for value in self.entries.values())
+
+    def stats(self):
+        """Zwraca statystyki rejestru."""
+        return {
+            "entries": len(self.entries),
+            "hits": self.hits,
+            "misses": self.misses,
+            "disk_loads": self.disk_loads,
+            "bundle_loads": self.bundle_loads,
+            "resident_bytes": self.resident_bytes(),
+        }
+
+    def reset_stats(self):
+        """Zeruje liczniki trafień, chybień i odczytów z dysku."""
+        self.hits = 0
+        self.misses = 0
+        self.disk_loads = 0
+        self.bundle_loads = 0
+
+    def clear(self):
+        """Usuwa wszystkie zasoby z rejestru."""
+        self.entries.clear()
+        self.decoded.clear()
+
+    def set_headless(self, enabled=True):
+        """Włącza lub wyłącza tryb bez grafik (nie wymaga ekranu)."""
+        if enabled != self.headless:
+            self.headless = enabled
+            self.clear()
+
+
+def surface_bytes(value, seen):
+    """Liczy bajty pikseli powierzchni w (zagnieżdżonej) strukturze zasobów."""
+    if isinstance(value, pygame.Surface):
+        root = value
+        while root.get_parent() is not None:
+            root = root.get_parent()
+        if id(root) in seen:
+            return 0
+        seen.add(id(root))
+        return root.get_width() * root.get_height() * root.get_bytesize()
+    if isinstance(value, dict):
+        return sum(surface_bytes(item, seen) for item in value.values())
+    if isinstance(value, (list, tuple)):
+        return sum(surface_bytes(item, seen) for item in value)
+    return 0
+
+
+# Globalny rejestr grafik współdzielony przez całą grę
+ASSETS = AssetRegistry()
+
+
+def load_image(path, alpha=True, colorkey=None):
+    """Zwraca obraz z rejestru, wczytując go z dysku tylko za pierwszym razem."""
+    if ASSETS.headless:
+        return None
+    return ASSETS.get(("image", path, alpha, colorkey),
+                      lambda: ASSETS.read_image(path, alpha, colorkey))
+
+
+def load_scaled_image(path, size, smooth=False):
+    """Zwraca przeskalowany obraz z rejestru."""
+    if ASSETS.headless:
+        return None
+    def build():
+        scale = pygame.transform.smoothscale if smooth else pygame.transform.scale
+        return scale(load_image(path), size)
+    return ASSETS.get(("scaled", path, size, smooth), build)
+
 
 def load_animation_frames(path, frame_width, frame_height, frame_count):
         """Ładuje klatki animacji z podanego pliku."""
-        sheet = pygame.image.load(path).convert_alpha()
-        return [sheet.subsurface(pygame.Rect(i * frame_width, 0, frame_width, frame_height)) for i in range(frame_count)]
+        if ASSETS.headless:
+            return [None] * frame_count
+        def build():
+            sheet = load_image(path)
+            return [sheet.subsurface(pygame.Rect(i * frame_width, 0, frame_width, frame_height)) for i in range(frame_count)]
+        return ASSETS.get(("frames", path, frame_width, frame_height, frame_count), build)
+
+
+def load_strip_frames(path, frame_count):
+    """Dzieli poziomy arkusz na frame_count równych klatek o pełnej wysokości."""
+    if ASSETS.headless:
+        return [None] * frame_count
+    def build():
+        sheet = load_image(path)
+        frame_width = sheet.get_width() // frame_count
+        return [sheet.subsurface((i * frame_width, 0, frame_width, sheet.get_height()))
+                for i in range(frame_count)]
+    return ASSETS.get(("strip", path, frame_count), build)
+
+
+def mirror_frames(frames):
+    """Zwraca klatki odbite w poziomie (np. animacja w prawo z animacji w lewo)."""
+    return [pygame.transform.flip(frame, True, False) if frame is not None else None
+            for frame in frames]
 
 
 def load_assets():
     """Ładuje grafiki mapy"""
+    return ASSETS.get(("map",), build_map_assets)
 
-    # Grafiki dla kafelków mapy
-    TILE_IMAGES = \
-    {
-    0: pygame.image.load("images/tiles/FieldsTile_38.png").convert_alpha(), #plain
-    1: pygame.image.load("images/tiles/FieldsTile_01.png").convert_alpha(), #plain_path
-    2: pygame.image.load("images/tiles/FieldsTile_10.png").convert_alpha(), #left_up_cor
-    3: pygame.image.load("images/tiles/FieldsTile_12.png").convert_alpha(), #right_up_cor
-    4: pygame.image.load("images/tiles/FieldsTile_22.png").convert_alpha(), #left_down_cor
-    5: pygame.image.load("images/tiles/FieldsTile_28.png").convert_alpha(), #right_down_cor
-    6: pygame.image.load("images/tiles/FieldsTile_47.png").convert_alpha(), #gr_covered (*)
-    7: pygame.image.load("images/tiles/FieldsTile_55.png").convert_alpha(), #grass_up
-    8: pygame.image.load("images/tiles/FieldsTile_24.png").convert_alpha(), #grass_down
-    9: pygame.image.load("images/tiles/FieldsTile_50.png").convert_alpha(), #grass_left
-    10: pygame.image.load("images/tiles/FieldsTile_53.png").convert_alpha(), #gr_right
-    11: pygame.image.load("images/tiles/FieldsTile_44.png").convert_alpha(), #gr_all_but_top
-    12: pygame.image.load("images/tiles/FieldsTile_43.png").convert_alpha(), #gr_all_but_bottom
-    13: pygame.image.load("images/tiles/FieldsTile_26.png").convert_alpha(), #gr_left_bottom
-    14: pygame.image.load("images/tiles/FieldsTile_06.png").convert_alpha(), #gr_left_up
-    15: pygame.image.load("images/tiles/FieldsTile_40.png").convert_alpha(), #gr_left_right_1
-    16: pygame.image.load("images/tiles/FieldsTile_32.png").convert_alpha(), #gr_left_right_2
-    17: pygame.image.load("images/tiles/FieldsTile_48.png").convert_alpha(), #gr_left_right_3
-    18: pygame.image.load("images/tiles/FieldsTile_30.png").convert_alpha(), #gr_down_up_1
-    19: pygame.image.load("images/tiles/FieldsTile_31.png").convert_alpha(), #gr_down_up_2
-    20: pygame.image.load("images/tiles/FieldsTile_39.png").convert_alpha(), #gr_down_up_3
-    }
-
-    # Grafiki dekoracji
-    DECOR_IMAGES = \
-    {
-    1: pygame.image.load("images/decor/bush/4.png").convert_alpha(),
-    2: pygame.image.load("images/decor/stones/11.png").convert_alpha(),
-    3: pygame.image.load("images/decor/stones/5.png").convert_alpha(),
-    4: pygame.image.load("images/decor/grass/3.png").convert_alpha(),
-    5: load_animation_frames("images/decor/campfire/2.png", 32, 32, 6), #szer, wys, frames
-    6: pygame.image.load("images/decor/PlaceForTower2.png").convert_alpha(), #tower_placement
-    7: load_animation_frames("images/decor/campfire/1.png", 32, 64, 6),
-    # 8: pygame.image.load("images/decor//.png").convert_alpha(),               # FREE SLOT
-    9: pygame.image.load("images/decor/fences/Tile2_11.png").convert_alpha(), #fen_right_down
-    10: pygame.image.load("images/decor/fences/Tile2_03.png").convert_alpha(), #fen_right_up
-    11: pygame.image.load("images/decor/fences/Tile2_13.png").convert_alpha(), #fen_mid_down
-    12: pygame.image.load("images/decor/fences/Tile2_05.png").convert_alpha(), #fen_mid_up
-    13: pygame.image.load("images/decor/fences/Tile2_12.png").convert_alpha(), #fen_left_down
-    14: pygame.image.load("images/decor/fences/Tile2_04.png").convert_alpha(), #fen_left_up
-    15: pygame.image.load("images/decor/fences/Tile2_41.png").convert_alpha(), #fen_left_cor_down
-    16: pygame.image.load("images/decor/fences/Tile2_33.png").convert_alpha(), #fen_left_cor_up
-    17: pygame.image.load("images/decor/fences/Tile2_25.png").convert_alpha(), #fen_left_left_1
-    18: pygame.image.load("images/decor/fences/Tile2_17.png").convert_alpha(), #fen_left_left_2
+
+# Pliki kafelków mapy
+TILE_FILES = \
+{
+    0: "images/tiles/FieldsTile_38.png", #plain
+    1: "images/tiles/FieldsTile_01.png", #plain_path
+    2: "images/tiles/FieldsTile_10.png", #left_up_cor
+    3: "images/tiles/FieldsTile_12.png", #right_up_cor
+    4: "images/tiles/FieldsTile_22.png", #left_down_cor
+    5: "images/tiles/FieldsTile_28.png", #right_down_cor
+    6: "images/tiles/FieldsTile_47.png", #gr_covered (*)
+    7: "images/tiles/FieldsTile_55.png", #grass_up
+    8: "images/tiles/FieldsTile_24.png", #grass_down
+    9: "images/tiles/FieldsTile_50.png", #grass_left
+    10: "images/tiles/FieldsTile_53.png", #gr_right
+    11: "images/tiles/FieldsTile_44.png", #gr_all_but_top
+    12: "images/tiles/FieldsTile_43.png", #gr_all_but_bottom
+    13: "images/tiles/FieldsTile_26.png", #gr_left_bottom
+    14: "images/tiles/FieldsTile_06.png", #gr_left_up
+    15: "images/tiles/FieldsTile_40.png", #gr_left_right_1
+    16: "images/tiles/FieldsTile_32.png", #gr_left_right_2
+    17: "images/tiles/FieldsTile_48.png", #gr_left_right_3
+    18: "images/tiles/FieldsTile_30.png", #gr_down_up_1
+    19: "images/tiles/FieldsTile_31.png", #gr_down_up_2
+    20: "images/tiles/FieldsTile_39.png", #gr_down_up_3
+}
+
+
+# Pliki dekoracji: ścieżka obrazu, ("frames", ścieżka, szer, wys, klatki) dla animacji
+# albo ("mirror", ścieżka) dla obrazu odbitego w poziomie
+DECOR_FILES = \
+{
+    1: "images/decor/bush/4.png",
+    2: "images/decor/stones/11.png",
+    3: "images/decor/stones/5.png",
+    4: "images/decor/grass/3.png",
+    5: ("frames", "images/decor/campfire/2.png", 32, 32, 6), #szer, wys, frames
+    6: "images/decor/PlaceForTower2.png", #tower_placement
+    7: ("frames", "images/decor/campfire/1.png", 32, 64, 6),
+    # 8: "images/decor//.png",               # FREE SLOT
+    9: "images/decor/fences/Tile2_11.png", #fen_right_down
+    10: "images/decor/fences/Tile2_03.png", #fen_right_up
+    11: "images/decor/fences/Tile2_13.png", #fen_mid_down
+    12: "images/decor/fences/Tile2_05.png", #fen_mid_up
+    13: "images/decor/fences/Tile2_12.png", #fen_left_down
+    14: "images/decor/fences/Tile2_04.png", #fen_left_up
+    15: "images/decor/fences/Tile2_41.png", #fen_left_cor_down
+    16: "images/decor/fences/Tile2_33.png", #fen_left_cor_up
+    17: "images/decor/fences/Tile2_25.png", #fen_left_left_1
+    18: "images/decor/fences/Tile2_17.png", #fen_left_left_2
 
     #flowers
-    19: pygame.image.load("images/decor/flowers/7.png").convert_alpha(),
-    20: pygame.image.load("images/decor/flowers/8.png").convert_alpha(),
-    21: pygame.image.load("images/decor/flowers/9.png").convert_alpha(),
-    22: pygame.image.load("images/decor/flowers/10.png").convert_alpha(),
-    23: pygame.image.load("images/decor/flowers/11.png").convert_alpha(),
+    19: "images/decor/flowers/7.png",
+    20: "images/decor/flowers/8.png",
+    21: "images/decor/flowers/9.png",
+    22: "images/decor/flowers/10.png",
+    23: "images/decor/flowers/11.png",
 
     #grass
-    24: pygame.image.load("images/decor/grass/1.png").convert_alpha(),
-    25: pygame.image.load("images/decor/grass/2.png").convert_alpha(),
-    26: pygame.image.load("images/decor/grass/3.png").convert_alpha(),
-    27: pygame.image.load("images/decor/grass/4.png").convert_alpha(),
-    28: pygame.image.load("images/decor/grass/5.png").convert_alpha(),
-    29: pygame.image.load("images/decor/grass/6.png").convert_alpha(),
+    24: "images/decor/grass/1.png",
+    25: "images/decor/grass/2.png",
+    26: "images/decor/grass/3.png",
+    27: "images/decor/grass/4.png",
+    28: "images/decor/grass/5.png",
+    29: "images/decor/grass/6.png",
 
     #shadows
-    30: pygame.image.load("images/decor/shadows/4.png").convert_alpha(), #mid_low
-    31: pygame.image.load("images/decor/shadows/6.png").convert_alpha(), #big
-    32: pygame.image.load("images/decor/shadows/5.png").convert_alpha(), #mid_high
+    30: "images/decor/shadows/4.png", #mid_low
+    31: "images/decor/shadows/6.png", #big
+    32: "images/decor/shadows/5.png", #mid_high
 
     #tree
-    33: pygame.image.load("images/decor/tree/tree_1.png").convert_alpha(), #normal
-    34: pygame.image.load("images/decor/tree/tree_2.png").convert_alpha(), #cut(trunk)
+    33: "images/decor/tree/tree_1.png", #normal
+    34: "images/decor/tree/tree_2.png", #cut(trunk)
 
     #tents
-    35: pygame.image.load("images/decor/tents/1.png").convert_alpha(), # right
-    36: pygame.image.load("images/decor/tents/2.png").convert_alpha(), # top
-    37: pygame.transform.flip(pygame.image.load("images/decor/tents/1.png").convert_alpha(), True, False), #left
-    37.5 : pygame.image.load("images/decor/tents/6.png").convert_alpha(), 
-    
-    38: pygame.image.load("images/decor/boxes/1.png").convert_alpha(), #barrel
-    39: pygame.image.load("images/decor/boxes/3.png").convert_alpha(), # box
+    35: "images/decor/tents/1.png", # right
+    36: "images/decor/tents/2.png", # top
+    37: ("mirror", "images/decor/tents/1.png"), #left
+    37.5 : "images/decor/tents/6.png", 
+
+    38: "images/decor/boxes/1.png", #barrel
+    39: "images/decor/boxes/3.png", # box
 
     #fences
-    40: pygame.image.load("images/decor/fences2/1.png").convert_alpha(), #horizontally
-    41: pygame.image.load("images/decor/fences2/7.png").convert_alpha(), #vertically
-    42: pygame.image.load("images/decor/fences2/pointers/3.png").convert_alpha(), # point_top_left
-    43: pygame.image.load("images/decor/fences2/pointers/4.png").convert_alpha(), # point_right
+    40: "images/decor/fences2/1.png", #horizontally
+    41: "images/decor/fences2/7.png", #vertically
+    42: "images/decor/fences2/pointers/3.png", # point_top_left
+    43: "images/decor/fences2/pointers/4.png", # point_right
+
+    44: ("frames", "images/decor/flag/2.png", 32, 64, 6),
+}
 
-    44: load_animation_frames("images/decor/flag/2.png", 32, 64, 6),
-    }
 
-    return TILE_IMAGES, DECOR_IMAGES
+def decor_path(spec):
+    """Zwraca ścieżkę pliku dekoracji z jej opisu w DECOR_FILES."""
+    return spec if isinstance(spec, str) else spec[1]
+
+
+def map_asset_paths():
+    """Zwraca ścieżki wszystkich plików grafik mapy."""
+    return list(TILE_FILES.values()) + [decor_path(spec) for spec in DECOR_FILES.values()]
+
+
+def load_decor(spec):
+    """Wczytuje dekorację opisaną w DECOR_FILES."""
+    if isinstance(spec, str):
+        return load_image(spec)
+    kind, path, *args = spec
+    if kind == "frames":
+        return load_animation_frames(path, *args)
+    return pygame.transform.flip(load_image(path), True, False)
+
+
+def build_map_assets():
+    """Buduje słowniki grafik kafelków i dekoracji mapy."""
+    tile_images = {key: load_image(path) for key, path in TILE_FILES.items()}
+    decor_images = {key: load_decor(spec) for key, spec in DECOR_FILES.items()}
+    return tile_images, decor_images
 
 # pygame.transform.flip(frame, True, False)
-pygame.mixer.init()
+
+class SilentSound:
+    """Zastępczy dźwięk używany, gdy mikser nie został uruchomiony (np. w symulacji bez dźwięku)."""
+    def play(self, *args, **kwargs):
+        """Nic nie odtwarza."""
+        return None
+
+    def set_volume(self, volume):
+        """Ignoruje zmianę głośności."""
+        pass
+
+    def get_num_channels(self):
+        """Zwraca liczbę kanałów, na których gra dźwięk (zawsze 0)."""
+        return 0
+
 
 def load_sound(name):
-    """Ładuje dźwięk z pliku."""
+    """Ładuje dźwięk z pliku (lub zwraca zdekodowany już w tle przez AssetLoader)."""
+    sound = ASSETS.decoded.pop(name, None)
+    if sound is not None:
+        return sound
     return pygame.mixer.Sound(os.path.join(name))
 
-# Dźwięki używane w grze
-SOUNDS = {
-    "arrow": load_sound("sounds/arrow_fired.mp3"),
-    "enemy_death": load_sound("sounds/enemy_dead.mp3"),
-    "wave_start": load_sound("sounds/wave_start.mp3"),
-    "wave_cleared": load_sound("sounds/wave_cleared.mp3")
+# Pliki dźwięków używanych w grze
+SOUND_FILES = \
+{
+    "arrow": "sounds/arrow_fired.mp3",
+    "enemy_death": "sounds/enemy_dead.mp3",
+    "wave_start": "sounds/wave_start.mp3",
+    "wave_cleared": "sounds/wave_cleared.mp3"
 }
 
+# Dźwięki używane w grze (wyciszone do czasu wywołania load_sounds)
+SOUNDS = {key: SilentSound() for key in SOUND_FILES}
+
 # Domyślne wartości głośności
 VOLUMES = \
 {
@@ -127,16 +322,122 @@ VOLUMES = \
      "wave_cleared": 0.2
 }
 
-# Ustawianie początkowych głośności
-for key, sound in SOUNDS.items():
-    sound.set_volume(VOLUMES[key])
+def sound_volume(key):
+    """Zwraca głośność ustawianą dźwiękowi (z zapasem na wzmocnienie scalonych odtworzeń).
+
+    Właściwą głośność pojedynczego odtworzenia ustawia SoundDispatcher na kanale."""
+    return min(1.0, VOLUMES[key] * SOUND_MAX_GAIN)
+
+
+class SoundDispatcher:
+    """Odtwarzanie dźwięków efektów zbierane w ciągu klatki.
+
+    play() tylko zlicza żądania, a flush() raz na klatkę odtwarza każdy dźwięk
+    najwyżej raz - kilka strzałów w tej samej klatce daje jeden głośniejszy
+    dźwięk zamiast kilku kanałów. Obowiązują limity jednocześnie grających kopii
+    dźwięku (SOUND_VOICE_LIMITS) i wszystkich efektów (SOUND_MAX_VOICES), a przy
+    wyciszeniu mikser nie jest w ogóle wywoływany."""
+    def __init__(self, limits = SOUND_VOICE_LIMITS, max_voices = SOUND_MAX_VOICES,
+                 max_gain = SOUND_MAX_GAIN):
+        self.limits = limits
+        self.max_voices = max_voices
+        self.max_gain = max_gain
+        self.order = list(limits) + [key for key in SOUND_FILES if key not in limits] # priorytet
+        self.pending = {}
+        self.muted = False
+        self.requested = 0 # żądania odtworzenia
+        self.played = 0    # faktycznie odtworzone dźwięki
+        self.merged = 0    # żądania scalone z innym odtworzeniem w tej samej klatce
+        self.dropped = 0   # żądania pominięte z powodu limitu kanałów lub wyciszenia
+
+    def play(self, key, count = 1):
+        """Zgłasza odtworzenie dźwięku w bieżącej klatce."""
+        self.requested += count
+        if self.muted:
+            self.dropped += count
+            return
+        self.pending[key] = self.pending.get(key, 0) + count
+
+    def flush(self):
+        """Odtwarza dźwięki zgłoszone w klatce (wywoływane raz na klatkę)."""
+        if not self.pending:
+            return
+        pending = self.pending
+        self.pending = {}
+
+        voices = sum(sound.get_num_channels() for sound in SOUNDS.values())
+        for key in self.order:
+            count = pending.get(key)
+            if not count:
+                continue
+            sound = SOUNDS[key]
+            if voices >= self.max_voices or sound.get_num_channels() >= self.limits.get(key, 1):
+                self.dropped += count
+                continue
+
+            channel = sound.play()
+            if channel is None: # brak wolnego kanału albo mikser wyłączony
+                self.dropped += count
+                continue
+            # Głośność rośnie jak przy sumie nieskorelowanych źródeł (pierwiastek z liczby)
+            gain = min(self.max_gain, math.sqrt(count))
+            channel.set_volume(VOLUMES[key] * gain / sound_volume(key))
+            voices += 1
+            self.played += 1
+            self.merged += count - 1
+
+    def discard(self):
+        """Pomija zgłoszenia z klatki bez odtwarzania (symulacja bez dźwięku)."""
+        if self.pending:
+            self.dropped += sum(self.pending.values())
+            self.pending.clear()
+
+    def set_muted(self, muted):
+        """Włącza lub wyłącza wyciszenie (zgłoszenia są wtedy od razu pomijane)."""
+        self.muted = muted
+        if muted:
+            self.dropped += sum(self.pending.values())
+            self.pending.clear()
+
+    def stats(self):
+        """Zwraca liczniki odtwarzania dźwięków."""
+        return {"requested": self.requested, "played": self.played,
+                "merged": self.merged, "dropped": self.dropped}
+
+    def reset_stats(self):
+        """Zeruje liczniki."""
+        self.requested = self.played = self.merged = self.dropped = 0
+
+
+# Globalny dyspozytor dźwięków efektów
+AUDIO = SoundDispatcher()
+
+
+def play_sound(key, count = 1):
+    """Zgłasza odtworzenie dźwięku (odtwarzany przy najbliższym AUDIO.flush())."""
+    AUDIO.play(key, count)
+
+
+def load_sounds():
+    """Uruchamia mikser i wczytuje dźwięki gry."""
+    if not pygame.mixer.get_init():
+        pygame.mixer.init()
+
+    for key, path in SOUND_FILES.items():
+        SOUNDS[key] = load_sound(path)
+
+    # Ustawianie początkowych głośności
+    for key, sound in SOUNDS.items():
+        sound.set_volume(0 if AUDIO.muted else sound_volume(key))
 
 def mute_sounds():
     """Wycisza wszystkie dźwięki."""
+    AUDIO.set_muted(True)
     for sound in SOUNDS.values():
         sound.set_volume(0)
 
 def unmute_sounds():
     """Przywraca głośność dźwięków."""
+    AUDIO.set_muted(False)
     for key, sound in SOUNDS.items():
-        sound.set_volume(VOLUMES[key])
+        sound.set_volume(sound_volume(key))
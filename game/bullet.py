@@ -1,5 +1,9 @@
 # game/bullet.py
 import pygame, math, os
+from config import ARROW_ROTATION_STEPS
+from game.assets import ASSETS, load_image, surface_bytes
+
+MAX_BULLET_DISTANCE = 200 # maksymalny dystans lotu pocisku w pikselach
 
 # Słownik animacji strzał
 ARROW_ANIMATIONS = \
@@ -9,17 +13,35 @@ ARROW_ANIMATIONS = \
     "speed": [],
 }
 
-def load_arrow_animations(path="images/effects/arrows/arrows.png", scale_size=(40, 40)):
-        """Ładuje animacje strzał z pliku"""
+# Obrócone klatki strzał: rodzaj -> [klatka][krok kąta]
+ARROW_ROTATIONS = {}
+
+def load_arrow_animations(path="images/effects/arrows/arrows.png", scale_size=(40, 40),
+                          rotation_steps=ARROW_ROTATION_STEPS):
+        """Ładuje animacje strzał z pliku wraz z tablicą obróconych klatek"""
         global ARROW_ANIMATIONS
 
         if not os.path.exists(path):
             print("Brak pliku ze strzałami:", path)
             return ARROW_ANIMATIONS
 
+        ARROW_ANIMATIONS.update(ASSETS.get(("arrows", path, scale_size),
+                                           lambda: build_arrow_animations(path, scale_size)))
+
+        ARROW_ROTATIONS.clear()
+        if rotation_steps:
+            ARROW_ROTATIONS.update(ASSETS.get(("arrow_rotations", path, scale_size, rotation_steps),
+                                              lambda: build_arrow_rotations(ARROW_ANIMATIONS, rotation_steps)))
+
+        return ARROW_ANIMATIONS
+
+
+def build_arrow_animations(path, scale_size):
+        """Wycina i skaluje klatki strzał z arkusza"""
+        animations = {}
+
         # Wczytanie pliku
-        image = pygame.image.load(path).convert()
-        image.set_colorkey((255,255,255))
+        image = load_image(path, alpha=False, colorkey=(255,255,255))
 
         # Parametry pliku
         frame_cols = 3
@@ -36,38 +58,103 @@ def load_arrow_animations(path="images/effects/arrows/arrows.png", scale_size=(4
                 frames.append(frame)
 
             if row == 0:
-                ARROW_ANIMATIONS["default"] = frames
+                animations["default"] = frames
             elif row == 1:
-                ARROW_ANIMATIONS["ice"] = frames
+                animations["ice"] = frames
             elif row == 2:
-                ARROW_ANIMATIONS["speed"] = frames
+                animations["speed"] = frames
 
-        return ARROW_ANIMATIONS
+        return animations
+
+
+def build_arrow_rotations(animations, steps):
+        """Obraca każdą klatkę strzał o steps równych kątów (pełny obrót)"""
+        return {kind: [[pygame.transform.rotate(frame, step * 360 / steps) for step in range(steps)]
+                       for frame in frames]
+                for kind, frames in animations.items()}
+
+
+def rotation_step(angle, steps):
+        """Zamienia kąt w stopniach na najbliższy krok tablicy obrotów"""
+        return int(round(angle * steps / 360)) % steps
+
+
+def arrow_rotation_bytes():
+        """Zwraca liczbę bajtów pikseli zajmowanych przez tablicę obróconych strzał"""
+        return surface_bytes(ARROW_ROTATIONS, set())
+
+
+class BulletBase:
+    """Rysowanie pocisku, wspólne dla Bullet i widoków ProjectileView.
+
+    Nie przechowuje stanu - pola definiują klasy pochodne (sloty Bullet albo
+    tablice ProjectileSystem), więc widok nie dziedziczy nieużywanych slotów."""
+    __slots__ = ()
+
+    def draw(self, screen, offset = (0, 0)):
+        """Rysuje pocisk na ekranie (offset - pozycja kamery na mapie)."""
+        if self.anim:
+            frame_index = self.anim_index % len(self.anim)
+            angle = self.angle_to_target()
+            rotations = ARROW_ROTATIONS.get(self.anim_kind)
+            if rotations and len(rotations) == len(self.anim):
+                steps = rotations[frame_index]
+                rotated_frame = steps[rotation_step(angle, len(steps))]
+            else:
+                rotated_frame = pygame.transform.rotate(self.anim[frame_index], angle)
+            rect = rotated_frame.get_rect(center=(int(self.x) - offset[0], int(self.y) - offset[1]))
+            screen.blit(rotated_frame, rect)
+
+    def get_rect(self):
+        """Zwraca prostokąt obejmujący obróconą klatkę pocisku."""
+        if not self.anim:
+            return pygame.Rect(int(self.x), int(self.y), 0, 0)
+        width, height = self.anim[self.anim_index % len(self.anim)].get_size()
+        side = int(math.hypot(width, height)) + 2
+        return pygame.Rect(int(self.x) - side // 2, int(self.y) - side // 2, side, side)
+
+    def angle_to_target(self):
+        """Oblicza kąt do celu dla rotacji animacji."""
+        dx = self.target.x - self.x
+        dy = self.target.y - self.y
+        return math.degrees(math.atan2(-dy, dx))
 
 
-class Bullet:
+class Bullet(BulletBase):
     """Klasa bazowa reprezentująca pocisk (strzałe) w grze"""
+    __slots__ = ("x", "y", "target", "target_generation", "damage", "speed", "hit", "anim_kind", "anim",
+                 "anim_index", "anim_timer", "start_x", "start_y")
+
+    # Dane wspólne dla wszystkich pocisków
+    radius = 5
+    anim_speed = 0.15
+
     def __init__(self, x, y, target, damage=20, speed=300):
+        self.reset(x, y, target, damage, speed)
+
+    def reset(self, x, y, target, damage=20, speed=300):
+        """Ustawia pocisk od nowa (także przy ponownym użyciu obiektu z puli)."""
         self.x = x
         self.y = y
         self.target = target
+        # Pokolenie celu - przeciwnik wrócił do puli i został użyty ponownie, jeśli się zmieni
+        self.target_generation = target.generation if target is not None else None
         self.damage = damage
         self.speed = speed
-        self.radius = 5
         self.hit = False # czy pocisk trafił
 
         # Animacja pocisku
+        self.anim_kind = "default" # rodzaj strzały (klucz w ARROW_ANIMATIONS i ARROW_ROTATIONS)
         self.anim = ARROW_ANIMATIONS.get("default", [])
         self.anim_index = 0
         self.anim_timer = 0
-        self.anim_speed = 0.15
 
         self.start_x = x
         self.start_y = y
         
     def update(self, dt):
         """Aktualizuje stan pocisku."""
-        if not self.target or self.target.is_dead():
+        if not self.target or self.target.generation != self.target_generation or self.target.is_dead():
             self.hit = True
             return
 
@@ -88,25 +175,10 @@ class Bullet:
 
         self.update_animation(dt)
 
-    def draw(self, screen):
-        """Rysuje pocisk na ekranie."""
-        if self.anim:
-            frame = self.anim[self.anim_index % len(self.anim)]
-            angle = self.angle_to_target()
-            rotated_frame = pygame.transform.rotate(frame, angle)
-            rect = rotated_frame.get_rect(center=(int(self.x), int(self.y)))
-            screen.blit(rotated_frame, rect)
-
-    def angle_to_target(self):
-        """Oblicza kąt do celu dla rotacji animacji."""
-        dx = self.target.x - self.x
-        dy = self.target.y - self.y
-        return math.degrees(math.atan2(-dy, dx))
-    
     def over_max_distance(self):
         """Sprawdza czy pocisk przekroczył maksymalny dozwolony dystans."""
         traveled_distance = math.hypot(self.x - self.start_x, self.y - self.start_y)
-        return traveled_distance > 200  #max 200 pikseli
+        return traveled_distance > MAX_BULLET_DISTANCE
     
     def apply_hit_effect(self):
         """Efekt trafienia w cel."""
@@ -138,10 +210,17 @@ class Bullet:
 
 class IceBullet(Bullet):
     """Klasa pocisku lodowego (spowalnia cel)."""
+    __slots__ = ("slow_duration", "slow_factor")
+
     def __init__(self, x, y, target, damage = 40, slow_duration=2.0, slow_factor=0.5):
-        super().__init__(x, y, target, damage)
+        self.reset(x, y, target, damage, slow_duration, slow_factor)
+
+    def reset(self, x, y, target, damage = 40, slow_duration=2.0, slow_factor=0.5):
+        """Ustawia pocisk lodowy od nowa (także przy ponownym użyciu obiektu z puli)."""
+        super().reset(x, y, target, damage)
         self.slow_duration = slow_duration
         self.slow_factor = slow_factor
+        self.anim_kind = "ice"
         self.anim = ARROW_ANIMATIONS.get("ice", [])
 
 
@@ -150,3 +229,20 @@ class IceBullet(Bullet):
             self.target.hp -= self.damage
             self.target.apply_slow(self.slow_duration, self.slow_factor)
             self.hit = True
+
+
+if __name__ == "__main__":
+    # Raport pamięci tablicy obrotów dla różnych rozdzielczości, np.:
+    #   python -m game.bullet 32 64 128
+    import sys
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    pygame.display.init()
+    pygame.display.set_mode((1, 1))
+
+    base = None
+    for steps in [int(arg) for arg in sys.argv[1:]] or [ARROW_ROTATION_STEPS]:
+        load_arrow_animations(rotation_steps=steps)
+        if base is None:
+            base = surface_bytes(ARROW_ANIMATIONS, set())
+        size = arrow_rotation_bytes()
+        print(f"{steps:4d} kroków ({360 / steps:.2f}°): {size / 1024:.0f} KiB (klatki bazowe: {base / 1024:.0f} KiB)")
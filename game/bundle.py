@@ -0,0 +1,182 @@
+# game/bundle.py
+#
+# Paczka grafik: wszystkie pliki PNG z katalogu images zdekodowane raz do surowych
+# pikseli RGBA w jednym pliku, otwieranym przez mmap. Obrazy tworzone są z paczki
+# bez dekodowania PNG, a gra przy starcie otwiera dwa pliki zamiast kilkuset.
+# Piksele nie są skompresowane, więc paczka zajmuje na dysku wielokrotnie więcej
+# niż pliki PNG (dla obecnych grafik ok. 55 MiB zamiast 1,5 MiB).
+# Brakująca lub nieaktualna paczka (zmieniony stan któregoś pliku źródłowego)
+# budowana jest w tle przez loader i używana od następnego uruchomienia gry;
+# można ją też zbudować ręcznie:
+#   python -m game.bundle
+
+import pygame, os, io, json, mmap, time, hashlib
+
+from config import ASSET_BUNDLE_DIR
+
+BUNDLE_VERSION = 1
+INDEX_FILE = "index.json" # opis plików: skrót źródła, stan pliku, położenie i wymiary pikseli
+DATA_FILE = "images.rgba" # piksele RGBA wszystkich obrazów, jeden za drugim
+IMAGE_EXTENSIONS = (".png",)
+
+
+def bundle_key(path):
+    """Zwraca klucz pliku w paczce (ścieżka względna z ukośnikami)."""
+    return os.path.normpath(path).replace(os.sep, "/")
+
+
+def source_files(root = "images"):
+    """Zwraca klucze wszystkich plików graficznych w katalogu root."""
+    files = []
+    for folder, _, names in os.walk(root):
+        files += [bundle_key(os.path.join(folder, name)) for name in names
+                  if name.lower().endswith(IMAGE_EXTENSIONS)]
+    return sorted(files)
+
+
+def source_state(path):
+    """Zwraca stan pliku (czas modyfikacji, rozmiar) - sprawdzany bez otwierania pliku."""
+    stat = os.stat(path)
+    return [stat.st_mtime_ns, stat.st_size]
+
+
+class AssetBundle:
+    """Otwarta paczka grafik.
+
+    image(path) zwraca powierzchnię RGBA opartą bezpośrednio na pamięci pliku
+    (pygame.image.frombuffer), którą rejestr konwertuje do formatu ekranu tak jak
+    obraz wczytany z PNG."""
+    def __init__(self, directory, index):
+        self.directory = directory
+        self.entries = index["files"]
+        self.file = None
+        self.data = None
+        self.view = None
+        if index["size"]:
+            self.file = open(os.path.join(directory, DATA_FILE), "rb")
+            self.data = mmap.mmap(self.file.fileno(), 0, access=mmap.ACCESS_READ)
+            self.view = memoryview(self.data)
+
+    def __contains__(self, path):
+        return bundle_key(path) in self.entries
+
+    def image(self, path):
+        """Zwraca obraz z paczki (bez kopiowania pikseli) albo None, gdy go w niej nie ma."""
+        if path not in self:
+            return None
+        entry = self.entries[bundle_key(path)]
+        offset, width, height = entry["offset"], entry["width"], entry["height"]
+        return pygame.image.frombuffer(self.view[offset:offset + width * height * 4], (width, height), "RGBA")
+
+    def raw(self, key):
+        """Zwraca kopię surowych pikseli pliku z paczki."""
+        entry = self.entries[key]
+        return self.data[entry["offset"]:entry["offset"] + entry["width"] * entry["height"] * 4]
+
+    def close(self):
+        """Zamyka plik paczki (obrazy już skonwertowane przez rejestr pozostają ważne)."""
+        if self.view is not None:
+            self.view.release()
+            self.data.close()
+            self.file.close()
+        self.view = self.data = self.file = None
+
+
+def read_index(directory = ASSET_BUNDLE_DIR):
+    """Zwraca opis paczki albo None, gdy paczki nie ma lub ma inną wersję."""
+    try:
+        with open(os.path.join(directory, INDEX_FILE), encoding="utf-8") as f:
+            index = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if index.get("version") != BUNDLE_VERSION:
+        return None
+    return index
+
+
+def changed_files(index, root = "images"):
+    """Zwraca klucze plików, które zmieniły się od zbudowania paczki (także nowe i usunięte)."""
+    files = source_files(root)
+    changed = set(index["files"]) ^ set(files)
+    for key in files:
+        entry = index["files"].get(key)
+        if entry is not None and entry["state"] != source_state(key):
+            changed.add(key)
+    return changed
+
+
+def build_bundle(directory = ASSET_BUNDLE_DIR, root = "images", previous = None):
+    """Buduje paczkę z plików w katalogu root. Zwraca liczbę zdekodowanych plików PNG.
+
+    Piksele plików o niezmienionej treści (ten sam skrót) są przepisywane ze
+    starej paczki previous, więc przebudowa dekoduje tylko zmienione pliki."""
+    os.makedirs(directory, exist_ok=True)
+    index = {"version": BUNDLE_VERSION, "files": {}, "size": 0}
+    decoded = 0
+    data_path = os.path.join(directory, DATA_FILE)
+    with open(data_path + ".tmp", "wb") as out:
+        for key in source_files(root):
+            state = source_state(key)
+            old = previous.entries.get(key) if previous is not None else None
+            if old is not None and old["state"] == state:
+                digest = old["sha1"]
+                width, height, pixels = old["width"], old["height"], previous.raw(key)
+            else:
+                with open(key, "rb") as f:
+                    source = f.read()
+                digest = hashlib.sha1(source).hexdigest()
+                if old is not None and old["sha1"] == digest:
+                    width, height, pixels = old["width"], old["height"], previous.raw(key)
+                else:
+                    image = pygame.image.load(io.BytesIO(source), key)
+                    width, height = image.get_size()
+                    pixels = pygame.image.tobytes(image, "RGBA")
+                    decoded += 1
+            index["files"][key] = {"sha1": digest, "state": state, "offset": index["size"],
+                                   "width": width, "height": height}
+            out.write(pixels)
+            index["size"] += width * height * 4
+
+    if previous is not None:
+        previous.close() # przed podmianą pliku (Windows nie pozwala podmienić zmapowanego pliku)
+    os.replace(data_path + ".tmp", data_path)
+    index_path = os.path.join(directory, INDEX_FILE)
+    with open(index_path + ".tmp", "w", encoding="utf-8") as f:
+        json.dump(index, f)
+    os.replace(index_path + ".tmp", index_path)
+    return decoded
+
+
+def open_bundle(directory = ASSET_BUNDLE_DIR, root = "images"):
+    """Otwiera paczkę grafik, jeśli pliki źródłowe nie zmieniły się od jej zbudowania.
+
+    Sprawdzany jest tylko stan plików (os.stat), bez czytania ich treści.
+    Zwraca None, gdy paczki nie ma lub jest nieaktualna (trzeba ją odświeżyć)."""
+    index = read_index(directory)
+    if index is None or changed_files(index, root):
+        return None
+    return AssetBundle(directory, index)
+
+
+def refresh_bundle(directory = ASSET_BUNDLE_DIR, root = "images"):
+    """Buduje paczkę od nowa, dekodując tylko zmienione pliki. Zwraca liczbę zdekodowanych PNG.
+
+    Korzysta z własnej kopii starej paczki, więc może działać na wątku w tle,
+    o ile gra nie ma otwartej tej paczki (open_bundle zwrócił None)."""
+    index = read_index(directory)
+    previous = AssetBundle(directory, index) if index is not None else None
+    return build_bundle(directory, root, previous)
+
+
+def main():
+    """Buduje (lub odświeża) paczkę grafik i wypisuje jej rozmiar."""
+    start = time.perf_counter()
+    decoded = refresh_bundle()
+    index = read_index()
+    print(f"Paczka {ASSET_BUNDLE_DIR}: {len(index['files'])} plików, "
+          f"{index['size'] / 2**20:.1f} MiB pikseli, zdekodowano {decoded} PNG "
+          f"w {(time.perf_counter() - start) * 1000:.0f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+# game/camera.py
+
+import pygame
+
+from config import WIDTH, HEIGHT, CAMERA_SCROLL_SPEED
+from game.level import MAP_WIDTH, MAP_HEIGHT
+
+CULL_MARGIN = 96 # zapas (px) przy sprawdzaniu widoczności obiektu po jego pozycji
+
+# Klawisze przewijania: klawisz -> kierunek (dx, dy)
+SCROLL_KEYS = \
+{
+    pygame.K_LEFT: (-1, 0), pygame.K_a: (-1, 0),
+    pygame.K_RIGHT: (1, 0), pygame.K_d: (1, 0),
+    pygame.K_UP: (0, -1), pygame.K_w: (0, -1),
+    pygame.K_DOWN: (0, 1), pygame.K_s: (0, 1),
+}
+
+
+class Camera:
+    """Widok ekranu na mapę.
+
+    Przechowuje położenie lewego górnego rogu ekranu na mapie (ograniczone do
+    rozmiaru mapy) i przelicza współrzędne mapy na ekranowe i odwrotnie.
+    Na mapie nie większej niż ekran kamera stoi w (0, 0)."""
+    def __init__(self, map_size = (MAP_WIDTH, MAP_HEIGHT), screen_size = (WIDTH, HEIGHT),
+                 speed = CAMERA_SCROLL_SPEED):
+        self.map_width, self.map_height = map_size
+        self.view = pygame.Rect((0, 0), screen_size) # widoczny obszar mapy
+        self.x = self.y = 0.0 # dokładna pozycja widoku (przewijanie o ułamki piksela)
+        self.speed = speed
+        self.pressed = set() # wciśnięte klawisze przewijania
+        self.bounds = self.view.copy() # widok poszerzony o CULL_MARGIN
+        self.update_bounds()
+
+    @property
+    def offset(self):
+        """Przesunięcie rysowania (współrzędne mapy lewego górnego rogu ekranu)."""
+        return self.view.topleft
+
+    def move_to(self, x, y):
+        """Ustawia lewy górny róg widoku (z ograniczeniem do mapy). Zwraca True, jeśli widok się przesunął."""
+        self.x = max(0, min(x, self.map_width - self.view.width))
+        self.y = max(0, min(y, self.map_height - self.view.height))
+        if (int(self.x), int(self.y)) == self.view.topleft:
+            return False
+        self.view.topleft = (int(self.x), int(self.y))
+        self.update_bounds()
+        return True
+
+    def center_on(self, x, y):
+        """Ustawia widok tak, żeby punkt mapy (x, y) był na środku ekranu."""
+        return self.move_to(x - self.view.width // 2, y - self.view.height // 2)
+
+    def update_bounds(self):
+        """Aktualizuje obszar, w którym obiekty uznawane są za widoczne."""
+        self.bounds = self.view.inflate(CULL_MARGIN * 2, CULL_MARGIN * 2)
+
+    def handle_key(self, event):
+        """Zapamiętuje wciśnięcie/puszczenie klawisza przewijania. Zwraca True, jeśli to był taki klawisz."""
+        if event.key not in SCROLL_KEYS:
+            return False
+        if event.type == pygame.KEYDOWN:
+            self.pressed.add(event.key)
+        else:
+            self.pressed.discard(event.key)
+        return True
+
+    def update(self, dt):
+        """Przewija widok wciśniętymi klawiszami. Zwraca True, jeśli widok się przesunął."""
+        if not self.pressed:
+            return False
+        dx = sum(SCROLL_KEYS[key][0] for key in self.pressed)
+        dy = sum(SCROLL_KEYS[key][1] for key in self.pressed)
+        step = self.speed * dt
+        return self.move_to(self.x + dx * step, self.y + dy * step)
+
+    def to_world(self, pos):
+        """Zamienia pozycję na ekranie (np. kursora) na pozycję na mapie."""
+        return pos[0] + self.view.x, pos[1] + self.view.y
+
+    def to_screen(self, rect):
+        """Zamienia prostokąt na mapie na prostokąt na ekranie."""
+        return rect.move(-self.view.x, -self.view.y)
+
+    def sees(self, x, y, reach = 0):
+        """Sprawdza czy obiekt w punkcie mapy (x, y) może być widoczny na ekranie.
+
+        reach - dodatkowy zasięg rysowania obiektu (np. strefy ognia wokół wieży)."""
+        bounds = self.bounds
+        return bounds.left - reach <= x < bounds.right + reach and bounds.top - reach <= y < bounds.bottom + reach
@@ -0,0 +1,97 @@
+# game/content.py
+#
+# Dane rozgrywki (przeciwnicy, wieże, ulepszenia, fale, nagrody) wczytywane z jednego
+# pliku JSON (CONTENT_FILE) i kompilowane przy starcie do tablic indeksowanych numerem
+# typu. Pętle gry sięgają do nich bezpośrednio (ENEMY_DAMAGE[enemy.type_id]), bez
+# słowników i porównywania napisów. Wariant rozgrywki (np. do testów obciążenia)
+# to po prostu inny plik treści.
+
+import json
+
+from config import CONTENT_FILE
+
+
+def load_content(path = CONTENT_FILE):
+    """Wczytuje plik treści."""
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def type_ids(entries, kind):
+    """Zwraca słownik nazwa -> numer typu (kolejność wpisów w pliku)."""
+    ids = {}
+    for type_id, entry in enumerate(entries):
+        if entry["name"] in ids:
+            raise ValueError(f"{kind} '{entry['name']}' zdefiniowano w pliku treści dwukrotnie")
+        ids[entry["name"]] = type_id
+    return ids
+
+
+def compile_wave_weights(waves, enemy_ids):
+    """Zwraca progi wag typów przeciwników: [(od fali, [waga dla numeru typu])], od najwyższego progu."""
+    table = []
+    for entry in waves["weights"]:
+        unknown = set(entry) - {"from_wave"} - set(enemy_ids)
+        if unknown:
+            raise ValueError(f"nieznane typy przeciwników w wagach fali: {sorted(unknown)}")
+        table.append((entry["from_wave"], [entry.get(name, 0.0) for name in enemy_ids]))
+    return sorted(table, key=lambda item: -item[0])
+
+
+def upgrade_totals(upgrades):
+    """Zwraca łączny koszt ulepszeń zapłacony za wieżę na danym poziomie (indeks: poziom)."""
+    totals = [0, 0]
+    cost = upgrades["first_cost"]
+    for _ in range(upgrades["max_level"] - 1):
+        totals.append(totals[-1] + cost)
+        cost += upgrades["cost_step"]
+    totals.append(totals[-1] + cost + upgrades["evolution_extra_cost"]) # ewolucja
+    return totals
+
+
+CONTENT = load_content()
+
+# Poziomy trudności
+DIFFICULTY_HP = {name: entry["hp_multiplier"] for name, entry in CONTENT["difficulty"].items()}
+
+# Przeciwnicy (indeks: numer typu)
+ENEMIES = CONTENT["enemies"]
+ENEMY_IDS = type_ids(ENEMIES, "przeciwnik")
+ENEMY_NAMES = [entry["name"] for entry in ENEMIES]
+ENEMY_SPRITES = [entry.get("sprite", entry["name"]) for entry in ENEMIES] # katalog w images/enemies
+ENEMY_SPEED = [entry["speed"] for entry in ENEMIES]
+ENEMY_HP = [entry["hp"] for entry in ENEMIES]
+ENEMY_RADIUS = [entry["radius"] for entry in ENEMIES]
+ENEMY_DAMAGE = [entry["damage"] for entry in ENEMIES] # obrażenia zadawane graczowi na końcu drogi
+ENEMY_REWARDS = [(entry["gold"], entry["score"]) for entry in ENEMIES] # (złoto, punkty) za pokonanie
+
+# Wieże (indeks: numer typu)
+TOWERS = CONTENT["towers"]
+TOWER_IDS = type_ids(TOWERS, "wieża")
+TOWER_RANGE = [entry["range"] for entry in TOWERS]
+TOWER_DAMAGE = [entry["damage"] for entry in TOWERS]
+TOWER_RELOAD = [entry["reload_time"] for entry in TOWERS]
+TOWER_SLOW_DURATION = [entry.get("slow_duration", 0.0) for entry in TOWERS]
+TOWER_SLOW_FACTOR = [entry.get("slow_factor", 1.0) for entry in TOWERS]
+TOWER_BASE_COST = TOWERS[TOWER_IDS["Tower"]]["cost"] # koszt budowy wieży
+
+# Ulepszenia wież
+UPGRADES = CONTENT["upgrades"]
+MAX_UPGRADE_LEVEL = UPGRADES["max_level"]
+UPGRADE_FIRST_COST = UPGRADES["first_cost"]
+UPGRADE_COST_STEP = UPGRADES["cost_step"]
+UPGRADE_RANGE = UPGRADES["range"]
+UPGRADE_DAMAGE = UPGRADES["damage"]
+UPGRADE_RELOAD = UPGRADES["reload_time"]
+EVOLUTION_EXTRA_COST = UPGRADES["evolution_extra_cost"]
+EVOLUTION_LEVEL = MAX_UPGRADE_LEVEL + 1
+SELL_REFUND = UPGRADES["sell_refund"]
+UPGRADE_TOTALS = upgrade_totals(UPGRADES) # indeks: poziom wieży
+
+# Fale
+WAVES = CONTENT["waves"]
+WAVE_BASE_SIZE = WAVES["base_size"]
+WAVE_SIZE_STEP = WAVES["size_per_wave"]
+WAVE_SPAWN_DELAY = WAVES["spawn_delay"] # sekundy między kolejnymi przeciwnikami
+WAVE_DELAY = WAVES["wave_delay"]        # sekundy przerwy między falami
+WAVE_WEIGHTS = compile_wave_weights(WAVES, ENEMY_IDS)
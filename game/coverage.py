@@ -0,0 +1,93 @@
+# game/coverage.py
+
+import pygame
+from collections import OrderedDict
+
+from config import RANGE_ON_HOVER_ONLY, MAP_CHUNK_CACHE
+from game.assets import ASSETS
+
+RANGE_COLOR = (0, 100, 255, 40) # półprzezroczysty niebieski
+
+
+def range_circle(radius):
+    """Zwraca (tworząc raz) półprzezroczyste koło zasięgu o podanym promieniu."""
+    def build():
+        surface = pygame.Surface((radius * 2, radius * 2), pygame.SRCALPHA)
+        pygame.draw.circle(surface, RANGE_COLOR, (radius, radius), radius)
+        return surface
+    return ASSETS.get(("range", radius), build)
+
+
+class CoverageOverlay:
+    """Warstwa zasięgów wież złożona z mapą w gotowe tło.
+
+    Koła zasięgu nie są rysowane w każdej klatce - kawałki mapy z naniesionymi
+    zasięgami są składane ponownie tylko wtedy, gdy zmieni się zestaw wież lub
+    ich zasięg (budowa, ulepszenie, ewolucja, sprzedaż) albo wieża pod kursorem
+    w trybie hover_only, i tylko tam, gdzie zmieniło się koło zasięgu."""
+    def __init__(self, map_builder, hover_only = RANGE_ON_HOVER_ONLY, cache_size = MAP_CHUNK_CACHE):
+        self.map_builder = map_builder
+        self.hover_only = hover_only
+        self.cache_size = cache_size
+        self.chunks = OrderedDict() # (cx, cy) -> kawałek mapy z naniesionymi zasięgami (LRU)
+        self.generation = None # rozmieszczenie mapy, z którego zbudowano kawałki
+        self.circles = []      # (grafika koła, prostokąt na mapie)
+        self.rects = []        # obszary mapy zajmowane przez koła zasięgu
+
+    def is_outdated(self):
+        """Sprawdza czy tło trzeba złożyć ponownie (np. po przebudowie mapy)."""
+        return self.generation != self.map_builder.generation
+
+    def rebuild(self, towers, hovered = None):
+        """Nanosi zasięgi wież na kawałki mapy (składane ponownie przy następnym rysowaniu).
+
+        Zwraca prostokąty mapy, które zmieniły wygląd (stare i nowe koła)."""
+        if self.hover_only:
+            shown = [hovered] if hovered is not None else []
+        else:
+            shown = towers
+
+        circles = []
+        for tower in shown:
+            circle = range_circle(tower.range)
+            # int() jak przy blit (get_rect zaokrągla ułamkową pozycję)
+            topleft = (int(tower.x - tower.range), int(tower.y - tower.range))
+            circles.append((circle, pygame.Rect(topleft, circle.get_size())))
+        rects = [rect for _, rect in circles]
+
+        changed = self.rects + rects
+        if self.is_outdated():
+            self.chunks.clear()
+            self.generation = self.map_builder.generation
+        else:
+            for rect in changed:
+                for key in self.map_builder.chunk_keys(rect):
+                    self.chunks.pop(key, None)
+        self.circles = circles
+        self.rects = rects
+        return changed
+
+    def get_chunk(self, cx, cy):
+        """Zwraca kawałek mapy z naniesionymi zasięgami wież."""
+        key = (cx, cy)
+        chunk = self.chunks.get(key)
+        if chunk is not None:
+            self.chunks.move_to_end(key)
+            return chunk
+
+        chunk = self.map_builder.get_chunk(cx, cy)
+        area = self.map_builder.chunk_rect(cx, cy)
+        circles = [(circle, rect) for circle, rect in self.circles if rect.colliderect(area)]
+        if circles:
+            chunk = chunk.copy()
+            for circle, rect in circles:
+                chunk.blit(circle, (rect.x - area.x, rect.y - area.y))
+
+        self.chunks[key] = chunk
+        if len(self.chunks) > self.cache_size:
+            self.chunks.popitem(last=False)
+        return chunk
+
+    def draw(self, screen, view, rects = None):
+        """Rysuje widoczną część mapy z zasięgami (albo tylko pod podanymi prostokątami ekranu)."""
+        self.map_builder.draw_chunks(screen, view, rects, self.get_chunk)
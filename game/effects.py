@@ -1,50 +1,84 @@
 #game/effects.py
 import pygame, math, os
+from game.assets import ASSETS, load_image
+
+FIRE_ZONE_RADIUS = 50 # domyślny promień strefy ognia
+
+
+def firezone_frame_paths(path = "images/effects/firezone"):
+    """Zwraca ścieżki kolejnych klatek strefy ognia (firezone_f1.png, firezone_f2.png, ...)"""
+    paths = []
+    while os.path.exists(os.path.join(path, f"firezone_f{len(paths) + 1}.png")):
+        paths.append(os.path.join(path, f"firezone_f{len(paths) + 1}.png"))
+    return paths
+
+
+def load_firezone_frames(radius):
+    """Zwraca (wczytując raz) klatki strefy ognia przeskalowane do danego promienia"""
+    def build():
+        frames = []
+        for frame_path in firezone_frame_paths():
+            if ASSETS.headless:
+                frames.append(None)
+                continue
+            image = load_image(frame_path)
+            scaled_image = pygame.transform.scale(image, (radius * 2, radius * 2))
+            frames.append(scaled_image)
+
+        if not frames and ASSETS.headless:
+            frames.append(None)
+        elif not frames:
+            # fallback jeśli brak grafiki
+            surf = pygame.Surface((radius*2, radius*2), pygame.SRCALPHA)
+            pygame.draw.circle(surf, (255, 100, 0, 100), (radius, radius), radius)
+            frames.append(surf)
+        return frames
+    return ASSETS.get(("firezone", radius), build)
+
 
 class FireZone:
     """Klasa reprezentująca strefę ognia tworzoną przez FireTower"""
-    def __init__(self, x, y, radius=50, duration=3.0, damage_per_second=70):
+    __slots__ = ("x", "y", "radius", "duration", "timer", "damage_per_second", "frames",
+                 "current_frame", "frame_timer")
+
+    frame_speed = 0.15 # czas klatki animacji (wspólny dla wszystkich stref)
+
+    def __init__(self, x, y, radius=FIRE_ZONE_RADIUS, duration=3.0, damage_per_second=70):
+        self.radius = None
+        self.frames = []
+        self.reset(x, y, radius, duration, damage_per_second)
+
+    def reset(self, x, y, radius=FIRE_ZONE_RADIUS, duration=3.0, damage_per_second=70):
+        """Ustawia strefę od nowa (także przy ponownym użyciu obiektu z puli)"""
         self.x = x
         self.y = y
-        self.radius = radius
         self.duration = duration
         self.timer = 0.0
         self.damage_per_second = damage_per_second
 
-        self.frames = []
         self.current_frame = 0
         self.frame_timer = 0.0
-        self.frame_speed = 0.15
 
-        self.load_animation()
+        # Klatki zależą tylko od promienia - pobierane ponownie tylko przy jego zmianie
+        if radius != self.radius:
+            self.radius = radius
+            self.load_animation()
 
     def load_animation(self):
-        """Ładuje animowaną grafikę strefy ognia"""
-        path = "images/effects/firezone"
-        i = 1
-        while True:
-            frame_path = os.path.join(path, f"firezone_f{i}.png")
-            if not os.path.exists(frame_path):
-                break
-            image = pygame.image.load(frame_path).convert_alpha()
-            scaled_image = pygame.transform.scale(image, (self.radius * 2, self.radius * 2))
-            self.frames.append(scaled_image)
-            i += 1
-
-        if not self.frames:
-            # fallback jeśli brak grafiki
-            surf = pygame.Surface((self.radius*2, self.radius*2), pygame.SRCALPHA)
-            pygame.draw.circle(surf, (255, 100, 0, 100), (self.radius, self.radius), self.radius)
-            self.frames.append(surf)
+        """Pobiera współdzielone klatki strefy ognia z rejestru grafik"""
+        self.frames = load_firezone_frames(self.radius)
 
-    def update(self, dt, enemies):
-        """Aktualizuje stan strefy ognia"""
+    def update(self, dt, enemies, grid=None):
+        """Aktualizuje stan strefy ognia (grid - opcjonalna siatka przestrzenna przeciwników)"""
         self.timer += dt
 
         # Zadawanie obrażeń przeciwnikom w strefie
-        for enemy in enemies:
-            if math.hypot(enemy.x - self.x, enemy.y - self.y) <= self.radius:
-                enemy.hp -= self.damage_per_second * dt
+        if grid is not None:
+            grid.damage_in_radius(self.x, self.y, self.radius, self.damage_per_second * dt)
+        else:
+            for enemy in enemies:
+                if math.hypot(enemy.x - self.x, enemy.y - self.y) <= self.radius:
+                    enemy.hp -= self.damage_per_second * dt
 
         self.frame_timer += dt
         # Aktualizacja animacji
@@ -52,12 +86,16 @@ class FireZone:
             self.frame_timer = 0
             self.current_frame = (self.current_frame + 1) % len(self.frames)
 
-    def draw(self, screen):
+    def draw(self, screen, offset = (0, 0)):
         """Renderuje strefę ognia na ekranie"""
         frame = self.frames[self.current_frame]
-        rect = frame.get_rect(center=(self.x, self.y))
+        rect = frame.get_rect(center=(self.x - offset[0], self.y - offset[1]))
         screen.blit(frame, rect)
 
+    def get_rect(self):
+        """Zwraca prostokąt zajmowany przez strefę ognia"""
+        return self.frames[self.current_frame].get_rect(center=(self.x, self.y))
+
     def is_expired(self):
         """Sprawdza czy strefa ognia wygasła"""
         return self.timer >= self.duration
\ No newline at end of file
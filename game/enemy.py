@@ -1,8 +1,10 @@
 # game/enemy.py
 
-import pygame, math, os
-from config import ENEMY_PATH
-from game.assets import SOUNDS
+import pygame, os
+from game.path import ENEMY_ROUTE
+from game.assets import play_sound, ASSETS, load_image, load_animation_frames, mirror_frames
+from game.content import ENEMY_IDS, ENEMY_NAMES, ENEMY_SPRITES, ENEMY_SPEED, ENEMY_HP, ENEMY_RADIUS, \
+DIFFICULTY_HP
 
 # Stałe dla animacji
 FRAME_WIDTH = 48
@@ -13,77 +15,80 @@ ANIMATION_SPEED = 0.15
 COIN_FRAMES = 8
 COIN_ANIMATION_SPEED = 0.1
 
-class Enemy:
-    """Klasa bazowa przeciwnika."""
-    def __init__(self, difficulty='Normal', name = "normal"):
-        self.name = name
-        self.path = ENEMY_PATH
-        self.current_point = 0
-        self.x, self.y = self.path[0]
-        
-        self.speed = 80
-        self.max_hp = 250
-        self.hp = self.max_hp
-        self.radius = 15
-        self.reached_end = False
-        self.slow_timer = 0
-        self.speed_factor = 1.0
-
-
-        if difficulty == 'Hard':
-            self.hp *= 2
-            self.max_hp *= 2
-
-        self.animations = {}
-        self.state = 'move'
-        self.direction = 'down'
-        self.animation_frame = 0
-        self.animation_timer = 0
-        self.death_timer = 0
-        self.death_duration = FRAMES_PER_ANIMATION * ANIMATION_SPEED
+def enemy_animation_paths(name, actions = ('move', 'death')):
+    """Zwraca istniejące arkusze animacji danego typu przeciwnika, klucz: akcja_kierunek."""
+    paths = {}
+    for action in actions:
+        for direction in ['up', 'down', 'left']:
+            path = f"images/enemies/{name}/{name}_{action}_{direction}.png"
+            if os.path.exists(path):
+                paths[f"{action}_{direction}"] = path
+    return paths
+
+
+def load_enemy_animations(name):
+    """Zwraca (wczytując raz) słownik animacji ruchu i śmierci danego typu przeciwnika."""
+    def build():
+        animations = {}
+        actions = ['move', 'death']
 
-        self.coin_frames = []
-        self.coin_animation_frame = 0
-        self.coin_animation_timer = 0
-        self.coin_spawned = False
-        self.coin_offset_y = 0  # do przesuwania monety w górę
-        self.coin_scale = 0.2
+        for action in actions:
+            for key, path in enemy_animation_paths(name, [action]).items():
+                animations[key] = load_animation_frames(
+                    path, FRAME_WIDTH, FRAME_HEIGHT, FRAMES_PER_ANIMATION)
 
-        self.load_animations()
-        self.load_coin_animation()
+            # Animacja w prawo to odbita raz animacja w lewo
+            if f"{action}_left" in animations:
+                animations[f"{action}_right"] = mirror_frames(animations[f"{action}_left"])
+        return animations
+    return ASSETS.get(("enemy", name), build)
 
-    def load_animations(self):
-        """Wczytuje animacje dla ruchu przeciwników"""
-        actions = ['move', 'death']
-        directions = ['up', 'down', 'left']
 
-        for action in actions:
-            for direction in directions:
-                path = f"images/enemies/{self.name}/{self.name}_{action}_{direction}.png"
-                if not os.path.exists(path):
-                    continue
-                image = pygame.image.load(path).convert_alpha()
-                frames = []
-                for i in range(FRAMES_PER_ANIMATION):
-                    frame = image.subsurface((i * FRAME_WIDTH, 0, FRAME_WIDTH, FRAME_HEIGHT))
-                    frames.append(frame)
-                self.animations[f"{action}_{direction}"] = frames
+def load_coin_frames(coin_scale):
+    """Zwraca (wczytując raz) klatki animacji monety w podanej skali."""
+    def build():
+        if ASSETS.headless:
+            return [None] * COIN_FRAMES
 
-    def load_coin_animation(self):
-        """Wczytuje animacje monety"""
-        coin_sheet = pygame.image.load("images/interface/coin.png").convert_alpha()
+        coin_frames = []
+        coin_sheet = load_image("images/interface/coin.png")
         frame_size = coin_sheet.get_width() // COIN_FRAMES # Oblicz rozmiar pojedynczej klatki
-        scaled_size = int(frame_size * self.coin_scale)    # Oblicz nowy rozmiar po skalowaniu
-            
+        scaled_size = int(frame_size * coin_scale)    # Oblicz nowy rozmiar po skalowaniu
+
         for i in range(COIN_FRAMES):
             # Wycinanie klatki z arkusza
-            frame = coin_sheet.subsurface((i * frame_size, 0, frame_size, 
+            frame = coin_sheet.subsurface((i * frame_size, 0, frame_size,
                                            frame_size))
-                
+
             # Skalowanie klatek
-            if self.coin_scale != 1.0:
+            if coin_scale != 1.0:
                 frame = pygame.transform.scale(frame, (scaled_size, scaled_size))
-                self.coin_frames.append(frame)
+                coin_frames.append(frame)
+        return coin_frames
+    return ASSETS.get(("coin", coin_scale), build)
+
+
+class EnemyBase:
+    """Zachowanie i rysowanie przeciwnika, wspólne dla Enemy i widoków EnemyView.
+
+    Nie przechowuje stanu - pola definiują klasy pochodne (sloty Enemy albo
+    tablice EnemyStore), więc widok nie dziedziczy nieużywanych slotów."""
+    __slots__ = ()
+
+    # Dane wspólne dla wszystkich przeciwników danego typu
+    name = "normal"
+    type_id = ENEMY_IDS["normal"] # numer typu w tablicach game.content
+    path = ENEMY_ROUTE
+    death_duration = FRAMES_PER_ANIMATION * ANIMATION_SPEED
+    coin_scale = 0.2
+
+    def load_animations(self):
+        """Pobiera współdzielone animacje ruchu przeciwników z rejestru grafik"""
+        self.animations = load_enemy_animations(ENEMY_SPRITES[self.type_id])
+
+    def load_coin_animation(self):
+        """Pobiera współdzielone klatki animacji monety z rejestru grafik"""
+        self.coin_frames = load_coin_frames(self.coin_scale)
 
 
     def update(self, dt):
@@ -123,86 +128,72 @@ class Enemy:
 
     def update_move(self, dt):
         """Aktualizuje pozycję i animację podczas ruchu przeciwnika."""
-        if self.current_point >= len(self.path) - 1:
+        if self.distance >= self.path.length:
             self.reached_end = True
             return
 
-        target_x, target_y = self.path[self.current_point + 1]
-        dir_x, dir_y, distance = self.calculate_direction(target_x, target_y)
-
-        if distance < 3:
-            self.current_point += 1
-            return
-
-        if abs(dir_y) > abs(dir_x):
-            self.direction = 'up' if dir_y < 0 else 'down'
-        else:
-            self.direction = 'left' if dir_x < 0 else 'right'
-
         if self.slow_timer > 0:
             self.slow_timer -= dt
         else:
             self.speed_factor = 1.0
 
-        self.x += dir_x * self.speed * self.speed_factor * dt
-        self.y += dir_y * self.speed * self.speed_factor * dt
+        self.distance += self.speed * self.speed_factor * dt
+        self.x, self.y, self.direction, self.current_point = self.path.sample(self.distance, self.current_point)
 
         self.animation_timer += dt
         if self.animation_timer >= ANIMATION_SPEED:
             self.animation_timer = 0
             self.animation_frame = (self.animation_frame + 1) % FRAMES_PER_ANIMATION
 
-    def calculate_direction(self, target_x, target_y):
-        """Oblicza kierunek ruchu przeciwnika w stronę celu."""
-        dir_x = target_x - self.x
-        dir_y = target_y - self.y
-        distance = math.hypot(dir_x, dir_y)
+    def progress(self):
+        """Zwraca postęp przeciwnika (0..1) na drodze do wyjścia."""
+        return self.path.progress(self.distance)
 
-        if distance != 0:
-            dir_x /= distance
-            dir_y /= distance
-
-        return dir_x, dir_y, distance
-
-    def draw(self, screen):
-        """Rysuje odpowiednie elementy na ekranie."""
+    def draw(self, screen, offset = (0, 0)):
+        """Rysuje odpowiednie elementy na ekranie (offset - pozycja kamery na mapie)."""
 
         # Rysowanie mobów
-        self.draw_anim(screen)
+        self.draw_anim(screen, offset)
 
         # Rysowanie monety
         if self.state == 'death' and self.coin_spawned and self.coin_frames:
-            self.draw_coin(screen)
+            self.draw_coin(screen, offset)
         
         # Rysowanie paska hp
-        self.draw_hp_bar(screen)
+        self.draw_hp_bar(screen, offset)
   
 
-    def draw_anim(self, screen):
+    def draw_anim(self, screen, offset = (0, 0)):
         """Rysuje animację przeciwnika"""
-        key = f"{self.state}_{self.direction}"
-        frames = self.animations.get(key)
-
-        if self.direction == 'right': # Dla 'right' użycie 'left' z odbiciem
-            frames = self.animations.get(f"{self.state}_left")
-
+        frames = self.animations.get(f"{self.state}_{self.direction}")
         if frames:
             frame = frames[self.animation_frame]
-            if self.direction == "right":
-                frame = pygame.transform.flip(frame, True, False)
-            screen.blit(frame, (self.x - FRAME_WIDTH // 2, self.y - FRAME_HEIGHT // 2))
+            screen.blit(frame, (self.x - FRAME_WIDTH // 2 - offset[0], self.y - FRAME_HEIGHT // 2 - offset[1]))
 
-    def draw_coin(self, screen):
+    def draw_coin(self, screen, offset = (0, 0)):
         """Rysuje animację monety nad martwym przeciwnikiem."""
         coin_frame = self.coin_frames[self.coin_animation_frame]
         coin_rect = coin_frame.get_rect()
-        screen.blit(coin_frame, (self.x - coin_rect.width // 2, self.y - coin_rect.height - 20 + self.coin_offset_y))
+        screen.blit(coin_frame, (self.x - coin_rect.width // 2 - offset[0],
+                                 self.y - coin_rect.height - 20 + self.coin_offset_y - offset[1]))
 
-    def draw_hp_bar(self, screen):
+    def draw_hp_bar(self, screen, offset = (0, 0)):
         """Rysuje pasek zdrowia przeciwnika."""
         hp_ratio = self.hp / self.max_hp
-        pygame.draw.rect(screen, (0, 0, 0), (self.x - 15, self.y - 25, 30, 5))
-        pygame.draw.rect(screen, (0, 255, 0), (self.x - 15, self.y - 25, 30 * hp_ratio, 5))
+        x, y = self.x - 15 - offset[0], self.y - 25 - offset[1]
+        pygame.draw.rect(screen, (0, 0, 0), (x, y, 30, 5))
+        pygame.draw.rect(screen, (0, 255, 0), (x, y, 30 * hp_ratio, 5))
+
+    def get_rect(self):
+        """Zwraca prostokąt obejmujący wszystko, co rysuje przeciwnik."""
+        rect = pygame.Rect(int(self.x - FRAME_WIDTH // 2), int(self.y - FRAME_HEIGHT // 2),
+                           FRAME_WIDTH, FRAME_HEIGHT)
+        rect.union_ip(pygame.Rect(int(self.x - 15), int(self.y - 25), 31, 6)) # pasek hp
+        if self.state == 'death' and self.coin_spawned and self.coin_frames:
+            coin_w, coin_h = self.coin_frames[self.coin_animation_frame].get_size()
+            rect.union_ip(pygame.Rect(int(self.x - coin_w // 2),
+                                      int(self.y - coin_h - 20 + self.coin_offset_y), coin_w + 1, coin_h + 1))
+        return rect
 
     def is_dead(self):
         """Sprawdza czy przeciwnik jest martwy."""
@@ -210,7 +201,7 @@ class Enemy:
             self.state = 'death'
             self.animation_frame = 0
             self.death_timer = self.death_duration
-            SOUNDS["enemy_death"].play()
+            play_sound("enemy_death")
             return False
         return self.hp <= 0 and self.state == "death" and self.death_timer <= 0
     
@@ -220,36 +211,82 @@ class Enemy:
         self.speed_factor = min(self.speed_factor, factor)
 
 
-class FastEnemy(Enemy):
-    """Klasa szybkiego przeciwnika."""
+class Enemy(EnemyBase):
+    """Klasa bazowa przeciwnika.
+
+    Obiekty używają __slots__ (bez słownika atrybutów), a dane wspólne dla typu
+    (nazwa, ścieżka, czas śmierci, skala monety) są atrybutami klasy."""
+    __slots__ = ("generation", "current_point", "distance", "x", "y", "speed", "max_hp", "hp",
+                 "radius", "reached_end", "slow_timer", "speed_factor", "state", "direction",
+                 "animation_frame", "animation_timer", "death_timer", "coin_animation_frame",
+                 "coin_animation_timer", "coin_spawned", "coin_offset_y", "animations", "coin_frames")
+
     def __init__(self, difficulty='Normal'):
-        super().__init__(difficulty)
-        self.name = "fast"
-        self.speed = 200
-        self.max_hp = 150
-        self.hp = self.max_hp
-        self.radius = 10
+        self.generation = 0 # zwiększane przy każdym (ponownym) użyciu obiektu
+        self.reset(difficulty)
 
-        if difficulty == 'Hard':
-            self.hp *= 2
-            self.max_hp *= 2
-        
         self.load_animations()
+        self.load_coin_animation()
+
+    def reset(self, difficulty='Normal'):
+        """Ustawia przeciwnika od nowa na początku ścieżki (także przy ponownym użyciu z puli).
+
+        Animacje są współdzielone przez typ przeciwnika, więc nie są pobierane ponownie."""
+        self.generation += 1
+        self.current_point = 0 # numer bieżącego odcinka ścieżki
+        self.distance = 0.0    # dystans przebyty wzdłuż ścieżki
+        self.x, self.y = self.path.points[0]
+
+        # Statystyki typu z tablic treści gry
+        type_id = self.type_id
+        self.speed = ENEMY_SPEED[type_id]
+        self.max_hp = ENEMY_HP[type_id] * DIFFICULTY_HP[difficulty]
+        self.hp = self.max_hp
+        self.radius = ENEMY_RADIUS[type_id]
+        self.reached_end = False
+        self.slow_timer = 0
+        self.speed_factor = 1.0
+
+        self.state = 'move'
+        self.direction = 'down'
+        self.animation_frame = 0
+        self.animation_timer = 0
+        self.death_timer = 0
+
+        self.coin_animation_frame = 0
+        self.coin_animation_timer = 0
+        self.coin_spawned = False
+        self.coin_offset_y = 0  # do przesuwania monety w górę
+
+
+class FastEnemy(Enemy):
+    """Klasa szybkiego przeciwnika."""
+    __slots__ = ()
+    name = "fast"
+    type_id = ENEMY_IDS["fast"]
 
 
 class TankEnemy(Enemy):
     """Klasa przeciwnika o wysokiej wytrzymałości."""
-    def __init__(self, difficulty='Normal'):
-        super().__init__(difficulty)
-        self.name = "tank"
-        self.speed = 30
-        self.max_hp = 600
-        self.hp = self.max_hp
-        self.radius = 20
+    __slots__ = ()
+    name = "tank"
+    type_id = ENEMY_IDS["tank"]
 
-        if difficulty == 'Hard':
-            self.hp *= 2
-            self.max_hp *= 2
 
-        self.load_animations()
+def build_enemy_types():
+    """Zwraca klasy przeciwników dla typów z pliku treści (indeks: numer typu).
+
+    Typy bez własnej klasy (np. warianty do testów) dostają prostą podklasę Enemy."""
+    known = {cls.name: cls for cls in (Enemy, FastEnemy, TankEnemy)}
+    types = []
+    for type_id, name in enumerate(ENEMY_NAMES):
+        cls = known.get(name)
+        if cls is None:
+            cls = type(f"{name.title()}Enemy", (Enemy,), {"__slots__": (), "name": name, "type_id": type_id})
+        types.append(cls)
+    return types
+
+
+# Klasy przeciwników, indeks: numer typu z game.content
+ENEMY_TYPES = build_enemy_types()
 
@@ -0,0 +1,328 @@
+# game/enemy_store.py
+
+try:
+    import numpy as np
+except ImportError: # numpy jest opcjonalny - bez niego symulacja używa listy obiektów Enemy
+    np = None
+
+from game.enemy import EnemyBase, FRAMES_PER_ANIMATION, ANIMATION_SPEED, COIN_ANIMATION_SPEED
+from game.path import ENEMY_ROUTE
+
+# Kodowanie stanów i kierunków w tablicach
+MOVE, DEATH = 0, 1
+STATES = ('move', 'death')
+DIRECTIONS = ('up', 'down', 'left', 'right')
+
+FLOAT_FIELDS = ("x", "y", "distance", "hp", "max_hp", "speed", "speed_factor", "slow_timer",
+                "radius", "animation_timer", "death_timer", "death_duration",
+                "coin_animation_timer", "coin_offset_y")
+INT_FIELDS = ("current_point", "state", "direction", "animation_frame", "coin_animation_frame",
+              "coin_count", "generation", "damage", "reward_gold", "reward_score")
+BOOL_FIELDS = ("alive", "reached_end", "coin_spawned")
+
+
+class EnemyStore:
+    """Magazyn przeciwników w układzie struktury tablic (NumPy).
+
+    Pozycja, postęp na ścieżce, HP, prędkość, spowolnienie, stan i liczniki
+    animacji wszystkich przeciwników leżą w ciągłych tablicach, a ruch,
+    wygasanie spowolnienia, wykrywanie śmierci i naliczanie nagród wykonywane
+    są jedną operacją na całych tablicach. Dla zgodności z resztą gry każdy
+    przeciwnik jest dostępny jako lekki widok EnemyView.
+
+    Magazyn udostępnia też ten sam interfejs zapytań co SpatialHash, więc
+    może zastąpić siatkę przestrzenną w wieżach i strefach ognia."""
+    def __init__(self, path = ENEMY_ROUTE, capacity = 256):
+        if np is None:
+            raise ImportError("EnemyStore wymaga pakietu numpy (pip install numpy)")
+
+        self.path = path
+        self.path_starts = np.array(path.starts, dtype=np.float64)
+        self.path_lengths = np.array(path.lengths, dtype=np.float64)
+        self.path_origins = np.array(path.origins, dtype=np.float64).reshape(-1, 2)
+        self.path_directions = np.array(path.directions, dtype=np.float64).reshape(-1, 2)
+        self.path_facings = np.array([DIRECTIONS.index(f) for f in path.facings], dtype=np.int64)
+
+        self.capacity = 0
+        self.size = 0       # najwyższy użyty slot + 1
+        self.free = []      # zwolnione sloty do ponownego użycia
+        self.active_slots = np.empty(0, dtype=np.int64) # sloty żywych przeciwników w kolejności pojawienia się
+        self.count = 0      # liczba żywych przeciwników (użyta część active_slots)
+        self.views = []
+        self.view_list = None # lista widoków w kolejności active (odbudowywana po usunięciach)
+        self.active_x = np.empty(0)
+        self.active_y = np.empty(0)
+        self.grow(capacity)
+
+    def grow(self, capacity):
+        """Powiększa tablice do podanej pojemności."""
+        old = self.capacity
+        for name in FLOAT_FIELDS:
+            self.resize_field(name, capacity, np.float64)
+        for name in INT_FIELDS:
+            self.resize_field(name, capacity, np.int64)
+        for name in BOOL_FIELDS:
+            self.resize_field(name, capacity, np.bool_)
+        self.views.extend([None] * (capacity - old))
+        active_slots = np.empty(capacity, dtype=np.int64)
+        active_slots[:self.count] = self.active_slots[:self.count]
+        self.active_slots = active_slots
+        self.capacity = capacity
+
+    @property
+    def active(self):
+        """Sloty żywych przeciwników w kolejności pojawienia się (widok tablicy, bez kopiowania)."""
+        return self.active_slots[:self.count]
+
+    def resize_field(self, name, capacity, dtype):
+        """Tworzy nową tablicę pola, przepisując dotychczasowe wartości."""
+        array = np.zeros(capacity, dtype=dtype)
+        if self.capacity:
+            array[:self.capacity] = getattr(self, name)
+        setattr(self, name, array)
+
+    def __len__(self):
+        return self.count
+
+    def add(self, enemy, damage = 0, reward = (0, 0)):
+        """Dodaje przeciwnika (kopiując stan obiektu Enemy) i zwraca jego widok."""
+        if self.free:
+            slot = self.free.pop()
+        else:
+            if self.size == self.capacity:
+                self.grow(self.capacity * 2)
+            slot = self.size
+            self.size += 1
+
+        for name in FLOAT_FIELDS + ("current_point", "animation_frame", "coin_animation_frame",
+                                    "reached_end", "coin_spawned"):
+            getattr(self, name)[slot] = getattr(enemy, name)
+        self.state[slot] = STATES.index(enemy.state)
+        self.direction[slot] = DIRECTIONS.index(enemy.direction)
+        self.coin_count[slot] = max(len(enemy.coin_frames), 1)
+        self.damage[slot] = damage
+        self.reward_gold[slot], self.reward_score[slot] = reward
+        self.alive[slot] = True
+
+        view = EnemyView(self, slot, enemy)
+        self.views[slot] = view
+        self.active_slots[self.count] = slot
+        self.count += 1
+        if self.view_list is not None:
+            self.view_list.append(view)
+        return view
+
+    def is_current(self, slot, generation):
+        """Sprawdza czy widok wskazuje na wciąż żywego przeciwnika."""
+        return self.alive[slot] and self.generation[slot] == generation
+
+    def enemies(self):
+        """Zwraca listę widoków żywych przeciwników w kolejności pojawienia się."""
+        if self.view_list is None:
+            views = self.views
+            self.view_list = [views[slot] for slot in self.active.tolist()]
+        return self.view_list
+
+    def update(self, dt):
+        """Aktualizuje wszystkich przeciwników i usuwa tych, którzy dotarli do końca lub zginęli.
+
+        Zwraca (obrażenia dla gracza, złoto, punkty, liczba nowo zabitych)."""
+        if not self.count: # np. przerwa między falami - bez kilkudziesięciu operacji na pustych tablicach
+            return 0, 0, 0, 0
+        n = self.size
+        alive = self.alive[:n]
+        state = self.state[:n]
+        x, y = self.x[:n], self.y[:n]
+        distance = self.distance[:n]
+        slow_timer, speed_factor = self.slow_timer[:n], self.speed_factor[:n]
+        frame, anim_timer = self.animation_frame[:n], self.animation_timer[:n]
+        reached_end = self.reached_end[:n]
+
+        # Ruch
+        moving = alive & (state == MOVE) & ~reached_end
+        at_end = moving & (distance >= self.path.length)
+        reached_end |= at_end
+        moving &= ~at_end
+
+        slowed = moving & (slow_timer > 0)
+        slow_timer[slowed] -= dt
+        speed_factor[moving & ~slowed] = 1.0
+
+        idx = np.flatnonzero(moving)
+        distance[idx] += self.speed[idx] * speed_factor[idx] * dt
+        d = distance[idx]
+        segment = np.clip(np.searchsorted(self.path_starts, d, side='right') - 1, 0, len(self.path_starts) - 1)
+        offset = np.minimum(d - self.path_starts[segment], self.path_lengths[segment])
+        x[idx] = self.path_origins[segment, 0] + self.path_directions[segment, 0] * offset
+        y[idx] = self.path_origins[segment, 1] + self.path_directions[segment, 1] * offset
+        self.direction[idx] = self.path_facings[segment]
+        self.current_point[idx] = segment
+
+        anim_timer[idx] += dt
+        wrap = idx[anim_timer[idx] >= ANIMATION_SPEED]
+        anim_timer[wrap] = 0
+        frame[wrap] = (frame[wrap] + 1) % FRAMES_PER_ANIMATION
+
+        # Animacja śmierci i monety
+        dying = np.flatnonzero(alive & (state == DEATH))
+        if len(dying):
+            self.death_timer[dying] -= dt
+            anim_timer[dying] += dt
+            wrap = dying[anim_timer[dying] >= ANIMATION_SPEED]
+            anim_timer[wrap] = 0
+            frame[wrap] = np.minimum(frame[wrap] + 1, FRAMES_PER_ANIMATION - 1)
+
+            coin_spawned = self.coin_spawned
+            spawn = dying[~coin_spawned[dying] & (frame[dying] >= 3)]
+            coin_spawned[spawn] = True
+            self.coin_animation_frame[spawn] = 0
+            self.coin_offset_y[spawn] = 0
+
+            coins = dying[coin_spawned[dying]]
+            self.coin_animation_timer[coins] += dt
+            self.coin_offset_y[coins] -= 30 * dt
+            wrap = coins[self.coin_animation_timer[coins] >= COIN_ANIMATION_SPEED]
+            self.coin_animation_timer[wrap] = 0
+            self.coin_animation_frame[wrap] = (self.coin_animation_frame[wrap] + 1) % self.coin_count[wrap]
+
+        # Dotarcie do końca ścieżki, śmierć i nagrody
+        reached = alive & reached_end
+        rest = alive & ~reached
+        hp = self.hp[:n]
+        killed = rest & (hp <= 0) & (state == MOVE)
+        state[killed] = DEATH
+        frame[killed] = 0
+        self.death_timer[:n][killed] = self.death_duration[:n][killed]
+
+        finished = rest & (hp <= 0) & (state == DEATH) & (self.death_timer[:n] <= 0)
+
+        damage = int(self.damage[:n][reached].sum())
+        gold = int(self.reward_gold[:n][finished].sum())
+        score = int(self.reward_score[:n][finished].sum())
+        self.remove(reached | finished)
+        return damage, gold, score, int(killed.sum())
+
+    def remove(self, mask):
+        """Usuwa przeciwników wskazanych maską (długości size) i zwalnia ich sloty."""
+        slots = np.flatnonzero(mask)
+        if not len(slots):
+            return
+        self.alive[slots] = False
+        self.generation[slots] += 1
+        self.free.extend(slots.tolist())
+        active = self.active
+        kept = active[self.alive[active]]
+        self.active_slots[:len(kept)] = kept
+        self.count = len(kept)
+        self.view_list = None
+
+    # Interfejs zapytań zgodny ze SpatialHash
+
+    def rebuild(self, items = None):
+        """Odświeża podręczne tablice pozycji żywych przeciwników."""
+        self.active_x = self.x[self.active]
+        self.active_y = self.y[self.active]
+
+    def in_radius(self, x, y, radius):
+        """Zwraca indeksy (w kolejności active) przeciwników w promieniu."""
+        return np.flatnonzero(np.hypot(self.active_x - x, self.active_y - y) <= radius)
+
+    def query_radius(self, x, y, radius):
+        """Zwraca widoki przeciwników w odległości nie większej niż radius od punktu."""
+        views = self.enemies()
+        return [views[i] for i in self.in_radius(x, y, radius).tolist()]
+
+    def nearest(self, x, y, radius = None):
+        """Zwraca najbliższego przeciwnika (opcjonalnie w zadanym promieniu) lub None."""
+        if not len(self.active):
+            return None
+        distances = np.hypot(self.active_x - x, self.active_y - y)
+        i = int(np.argmin(distances))
+        if radius is not None and distances[i] > radius:
+            return None
+        return self.enemies()[i]
+
+    def lowest_hp(self, x, y, radius, alive_only = True, unslowed_only = False):
+        """Zwraca przeciwnika w promieniu o najmniejszym HP (przy remisie - pierwszego)."""
+        if not self.count:
+            return None
+        candidates = self.in_radius(x, y, radius)
+        slots = self.active[candidates]
+        hp = self.hp[slots]
+        keep = np.ones(len(slots), dtype=np.bool_)
+        if alive_only:
+            keep &= hp > 0
+        if unslowed_only:
+            keep &= self.slow_timer[slots] <= 0
+        if not keep.any():
+            return None
+        candidates, hp = candidates[keep], hp[keep]
+        return self.enemies()[int(candidates[np.argmin(hp)])]
+
+    def damage_in_radius(self, x, y, radius, amount):
+        """Odejmuje amount HP wszystkim przeciwnikom w promieniu."""
+        slots = self.active[self.in_radius(x, y, radius)]
+        self.hp[slots] -= amount
+
+
+def store_field(name, convert = float):
+    """Tworzy właściwość widoku czytającą i zapisującą pole w tablicy magazynu."""
+    def getter(self):
+        return convert(getattr(self.store, name)[self.slot])
+
+    def setter(self, value):
+        getattr(self.store, name)[self.slot] = value
+    return property(getter, setter)
+
+
+def store_code(name, codes):
+    """Tworzy właściwość widoku dla pola zakodowanego liczbą (stan, kierunek)."""
+    def getter(self):
+        return codes[getattr(self.store, name)[self.slot]]
+
+    def setter(self, value):
+        getattr(self.store, name)[self.slot] = codes.index(value)
+    return property(getter, setter)
+
+
+class EnemyView(EnemyBase):
+    """Lekki widok przeciwnika z EnemyStore - zachowuje się jak obiekt Enemy.
+
+    Dane przechowywane są w tablicach magazynu, a widok trzyma tylko numer
+    slotu, pokolenie slotu i współdzielone dane typu (nazwa, animacje)."""
+    __slots__ = ("store", "slot", "generation", "name", "type_id", "path", "animations", "coin_frames",
+                 "coin_scale")
+
+    def __init__(self, store, slot, template):
+        self.store = store
+        self.slot = slot
+        self.generation = int(store.generation[slot])
+        self.name = template.name
+        self.type_id = template.type_id
+        self.path = template.path
+        self.animations = template.animations
+        self.coin_frames = template.coin_frames
+        self.coin_scale = template.coin_scale
+
+    state = store_code("state", STATES)
+    direction = store_code("direction", DIRECTIONS)
+
+    def update(self, dt):
+        """Przeciwnicy z magazynu są aktualizowani zbiorczo przez EnemyStore.update."""
+        pass
+
+    def is_dead(self):
+        """Sprawdza czy przeciwnik jest martwy (usunięty z magazynu też jest martwy)."""
+        if not self.store.is_current(self.slot, self.generation):
+            return True
+        return super().is_dead()
+
+
+# Pola widoku odwzorowane na tablice magazynu
+for _name in FLOAT_FIELDS:
+    setattr(EnemyView, _name, store_field(_name))
+for _name in ("current_point", "animation_frame", "coin_animation_frame"):
+    setattr(EnemyView, _name, store_field(_name, int))
+for _name in ("reached_end", "coin_spawned"):
+    setattr(EnemyView, _name, store_field(_name, bool))
+del _name
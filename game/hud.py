@@ -0,0 +1,110 @@
+# game/hud.py
+
+import pygame
+
+from config import START_HP, WIDTH
+from game.text import render_text
+
+
+class Hud:
+    """Interfejs gry (złoto, HP, punktacja, fala, komunikat o fali) trzymany jako gotowa warstwa.
+
+    Warstwa jest składana od nowa tylko wtedy, gdy zmieni się któraś z wyświetlanych
+    wartości albo podświetlenie pól pod kursorem - w pozostałych klatkach rysowanie
+    interfejsu to jeden blit."""
+    def __init__(self, coin_icon, heart_full, heart_half, sign_img, font, big_font):
+        self.coin_icon = coin_icon
+        self.heart_full = heart_full
+        self.heart_half = heart_half
+        self.sign_img = sign_img
+        self.font = font
+        self.big_font = big_font
+
+        self.layer = None
+        self.layer_pos = (0, 0)
+        self.state = None
+        self.rects = []          # prostokąty elementów interfejsu na ekranie
+        self.stat_box_rects = [] # pola score/wave (do podświetlenia)
+        self.compositions = 0    # liczba złożeń warstwy (statystyka)
+
+    def hovered(self, mouse_pos):
+        """Zwraca, które pola statystyk są pod kursorem."""
+        return tuple(rect.collidepoint(mouse_pos) for rect in self.stat_box_rects)
+
+    def update(self, gold, hp, score, wave_number, waiting_for_wave, mouse_pos):
+        """Składa warstwę ponownie, jeśli zmieniły się wartości lub podświetlenie.
+
+        Zwraca True, jeśli warstwa została złożona od nowa."""
+        state = (gold, hp, score, wave_number, waiting_for_wave, self.hovered(mouse_pos))
+        if state == self.state:
+            return False
+
+        self.compose(gold, hp, score, wave_number, waiting_for_wave, mouse_pos)
+        # Pola mogły zmienić rozmiar - podświetlenie liczone na nowo
+        self.state = (gold, hp, score, wave_number, waiting_for_wave, self.hovered(mouse_pos))
+        return True
+
+    def compose(self, gold, hp, score, wave_number, waiting_for_wave, mouse_pos):
+        """Układa elementy interfejsu na jednej przezroczystej warstwie."""
+        elements = []
+        self.stat_box_rects = []
+
+        # GOLD
+        elements.append((self.coin_icon, (10, 10)))
+        elements.append((render_text(self.font, str(gold), (0, 0, 0)), (40, 12)))
+
+        # HP
+        heart_img = self.heart_full if hp > START_HP / 2 else self.heart_half
+        elements.append((heart_img, (10, 40)))
+        elements.append((render_text(self.font, str(hp), (0, 0, 0)), (40, 42)))
+
+        # POLA STATYSTYK (score, wave)
+        elements += self.stat_box(f"Score: {score}", (0, 80), mouse_pos)
+        elements += self.stat_box(f"Wave: {wave_number}", (0, 130), mouse_pos)
+
+        # Komunikat o nadchodzącej fali
+        if waiting_for_wave:
+            ready_text = render_text(self.big_font, "Next wave incoming...", (255, 200, 100))
+            elements.append((ready_text, (WIDTH//2 - ready_text.get_width()//2, 20)))
+
+        rects = [surface.get_rect(topleft=pos) for surface, pos in elements]
+        bounds = rects[0].unionall(rects[1:])
+
+        layer = pygame.Surface(bounds.size, pygame.SRCALPHA)
+        for surface, (x, y) in elements:
+            layer.blit(surface, (x - bounds.x, y - bounds.y))
+
+        self.layer = layer
+        self.layer_pos = bounds.topleft
+        self.rects = rects
+        self.compositions += 1
+
+    def stat_box(self, text, pos, mouse_pos):
+        """Zwraca elementy pojedynczego pola statystyki (tło i tekst)."""
+        padding_x = 20
+        padding_y = 10
+
+        # Przygotowanie tekstu (rozmiar nie zależy od przezroczystości)
+        txt_rect = render_text(self.font, text, (0, 0, 0)).get_rect()
+
+        # Obliczanie rozmiaru tła
+        bg_width = txt_rect.width + padding_x * 2
+        bg_height = txt_rect.height + padding_y * 2
+        bg_rect = pygame.Rect(pos, (bg_width, bg_height))
+        self.stat_box_rects.append(bg_rect)
+
+        # efekt przezroczystości
+        hover_score_alpha = 150 if bg_rect.collidepoint(mouse_pos) else 255
+
+        # Przygotowanie tła
+        txt_bg = pygame.transform.scale(self.sign_img, (bg_width, bg_height))
+        txt_bg.set_alpha(hover_score_alpha)
+        txt_surface = render_text(self.font, text, (0, 0, 0), hover_score_alpha)
+
+        return [(txt_bg, pos),
+                (txt_surface, (pos[0] + (bg_width - txt_rect.width) // 2,
+                               pos[1] + (bg_height - txt_rect.height) // 2))]
+
+    def draw(self, screen):
+        """Rysuje warstwę interfejsu (jeden blit)."""
+        screen.blit(self.layer, self.layer_pos)
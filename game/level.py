@@ -0,0 +1,82 @@
+# game/level.py
+#
+# Mapa gry wczytywana z pliku (MAP_FILE): kafelki, dekoracje, droga przeciwników
+# i miejsca na wieże. Mapa może być dowolnie duża - rysuje ją MapBuilder w kawałkach
+# przez kamerę. Szeroką mapę do testów (kopie mapy połączone drogą) tworzy:
+#   python -m game.level --copies 8 --output data/maps/wide.json
+
+import json
+
+from config import MAP_FILE, TILE_SIZE
+
+
+def load_map(path = MAP_FILE):
+    """Wczytuje mapę z pliku JSON."""
+    with open(path, encoding="utf-8") as f:
+        data = json.load(f)
+    return {
+        "tiles": data["tiles"],
+        "decorations": data["decorations"],
+        "enemy_path": [tuple(point) for point in data["enemy_path"]],
+        "tower_slots": [tuple(slot) for slot in data["tower_slots"]],
+    }
+
+
+def save_map(path, level):
+    """Zapisuje mapę do pliku JSON (jeden wiersz mapy w linii, żeby plik dało się czytać i edytować)."""
+    def rows(items):
+        return "[\n" + ",\n".join("    " + json.dumps(item, separators=(",", ":")) for item in items) + "\n  ]"
+
+    with open(path, "w", encoding="utf-8") as f:
+        f.write("{\n")
+        f.write('  "tiles": ' + rows(level["tiles"]) + ",\n")
+        f.write('  "decorations": ' + rows(level["decorations"]) + ",\n")
+        f.write('  "enemy_path": ' + json.dumps([list(point) for point in level["enemy_path"]]) + ",\n")
+        f.write('  "tower_slots": ' + json.dumps([list(slot) for slot in level["tower_slots"]]) + "\n")
+        f.write("}\n")
+
+
+def map_size(tiles):
+    """Zwraca rozmiar mapy w pikselach."""
+    return max(len(row) for row in tiles) * TILE_SIZE, len(tiles) * TILE_SIZE
+
+
+def repeat_map(level, copies):
+    """Zwraca mapę złożoną z kopii podanej mapy ustawionych obok siebie.
+
+    Drogi kolejnych kopii są połączone odcinkiem z końca jednej do początku następnej."""
+    width, _ = map_size(level["tiles"])
+    enemy_path = []
+    tower_slots = []
+    for copy in range(copies):
+        offset = copy * width
+        enemy_path += [(x + offset, y) for x, y in level["enemy_path"]]
+        tower_slots += [(x + offset, y) for x, y in level["tower_slots"]]
+    return {
+        "tiles": [row * copies for row in level["tiles"]],
+        "decorations": [row * copies for row in level["decorations"]],
+        "enemy_path": enemy_path,
+        "tower_slots": tower_slots,
+    }
+
+
+# Bieżąca mapa gry
+LEVEL = load_map()
+MAP_DATA = LEVEL["tiles"]
+DECORATIONS_DATA = LEVEL["decorations"]
+ENEMY_PATH = LEVEL["enemy_path"]
+TOWER_SLOTS = LEVEL["tower_slots"]
+MAP_WIDTH, MAP_HEIGHT = map_size(MAP_DATA)
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Tworzy szeroką mapę z kopii bieżącej mapy.")
+    parser.add_argument("--copies", type=int, default=8, help="liczba kopii mapy obok siebie")
+    parser.add_argument("--output", default="data/maps/wide.json")
+    args = parser.parse_args()
+
+    save_map(args.output, repeat_map(LEVEL, args.copies))
+    width, height = map_size(MAP_DATA)
+    print(f"Zapisano {args.output}: {width * args.copies}x{height} px")
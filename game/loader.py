@@ -0,0 +1,175 @@
+# game/loader.py
+
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pygame
+
+from config import ASSET_LOADER_WORKERS, ASSET_STREAM_BUDGET_MS
+from game.assets import ASSETS, SOUND_FILES, load_assets, map_asset_paths, load_sounds, load_scaled_image
+
+# Priorytety zadań
+FIRST_FRAME = 0 # potrzebne do narysowania pierwszej klatki (ekran startowy)
+STREAMED = 1    # doczytywane w tle, gdy gra już działa
+
+SOUND_EXTENSIONS = (".mp3", ".wav", ".ogg")
+
+
+def decode_file(path):
+    """Dekoduje plik na wątku roboczym (obraz bez konwersji do formatu ekranu albo dźwięk)."""
+    if path.lower().endswith(SOUND_EXTENSIONS):
+        return pygame.mixer.Sound(path)
+    return pygame.image.load(path)
+
+
+class LoadTask:
+    """Zadanie wczytania zasobu: pliki do zdekodowania w tle i funkcja budująca zasób."""
+    def __init__(self, name, paths, build, priority):
+        self.name = name
+        self.paths = list(paths)
+        self.build = build
+        self.priority = priority
+
+
+class AssetLoader:
+    """Wczytywanie zasobów w tle z postępem.
+
+    Pliki graficzne i dźwiękowe dekodowane są na puli wątków w kolejności
+    priorytetów zadań. Zasoby budowane są na głównym wątku zwykłymi funkcjami
+    (load_assets, load_tower_images, ...): zdekodowane pliki trafiają do
+    ASSETS.decoded, a rejestr tylko konwertuje je do formatu ekranu, więc kod
+    gry nie musi wiedzieć o loaderze. Plik, którego nie zdekodowano wcześniej,
+    jest po prostu wczytywany z dysku jak dotąd."""
+    def __init__(self, workers = ASSET_LOADER_WORKERS):
+        self.workers = workers
+        self.tasks = []
+        self.pending = []  # zadania czekające na zbudowanie (wg priorytetu)
+        self.futures = {}  # ścieżka -> Future dekodowania
+        self.jobs = {}     # nazwa -> praca w tle (przed start), po start Future tej pracy
+        self.executor = None
+        self.start_time = None
+        self.finish_time = None
+        self.build_times = {} # nazwa zadania -> czas budowania w ms
+
+    def add(self, name, paths, build, priority = STREAMED):
+        """Dodaje zadanie (przed start)."""
+        self.tasks.append(LoadTask(name, paths, build, priority))
+
+    def add_job(self, name, work):
+        """Dodaje pracę wykonywaną w całości na wątku roboczym, po dekodowaniu plików (przed start).
+
+        Praca nie wlicza się do postępu i nie wstrzymuje wczytywania (np. budowa paczki grafik)."""
+        self.jobs[name] = work
+
+    def start(self):
+        """Rozpoczyna dekodowanie plików wszystkich zadań."""
+        self.start_time = time.perf_counter()
+        self.pending = sorted(self.tasks, key=lambda task: task.priority)
+        self.executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="assets")
+        for task in self.pending:
+            for path in task.paths:
+                # Obrazy z paczki grafik nie wymagają dekodowania
+                if ASSETS.bundle is not None and path in ASSETS.bundle:
+                    continue
+                if path not in self.futures:
+                    self.futures[path] = self.executor.submit(decode_file, path)
+        # Prace w tle trafiają do kolejki puli za plikami do zdekodowania
+        self.jobs = {name: self.executor.submit(work) for name, work in self.jobs.items()}
+
+    def is_ready(self, task):
+        """Sprawdza czy wszystkie pliki zadania są już zdekodowane."""
+        return all(path not in self.futures or self.futures[path].done() for path in task.paths)
+
+    def build(self, task):
+        """Buduje zasób zadania na głównym wątku."""
+        for path in task.paths:
+            future = self.futures.get(path)
+            # Błąd dekodowania nie przerywa wczytywania - plik zostanie wczytany z dysku (i zgłosi błąd) w build
+            if future is not None and future.exception() is None:
+                ASSETS.decoded[path] = future.result()
+        start = time.perf_counter()
+        task.build()
+        self.build_times[task.name] = (time.perf_counter() - start) * 1000
+
+    def pump(self, budget_ms = ASSET_STREAM_BUDGET_MS, priority = None, wait = False):
+        """Buduje gotowe zadania w kolejności priorytetów, mieszcząc się w budżecie czasu.
+
+        priority ogranicza budowanie do zadań o priorytecie nie większym niż podany,
+        wait=True czeka na dekodowanie zamiast przerywać. Zwraca liczbę zbudowanych zadań."""
+        deadline = time.perf_counter() + budget_ms / 1000 if budget_ms is not None else None
+        built = 0
+        while self.pending:
+            task = self.pending[0]
+            if priority is not None and task.priority > priority:
+                break
+            if not wait and not self.is_ready(task):
+                break
+            self.pending.pop(0)
+            self.build(task)
+            built += 1
+            if deadline is not None and time.perf_counter() >= deadline:
+                break
+
+        if not self.pending and self.finish_time is None:
+            self.finish()
+        return built
+
+    def finish(self):
+        """Zamyka pulę wątków po zbudowaniu wszystkich zadań."""
+        self.finish_time = time.perf_counter()
+        self.executor.shutdown(wait=False)
+        ASSETS.decoded.clear() # pliki z manifestu, których nikt nie użył
+
+    def wait(self, priority = None):
+        """Buduje (czekając na dekodowanie) wszystkie zadania do danego priorytetu."""
+        self.pump(budget_ms=None, priority=priority, wait=True)
+
+    def is_done(self, priority = None):
+        """Sprawdza czy zbudowano wszystkie zadania (do danego priorytetu)."""
+        return not any(priority is None or task.priority <= priority for task in self.pending)
+
+    def progress(self):
+        """Zwraca postęp wczytywania (0..1): zdekodowane pliki i zbudowane zadania."""
+        total = len(self.futures) + len(self.tasks)
+        if not total:
+            return 1.0
+        decoded = sum(future.done() for future in self.futures.values())
+        return (decoded + len(self.tasks) - len(self.pending)) / total
+
+    def elapsed_ms(self):
+        """Zwraca czas wczytywania w ms (do zakończenia lub do teraz)."""
+        end = self.finish_time or time.perf_counter()
+        return (end - self.start_time) * 1000
+
+
+def add_game_assets(loader):
+    """Dodaje do loadera zasoby gry: najpierw mapę i interfejs, potem resztę w tle."""
+    from game.game_manager import interface_images
+    from game.bullet import load_arrow_animations
+    from game.tower import load_tower_images, tower_image_paths
+    from game.enemy import Enemy, load_enemy_animations, enemy_animation_paths, load_coin_frames
+    from game.content import ENEMY_SPRITES
+    from game.effects import FIRE_ZONE_RADIUS, load_firezone_frames, firezone_frame_paths
+
+    interface_paths = ["images/interface/coin.png", "images/interface/heart.png",
+                       "images/interface/interface.png", "images/interface/menus.png"]
+    volume_paths = ["images/effects/volume/muted.png", "images/effects/volume/unmuted.png"]
+
+    # Ekran startowy: mapa i baner tytułowy
+    loader.add("map", map_asset_paths(), load_assets, FIRST_FRAME)
+    loader.add("interface", interface_paths, interface_images, FIRST_FRAME)
+
+    # Reszta w kolejności, w jakiej będzie potrzebna
+    loader.add("volume", volume_paths, lambda: [load_scaled_image(path, (32, 32)) for path in volume_paths])
+    loader.add("sounds", SOUND_FILES.values(), load_sounds)
+    loader.add("arrows", ["images/effects/arrows/arrows.png"], load_arrow_animations)
+    for name in dict.fromkeys(ENEMY_SPRITES):
+        # Najpierw animacje ruchu, animacje śmierci na końcu kolejki dekodowania
+        loader.add(f"enemy_{name}", list(enemy_animation_paths(name, ['move']).values())
+                   + list(enemy_animation_paths(name, ['death']).values()),
+                   lambda name=name: load_enemy_animations(name))
+    loader.add("coin", ["images/interface/coin.png"], lambda: load_coin_frames(Enemy.coin_scale))
+    base_paths, archer_paths = tower_image_paths()
+    loader.add("towers", list(archer_paths.values()) + list(base_paths.values()), load_tower_images)
+    loader.add("firezone", firezone_frame_paths(), lambda: load_firezone_frames(FIRE_ZONE_RADIUS))
+    return loader
@@ -1,16 +1,51 @@
 # game/map_builder.py
 
 import pygame
-from config import TILE_SIZE, MAP_DATA, DECORATIONS_DATA
+from collections import OrderedDict
+
+from config import WIDTH, HEIGHT, TILE_SIZE, WHITE, MAP_CHUNK_SIZE, MAP_CHUNK_CACHE
 from game.assets import load_assets
+from game.level import MAP_DATA, DECORATIONS_DATA
+
+SCREEN_VIEW = pygame.Rect(0, 0, WIDTH, HEIGHT) # widok bez kamery (lewy górny róg mapy)
+
 
 class MapBuilder:
-    """Klasa odpowiedzialna za budowe i renderowanie mapy gry"""
-    def __init__(self):
+    """Klasa odpowiedzialna za budowe i renderowanie mapy gry
+
+    Mapa renderowana jest w kawałkach chunk_size x chunk_size (kafelki + nieruchome
+    dekoracje) dopiero wtedy, gdy kawałek pierwszy raz pojawi się na ekranie.
+    Ostatnio używane kawałki trzymane są w pamięci (najwyżej cache_size), więc
+    koszt rysowania i zajęta pamięć zależą od rozmiaru ekranu, a nie mapy.
+
+    Zmiany danych mapy (podmiana map_data / decorations_data albo set_tile
+    i set_decorations) zwiększają numer wersji, a kawałki są przebudowywane
+    przy następnym rysowaniu - bez porównywania danych w każdej klatce."""
+    def __init__(self, map_data=MAP_DATA, decorations_data=DECORATIONS_DATA,
+                 chunk_size=MAP_CHUNK_SIZE, cache_size=MAP_CHUNK_CACHE):
         self.tile_images, self.decor_images = load_assets()
+        self.version = 0 # numer zmiany danych mapy
+        self.map_data = map_data
+        self.decorations_data = decorations_data
+        self.chunk_size = chunk_size
+        self.cache_size = cache_size
         self.anim_timer = 0
         self.anim_frame = 0
 
+        # Rozmieszczenie dekoracji w kawałkach, budowane raz na zmianę danych mapy
+        self.placed_version = None # wersja danych mapy, z której rozmieszczono dekoracje
+        self.generation = 0      # numer rozmieszczenia (rośnie przy każdej przebudowie)
+        self.width = self.height = 0
+        self.bounds = pygame.Rect(0, 0, 0, 0) # prostokąt całej mapy
+        self.chunk_rects = {}    # (cx, cy) -> prostokąt kawałka na mapie
+        self.chunks = OrderedDict() # (cx, cy) -> wyrenderowany kawałek (LRU)
+        self.chunk_decor = {}    # (cx, cy) -> [(pozycja, grafika)] statyczne dekoracje nachodzące na kawałek
+        self.overlay = []        # (pozycja, grafika) rysowane co klatkę, w kolejności rysowania
+        self.overlay_rects = []  # prostokąty zajmowane przez nakładkę
+        self.chunk_overlay = {}  # (cx, cy) -> numery elementów nakładki nachodzących na kawałek
+        self.visible_overlay = (None, []) # (widok, numery widocznych elementów nakładki)
+        self.rendered = 0        # liczba wyrenderowanych kawałków (statystyka)
+
     def update_animation(self, dt):
         """Aktualizuje stan animacji dla dekoracji"""
         self.anim_timer += dt
@@ -18,23 +53,81 @@ class MapBuilder:
             self.anim_timer = 0
             self.anim_frame = (self.anim_frame + 1) % 6  # 6 klatek
 
-    def draw_map(self, screen, draw_grid = False):
-        """Odpowiada za rysowanie mapy"""
+    @property
+    def map_data(self):
+        """Kafelki mapy (wiersze identyfikatorów kafelków)."""
+        return self._map_data
 
-        # Rysuje kafelki mapy
-        for row_idx, row in enumerate(MAP_DATA):
-            for col_idx, tile_id in enumerate(row):
-                x = col_idx * TILE_SIZE
-                y = row_idx * TILE_SIZE
-                tile_img = self.tile_images.get(tile_id)
-                if tile_img:
-                    screen.blit(tile_img, (x, y))
-                # if draw_grid:
-                #     pygame.draw.rect(screen, (0, 0, 0, 50), (x, y, TILE_SIZE, TILE_SIZE), 1)  # czarna siatka
+    @map_data.setter
+    def map_data(self, map_data):
+        self._map_data = map_data
+        self.invalidate()
+
+    @property
+    def decorations_data(self):
+        """Dekoracje mapy (wiersze list identyfikatorów dekoracji)."""
+        return self._decorations_data
+
+    @decorations_data.setter
+    def decorations_data(self, decorations_data):
+        self._decorations_data = decorations_data
+        self.invalidate()
+
+    def set_tile(self, col, row, tile_id):
+        """Zmienia kafelek mapy (kawałki zostaną przebudowane przy następnym rysowaniu)."""
+        self._map_data[row][col] = tile_id
+        self.invalidate()
+
+    def set_decorations(self, col, row, decor_ids):
+        """Zmienia dekoracje pola mapy (kawałki zostaną przebudowane przy następnym rysowaniu)."""
+        self._decorations_data[row][col] = decor_ids
+        self.invalidate()
+
+    def invalidate(self):
+        """Oznacza dane mapy jako zmienione (np. po edycji list map_data w miejscu)"""
+        self.version += 1
+
+    def refresh(self):
+        """Rozmieszcza dekoracje ponownie, jeśli dane mapy zmieniły się od ostatniego rozmieszczenia. Zwraca True po przebudowie."""
+        if self.placed_version == self.version:
+            return False
+        self.place_decorations()
+        return True
+
+    def chunk_keys(self, rect):
+        """Zwraca numery kawałków (cx, cy) nachodzących na prostokąt mapy."""
+        rect = rect.clip(self.bounds)
+        if not rect.width or not rect.height:
+            return []
+        size = self.chunk_size
+        return [(cx, cy)
+                for cy in range(rect.top // size, (rect.bottom - 1) // size + 1)
+                for cx in range(rect.left // size, (rect.right - 1) // size + 1)]
+
+    def chunk_rect(self, cx, cy):
+        """Zwraca prostokąt kawałka na mapie (kawałki przy krawędzi mapy są przycięte)."""
+        rect = self.chunk_rects.get((cx, cy))
+        if rect is None:
+            size = self.chunk_size
+            rect = self.chunk_rects[(cx, cy)] = pygame.Rect(cx * size, cy * size, size, size).clip(self.bounds)
+        return rect
 
+    def place_decorations(self):
+        """Przypisuje dekoracje do kawałków mapy.
 
-        # Rysuje dekoracje mapy
-        for row_idx, row in enumerate(DECORATIONS_DATA):
+        Animowane dekoracje (listy klatek) trafiają do nakładki rysowanej co klatkę.
+        Statyczne dekoracje rysowane później i nachodzące na nakładkę także do niej
+        trafiają, żeby zachować oryginalną kolejność rysowania."""
+        self.width = max(len(row) for row in self.map_data) * TILE_SIZE
+        self.height = len(self.map_data) * TILE_SIZE
+        self.bounds = pygame.Rect(0, 0, self.width, self.height)
+        self.chunk_rects = {}
+
+        chunk_decor = {}
+        overlay = []
+        overlay_rects = []
+        chunk_overlay = {}
+        for row_idx, row in enumerate(self.decorations_data):
             for col_idx, decor_ids in enumerate(row):
                 if decor_ids:
                     x = col_idx * TILE_SIZE
@@ -42,7 +135,104 @@ class MapBuilder:
                     for decor_id in decor_ids:
                         image = self.decor_images.get(decor_id)
                         if isinstance(image, list):
-                            screen.blit(image[self.anim_frame], (x, y))
+                            rect = image[0].get_rect(topleft=(x, y))
                         elif isinstance(image, pygame.Surface):
-                            screen.blit(image, (x, y))
+                            rect = image.get_rect(topleft=(x, y))
+                            # Czy nachodzi na któryś element nakładki (sprawdzane tylko w jego kawałkach)
+                            nearby = {index for key in self.chunk_keys(rect) for index in chunk_overlay.get(key, ())}
+                            if not any(rect.colliderect(overlay_rects[index]) for index in nearby):
+                                for key in self.chunk_keys(rect):
+                                    chunk_decor.setdefault(key, []).append(((x, y), image))
+                                continue
+                        else:
+                            continue
+                        for key in self.chunk_keys(rect):
+                            chunk_overlay.setdefault(key, []).append(len(overlay))
+                        overlay.append(((x, y), image))
+                        overlay_rects.append(rect)
+
+        self.chunks.clear()
+        self.chunk_decor = chunk_decor
+        self.overlay = overlay
+        self.overlay_rects = overlay_rects
+        self.chunk_overlay = chunk_overlay
+        self.visible_overlay = (None, [])
+        self.placed_version = self.version
+        self.generation += 1
+
+    def get_chunk(self, cx, cy):
+        """Zwraca kawałek mapy (kafelki i statyczne dekoracje), renderując go przy pierwszym użyciu"""
+        key = (cx, cy)
+        chunk = self.chunks.get(key)
+        if chunk is not None:
+            self.chunks.move_to_end(key)
+            return chunk
+
+        chunk = self.render_chunk(cx, cy)
+        self.chunks[key] = chunk
+        if len(self.chunks) > self.cache_size:
+            self.chunks.popitem(last=False)
+        return chunk
+
+    def render_chunk(self, cx, cy):
+        """Renderuje kafelki i statyczne dekoracje jednego kawałka mapy."""
+        area = self.chunk_rect(cx, cy)
+        chunk = pygame.Surface(area.size).convert()
+        chunk.fill(WHITE)
+
+        # Rysuje kafelki mapy
+        first_col, last_col = area.left // TILE_SIZE, (area.right - 1) // TILE_SIZE
+        for row_idx in range(area.top // TILE_SIZE, (area.bottom - 1) // TILE_SIZE + 1):
+            row = self.map_data[row_idx]
+            for col_idx in range(first_col, min(last_col + 1, len(row))):
+                tile_img = self.tile_images.get(row[col_idx])
+                if tile_img:
+                    chunk.blit(tile_img, (col_idx * TILE_SIZE - area.x, row_idx * TILE_SIZE - area.y))
 
+        # Rysuje dekoracje mapy (także te wystające z sąsiednich kawałków)
+        for (x, y), image in self.chunk_decor.get((cx, cy), ()):
+            chunk.blit(image, (x - area.x, y - area.y))
+
+        self.rendered += 1
+        return chunk
+
+    def draw_chunks(self, screen, view = SCREEN_VIEW, rects = None, get_chunk = None):
+        """Rysuje widoczne kawałki mapy (albo tylko ich części pod podanymi prostokątami ekranu).
+
+        get_chunk pozwala podać inne źródło kawałków (np. mapę z zasięgami wież)."""
+        self.refresh()
+        get_chunk = get_chunk or self.get_chunk
+        for rect in rects if rects is not None else [pygame.Rect((0, 0), view.size)]:
+            world = rect.move(view.topleft)
+            for cx, cy in self.chunk_keys(world):
+                chunk_rect = self.chunk_rect(cx, cy)
+                area = world.clip(chunk_rect)
+                screen.blit(get_chunk(cx, cy), (area.x - view.x, area.y - view.y),
+                            area.move(-chunk_rect.x, -chunk_rect.y))
+
+    def visible_overlay_items(self, view):
+        """Zwraca numery elementów nakładki widocznych w widoku (w kolejności rysowania)."""
+        self.refresh()
+        cached_view, indices = self.visible_overlay
+        if cached_view != view:
+            indices = sorted({index for key in self.chunk_keys(view) for index in self.chunk_overlay.get(key, ())})
+            self.visible_overlay = (pygame.Rect(view), indices)
+        return indices
+
+    def visible_overlay_rects(self, view = SCREEN_VIEW):
+        """Zwraca prostokąty ekranu zajmowane przez widoczne elementy nakładki."""
+        return [self.overlay_rects[index].move(-view.x, -view.y) for index in self.visible_overlay_items(view)]
+
+    def draw_overlay(self, screen, view = SCREEN_VIEW):
+        """Rysuje animowane dekoracje (i nachodzące na nie dekoracje statyczne)"""
+        for index in self.visible_overlay_items(view):
+            (x, y), image = self.overlay[index]
+            if isinstance(image, list):
+                screen.blit(image[self.anim_frame], (x - view.x, y - view.y))
+            else:
+                screen.blit(image, (x - view.x, y - view.y))
+
+    def draw_map(self, screen, view = SCREEN_VIEW):
+        """Odpowiada za rysowanie mapy"""
+        self.draw_chunks(screen, view)
+        self.draw_overlay(screen, view)
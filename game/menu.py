@@ -0,0 +1,132 @@
+# game/menu.py
+
+import pygame
+
+from config import WIDTH, HEIGHT
+from game.text import render_text
+
+
+class MenuScreen:
+    """Ekran menu rysowany w trybie zachowanym.
+
+    Tło (mapa przyciemniona nakładką, zrzut gry albo jednolity kolor), tytuł,
+    przyciski i napisy są składane raz do gotowej klatki. W kolejnych klatkach
+    odświeżane są tylko animowane dekoracje mapy (gdy zmieni się ich klatka)
+    oraz widżet (np. suwak głośności), gdy zmieni się jego stan - bez zmian
+    ekran nie jest w ogóle przerysowywany."""
+    def __init__(self, title, buttons, title_image, font, backdrop = (0, 0, 0),
+                 map_builder = None, opacity = 0, texts = (), widget = None, title_y = 100):
+        self.title = title
+        self.buttons = buttons         # lista (napis, prostokąt, kolor)
+        self.title_image = title_image
+        self.font = font
+        self.backdrop = backdrop       # Surface (np. zrzut gry) albo kolor tła
+        self.map_builder = map_builder # animowana mapa w tle (zamiast backdrop)
+        self.opacity = opacity         # stopień przyciemnienia mapy
+        self.texts = texts             # lista (napis, czcionka, kolor, środek)
+        self.widget = widget           # obiekt z rect, state() i draw(screen)
+        self.title_y = title_y
+
+        self.frame = None      # złożona klatka ekranu (bez widżetu)
+        self.ui = None         # warstwa z tytułem, przyciskami i napisami
+        self.dim = None        # ciemna nakładka
+        self.anim_frame = None # klatka dekoracji mapy widoczna w self.frame
+        self.widget_state = None
+
+    def set_texts(self, texts):
+        """Zmienia napisy ekranu (klatka zostanie złożona ponownie)."""
+        self.texts = texts
+        self.frame = None
+
+    def button_at(self, pos):
+        """Zwraca napis przycisku w danym punkcie (lub None)."""
+        for label, rect, _ in self.buttons:
+            if rect.collidepoint(pos):
+                return label
+        return None
+
+    def build_ui(self):
+        """Rysuje tytuł, przyciski i napisy na przezroczystej warstwie."""
+        ui = pygame.Surface((WIDTH, HEIGHT), pygame.SRCALPHA)
+
+        # Baner tytułowy z wyśrodkowanym tekstem
+        title_surface = render_text(self.font, self.title, (255, 255, 255))
+        board_rect = self.title_image.get_rect(center=(WIDTH // 2, self.title_y))
+        ui.blit(self.title_image, board_rect)
+        ui.blit(title_surface, title_surface.get_rect(center=board_rect.center))
+
+        # Przyciski
+        for label, rect, color in self.buttons:
+            pygame.draw.rect(ui, color, rect, border_radius=20)
+            rendered = render_text(self.font, label, (255, 255, 255))
+            ui.blit(rendered, rendered.get_rect(center=rect.center))
+
+        for text, font, color, center in self.texts:
+            rendered = render_text(font, text, color)
+            ui.blit(rendered, rendered.get_rect(center=center))
+        return ui
+
+    def build(self):
+        """Składa pełną klatkę ekranu."""
+        self.ui = self.build_ui()
+        frame = pygame.Surface((WIDTH, HEIGHT)).convert()
+
+        if self.map_builder:
+            self.dim = pygame.Surface((WIDTH, HEIGHT))
+            self.dim.set_alpha(self.opacity)
+            self.dim.fill((0, 0, 0))
+
+            self.map_builder.draw_map(frame)
+            frame.blit(self.dim, (0, 0))
+            self.anim_frame = self.map_builder.anim_frame
+        elif isinstance(self.backdrop, pygame.Surface):
+            frame.blit(self.backdrop, (0, 0))
+        else:
+            frame.fill(self.backdrop)
+
+        frame.blit(self.ui, (0, 0))
+        self.frame = frame
+
+    def refresh_animation(self, dt):
+        """Odświeża w klatce animowane dekoracje mapy. Zwraca zmienione prostokąty."""
+        if not self.map_builder:
+            return []
+
+        self.map_builder.update_animation(dt)
+        if self.map_builder.anim_frame == self.anim_frame:
+            return []
+
+        rects = self.map_builder.visible_overlay_rects()
+        self.map_builder.draw_chunks(self.frame, rects=rects)
+        self.map_builder.draw_overlay(self.frame)
+        for rect in rects:
+            self.frame.blit(self.dim, rect, rect)
+            self.frame.blit(self.ui, rect, rect)
+        self.anim_frame = self.map_builder.anim_frame
+        return list(rects)
+
+    def draw(self, screen, dt = 0):
+        """Aktualizuje i wyświetla ekran, odświeżając tylko zmienione obszary."""
+        if self.frame is None:
+            self.build()
+            screen.blit(self.frame, (0, 0))
+            if self.widget:
+                self.widget.draw(screen)
+                self.widget_state = self.widget.state()
+            pygame.display.flip()
+            return
+
+        dirty = self.refresh_animation(dt)
+        for rect in dirty:
+            screen.blit(self.frame, rect, rect)
+
+        if self.widget:
+            state = self.widget.state()
+            if state != self.widget_state or self.widget.rect.collidelist(dirty) != -1:
+                screen.blit(self.frame, self.widget.rect, self.widget.rect)
+                self.widget.draw(screen)
+                self.widget_state = state
+                dirty.append(self.widget.rect)
+
+        if dirty:
+            pygame.display.update(dirty)
@@ -0,0 +1,82 @@
+# game/path.py
+
+import math, bisect
+from game.level import ENEMY_PATH
+
+
+class EnemyPath:
+    """Ścieżka przeciwników skompilowana do odcinków o znanej długości.
+
+    Przeciwnik pamięta tylko przebyty dystans - pozycja, kierunek i postęp
+    są odczytywane z tablic odcinków (wyszukiwanie binarne, a przy ruchu do
+    przodu zwykle O(1) dzięki podpowiedzi z numerem poprzedniego odcinka)."""
+    def __init__(self, points):
+        self.points = [tuple(point) for point in points]
+        self.starts = []      # dystans od początku ścieżki do początku odcinka
+        self.lengths = []     # długości odcinków
+        self.directions = []  # wektory jednostkowe odcinków
+        self.facings = []     # kierunek animacji na odcinku ('up', 'down', 'left', 'right')
+        self.origins = []     # punkty początkowe odcinków
+
+        total = 0.0
+        for (x0, y0), (x1, y1) in zip(self.points, self.points[1:]):
+            dx, dy = x1 - x0, y1 - y0
+            length = math.hypot(dx, dy)
+            if length == 0:
+                continue
+            dir_x, dir_y = dx / length, dy / length
+
+            if abs(dir_y) > abs(dir_x):
+                facing = 'up' if dir_y < 0 else 'down'
+            else:
+                facing = 'left' if dir_x < 0 else 'right'
+
+            self.starts.append(total)
+            self.lengths.append(length)
+            self.directions.append((dir_x, dir_y))
+            self.facings.append(facing)
+            self.origins.append((x0, y0))
+            total += length
+
+        self.length = total
+
+    def segment_at(self, distance):
+        """Zwraca numer odcinka, na którym leży punkt odległy o distance od startu."""
+        index = bisect.bisect_right(self.starts, distance) - 1
+        return min(max(index, 0), len(self.starts) - 1)
+
+    def sample(self, distance, segment = 0):
+        """Zwraca (x, y, kierunek, odcinek) dla przebytego dystansu.
+
+        segment to podpowiedź - numer odcinka z poprzedniego wywołania."""
+        starts = self.starts
+        last = len(starts) - 1
+        if segment > last or distance < starts[segment]:
+            segment = self.segment_at(distance)
+        else:
+            while segment < last and distance >= starts[segment + 1]:
+                segment += 1
+
+        offset = min(distance - starts[segment], self.lengths[segment])
+        x0, y0 = self.origins[segment]
+        dir_x, dir_y = self.directions[segment]
+        return x0 + dir_x * offset, y0 + dir_y * offset, self.facings[segment], segment
+
+    def position_at(self, distance):
+        """Zwraca pozycję (x, y) dla przebytego dystansu."""
+        x, y, _, _ = self.sample(distance, self.segment_at(distance))
+        return x, y
+
+    def facing_at(self, distance):
+        """Zwraca kierunek ruchu dla przebytego dystansu."""
+        return self.facings[self.segment_at(distance)]
+
+    def progress(self, distance):
+        """Zwraca postęp (0..1) na drodze do wyjścia."""
+        if self.length == 0:
+            return 1.0
+        return min(distance / self.length, 1.0)
+
+
+# Skompilowana ścieżka z config.py współdzielona przez wszystkich przeciwników
+ENEMY_ROUTE = EnemyPath(ENEMY_PATH)
@@ -0,0 +1,119 @@
+# game/pool.py
+
+from config import POOL_MAX_FREE
+
+
+class ObjectPool:
+    """Pula obiektów jednej klasy (pociski, strefy ognia, przeciwnicy).
+
+    acquire() zwraca obiekt z puli ustawiony od nowa metodą reset(...) - ta sama
+    sygnatura co konstruktor - albo tworzy nowy, gdy pula jest pusta. Obiekty
+    oddane przez release() czekają na ponowne użycie (najwyżej max_free sztuk),
+    więc w trakcie dużych fal gra nie alokuje co klatkę nowych obiektów."""
+    def __init__(self, cls, max_free = POOL_MAX_FREE):
+        self.cls = cls
+        self.max_free = max_free
+        self.free = []
+        self.created = 0  # obiekty utworzone konstruktorem
+        self.reused = 0   # obiekty wydane ponownie z puli
+        self.released = 0 # obiekty oddane do puli
+        self.dropped = 0  # obiekty porzucone, bo pula była pełna
+        self.prewarmed = 0 # obiekty utworzone na zapas przez prewarm
+
+    def acquire(self, *args, **kwargs):
+        """Zwraca obiekt z puli (zresetowany) lub nowy."""
+        if self.free:
+            obj = self.free.pop()
+            obj.reset(*args, **kwargs)
+            self.reused += 1
+            return obj
+        self.created += 1
+        return self.cls(*args, **kwargs)
+
+    def release(self, obj):
+        """Oddaje obiekt do puli."""
+        if len(self.free) < self.max_free:
+            self.free.append(obj)
+            self.released += 1
+        else:
+            self.dropped += 1
+
+    def prewarm(self, count, *args, limit = None, **kwargs):
+        """Tworzy obiekty na zapas, aż w puli będzie count wolnych (najwyżej limit za jednym razem).
+
+        Zwraca liczbę utworzonych obiektów."""
+        target = min(count, self.max_free)
+        created = 0
+        while len(self.free) < target and (limit is None or created < limit):
+            self.free.append(self.cls(*args, **kwargs))
+            created += 1
+        self.prewarmed += created
+        return created
+
+    def reset_stats(self):
+        """Zeruje liczniki puli (obiekty w puli zostają)."""
+        self.created = 0
+        self.reused = 0
+        self.released = 0
+        self.dropped = 0
+        self.prewarmed = 0
+
+    def stats(self):
+        """Zwraca statystyki puli."""
+        acquired = self.created + self.reused
+        return {
+            "created": self.created,
+            "reused": self.reused,
+            "released": self.released,
+            "dropped": self.dropped,
+            "prewarmed": self.prewarmed,
+            "free": len(self.free),
+            "reuse_rate": self.reused / acquired if acquired else 0.0,
+        }
+
+
+# Pule obiektów, klucz: klasa
+POOLS = {}
+
+def pool_for(cls):
+    """Zwraca pulę dla danej klasy (tworząc ją za pierwszym razem)."""
+    pool = POOLS.get(cls)
+    if pool is None:
+        pool = POOLS[cls] = ObjectPool(cls)
+    return pool
+
+
+def acquire(cls, *args, **kwargs):
+    """Zwraca obiekt klasy cls z jej puli."""
+    return pool_for(cls).acquire(*args, **kwargs)
+
+
+def release(obj):
+    """Oddaje obiekt do puli jego klasy."""
+    pool_for(type(obj)).release(obj)
+
+
+def pool_stats():
+    """Zwraca statystyki wszystkich pul, klucz: nazwa klasy."""
+    return {cls.__name__: pool.stats() for cls, pool in POOLS.items()}
+
+
+def reset_pool_stats():
+    """Zeruje liczniki wszystkich pul."""
+    for pool in POOLS.values():
+        pool.reset_stats()
+
+
+def compact(items, keep):
+    """Usuwa w miejscu elementy, dla których keep(item) jest fałszywe, oddając je do puli.
+
+    Zachowuje kolejność pozostałych elementów (od niej zależy kolejność trafień,
+    wybór celu przy równym HP i skrót stanu), nie tworząc nowej listy."""
+    kept = 0
+    for item in items:
+        if keep(item):
+            items[kept] = item
+            kept += 1
+        else:
+            release(item)
+    del items[kept:]
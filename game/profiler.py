@@ -0,0 +1,193 @@
+# game/profiler.py
+
+import time, json
+from collections import deque
+
+import pygame
+
+from config import PROFILER_ENABLED, PROFILER_FRAMES
+from game.text import get_font
+
+FRAME_BUDGET_MS = 1000 / 60 # czas klatki przy 60 FPS
+
+# Kolory faz na wykresie (fazy głównej pętli)
+PHASE_COLORS = \
+{
+    "wait": (60, 60, 60),
+    "events": (120, 120, 255),
+    "update": (80, 200, 120),
+    "draw": (240, 180, 60),
+    "flip": (200, 90, 200),
+}
+OTHER_COLOR = (160, 160, 160)
+
+
+class NullSection:
+    """Pusty odcinek używany przy wyłączonym profilerze (nic nie mierzy)."""
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+NULL_SECTION = NullSection()
+
+
+class Section:
+    """Mierzony odcinek klatki (używany jako menedżer kontekstu)."""
+    __slots__ = ("profiler", "name", "start")
+
+    def __init__(self, profiler, name):
+        self.profiler = profiler
+        self.name = name
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        self.profiler.depth += 1
+        return self
+
+    def __exit__(self, *exc):
+        profiler = self.profiler
+        profiler.depth -= 1
+        if profiler.current is not None:
+            profiler.current.append((self.name, self.start, time.perf_counter(), profiler.depth))
+        return False
+
+
+class FrameProfiler:
+    """Profiler klatek: czasy faz w buforze cyklicznym, wykres na ekranie i eksport śladu.
+
+    Wyłączony profiler zwraca z section() współdzielony pusty odcinek, więc
+    instrumentacja w kodzie gry kosztuje jedno wywołanie metody na fazę.
+    Bufor można zapisać jako ślad Chrome/Perfetto (chrome://tracing, ui.perfetto.dev)."""
+    def __init__(self, capacity = PROFILER_FRAMES, enabled = PROFILER_ENABLED):
+        self.enabled = enabled
+        self.frames = deque(maxlen=capacity) # (początek, koniec, [(nazwa, start, koniec, głębokość)])
+        self.current = None
+        self.frame_start = 0.0
+        self.depth = 0
+        self.origin = time.perf_counter()
+
+        self.panel = None
+        self.panel_pos = (0, 0)
+        self.summary = []           # linie tekstu z podsumowaniem faz
+        self.summary_time = 0.0     # kiedy ostatnio przeliczono podsumowanie
+
+    def set_enabled(self, enabled):
+        """Włącza lub wyłącza pomiary (bufor jest czyszczony przy włączeniu)."""
+        if enabled and not self.enabled:
+            self.frames.clear()
+        self.enabled = enabled
+        self.current = None
+
+    def toggle(self):
+        """Przełącza profiler. Zwraca nowy stan."""
+        self.set_enabled(not self.enabled)
+        return self.enabled
+
+    def begin_frame(self):
+        """Rozpoczyna pomiar klatki."""
+        if not self.enabled:
+            return
+        self.current = []
+        self.depth = 0
+        self.frame_start = time.perf_counter()
+
+    def end_frame(self):
+        """Kończy pomiar klatki i zapisuje go w buforze."""
+        if self.current is None:
+            return
+        self.frames.append((self.frame_start, time.perf_counter(), self.current))
+        self.current = None
+
+    def section(self, name):
+        """Zwraca odcinek do użycia w with (pusty, gdy profiler jest wyłączony)."""
+        if self.current is None:
+            return NULL_SECTION
+        return Section(self, name)
+
+    def phase_totals(self, frames = None):
+        """Zwraca średnie czasy faz (ms na klatkę) z podanych klatek."""
+        frames = self.frames if frames is None else frames
+        totals = {}
+        for _, _, sections in frames:
+            for name, start, end, depth in sections:
+                totals[name] = totals.get(name, 0.0) + (end - start)
+        count = max(len(frames), 1)
+        return {name: total * 1000 / count for name, total in totals.items()}
+
+    def to_trace(self):
+        """Zwraca zawartość bufora w formacie Chrome Trace Event."""
+        events = []
+        for index, (frame_start, frame_end, sections) in enumerate(self.frames):
+            events.append({"name": "frame", "cat": "frame", "ph": "X", "pid": 1, "tid": 1,
+                           "ts": round((frame_start - self.origin) * 1e6, 3),
+                           "dur": round((frame_end - frame_start) * 1e6, 3),
+                           "args": {"index": index}})
+            for name, start, end, depth in sections:
+                events.append({"name": name, "cat": "phase", "ph": "X", "pid": 1, "tid": 1,
+                               "ts": round((start - self.origin) * 1e6, 3),
+                               "dur": round((end - start) * 1e6, 3)})
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+    def dump_trace(self, path = None):
+        """Zapisuje bufor jako plik śladu JSON. Zwraca ścieżkę pliku."""
+        if path is None:
+            path = time.strftime("profile_%Y%m%d_%H%M%S.json")
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.to_trace(), f)
+        return path
+
+    def draw_overlay(self, screen, width = 320, height = 150):
+        """Rysuje wykres czasów klatek z podziałem na fazy. Zwraca zajęty prostokąt."""
+        if self.panel is None or self.panel.get_size() != (width, height):
+            self.panel = pygame.Surface((width, height))
+        panel = self.panel
+        panel.fill((20, 20, 20))
+
+        graph_height = 90
+        scale = graph_height / (2 * FRAME_BUDGET_MS) # pełna wysokość = dwie klatki
+        frames = list(self.frames)[-width:]
+        for x, (frame_start, frame_end, sections) in enumerate(frames, start=width - len(frames)):
+            y = graph_height
+            accounted = 0.0
+            for name, start, end, depth in sections:
+                if depth:
+                    continue
+                bar = (end - start) * 1000 * scale
+                accounted += end - start
+                pygame.draw.line(panel, PHASE_COLORS.get(name, OTHER_COLOR), (x, y), (x, y - bar))
+                y -= bar
+            rest = (frame_end - frame_start - accounted) * 1000 * scale
+            if rest > 0:
+                pygame.draw.line(panel, OTHER_COLOR, (x, y), (x, y - rest))
+
+        # Linia budżetu klatki
+        budget_y = graph_height - FRAME_BUDGET_MS * scale
+        pygame.draw.line(panel, (255, 60, 60), (0, budget_y), (width, budget_y))
+
+        # Podsumowanie przeliczane kilka razy na sekundę (czytelność i koszt)
+        now = time.perf_counter()
+        if now - self.summary_time > 0.25:
+            self.summary_time = now
+            recent = list(self.frames)[-60:]
+            frame_ms = sum(end - start for start, end, _ in recent) * 1000 / max(len(recent), 1)
+            totals = self.phase_totals(recent)
+            totals.pop("wait", None) # oczekiwanie na zegar nie jest pracą klatki
+            totals = sorted(totals.items(), key=lambda item: -item[1])
+            self.summary = [f"klatka {frame_ms:.2f} ms"] + [f"{name} {ms:.2f}" for name, ms in totals[:5]]
+
+        # Zmienne liczby renderowane bezpośrednio (bez zaśmiecania pamięci napisów)
+        font = get_font("arial", 12)
+        text_y = graph_height + 4
+        for i, line in enumerate(self.summary):
+            column, row = divmod(i, 3)
+            panel.blit(font.render(line, True, (230, 230, 230)), (6 + column * 160, text_y + row * 15))
+
+        self.panel_pos = (screen.get_width() - width - 10, screen.get_height() - height - 10)
+        return screen.blit(panel, self.panel_pos)
+
+
+# Globalny profiler gry
+PROFILER = FrameProfiler()
@@ -0,0 +1,261 @@
+# game/projectiles.py
+
+try:
+    import numpy as np
+except ImportError: # numpy jest opcjonalny - bez niego używana jest BulletList
+    np = None
+
+from game.bullet import BulletBase, IceBullet, MAX_BULLET_DISTANCE
+from game.enemy_store import EnemyView
+from game.pool import release, compact
+
+FIELDS = ("x", "y", "start_x", "start_y", "speed", "damage", "radius", "anim_timer", "anim_speed",
+          "anim_index", "anim_len", "slow_duration", "slow_factor", "is_ice")
+
+
+class BulletList(list):
+    """Zwykła lista pocisków aktualizowanych pojedynczo (Bullet.update)."""
+    def update(self, dt):
+        """Aktualizuje pociski i usuwa te, które trafiły."""
+        for bullet in self:
+            bullet.update(dt)
+
+        # Usuwanie pocisków, które trafiły (w miejscu, wracają do puli)
+        compact(self, lambda bullet: not bullet.hit)
+
+
+class ProjectileSystem:
+    """System pocisków przechowujący wszystkie lecące strzały w tablicach NumPy.
+
+    Ruch, sprawdzenie maksymalnego zasięgu i wykrywanie trafień odbywa się
+    jednym przebiegiem wektorowym na krok. Pociski nadal lecą za celem
+    (naprowadzanie jak w Bullet.update), a trafienia rozstrzygane są w kolejności
+    wystrzelenia, więc moment śmierci przeciwnika jest taki sam jak wcześniej.
+    Spowolnienia lodowych strzał nakładane są zbiorczo. Odległości liczone są
+    przez np.hypot, więc pozycje mogą różnić się od BulletList na ostatnim bicie.
+
+    Wieże dodają pociski zwykłym append(Bullet(...)) - obiekt jest przepisywany
+    do tablic, a na liście zostaje lekki widok ProjectileView do rysowania."""
+    def __init__(self, capacity = 64):
+        if np is None:
+            raise ImportError("ProjectileSystem wymaga pakietu numpy (pip install numpy)")
+
+        self.count = 0
+        self.capacity = 0
+        self.targets = []
+        self.generations = [] # pokolenia celów z chwili wystrzału
+        self.anims = []
+        self.kinds = []
+        self.views = []
+        self.spare_views = [] # widoki usuniętych pocisków do ponownego użycia
+        self.grow(capacity)
+
+    def grow(self, capacity):
+        """Powiększa tablice do podanej pojemności."""
+        for name in FIELDS:
+            dtype = np.bool_ if name == "is_ice" else np.int64 if name in ("anim_index", "anim_len") else np.float64
+            array = np.zeros(capacity, dtype=dtype)
+            if self.capacity:
+                array[:self.count] = getattr(self, name)[:self.count]
+            setattr(self, name, array)
+        self.capacity = capacity
+
+    def __len__(self):
+        return self.count
+
+    def __iter__(self):
+        return iter(self.views)
+
+    def __bool__(self):
+        return self.count > 0
+
+    def append(self, bullet):
+        """Dodaje pocisk utworzony przez wieżę."""
+        if self.count == self.capacity:
+            self.grow(self.capacity * 2)
+        i = self.count
+        for name in ("x", "y", "start_x", "start_y", "speed", "damage", "radius",
+                     "anim_timer", "anim_speed", "anim_index"):
+            getattr(self, name)[i] = getattr(bullet, name)
+        self.anim_len[i] = len(bullet.anim)
+        self.is_ice[i] = isinstance(bullet, IceBullet)
+        if self.is_ice[i]:
+            self.slow_duration[i] = bullet.slow_duration
+            self.slow_factor[i] = bullet.slow_factor
+
+        self.targets.append(bullet.target)
+        self.generations.append(bullet.target_generation)
+        self.anims.append(bullet.anim)
+        self.kinds.append(bullet.anim_kind)
+        if self.spare_views:
+            view = self.spare_views.pop()
+            view.index = i
+        else:
+            view = ProjectileView(self, i)
+        self.views.append(view)
+        self.count += 1
+        release(bullet) # stan został przepisany do tablic
+
+    def update(self, dt):
+        """Przesuwa wszystkie pociski, rozstrzyga trafienia i usuwa zużyte pociski."""
+        n = self.count
+        if not n:
+            return
+
+        # Dane celów zbierane raz na przeciwnika (is_dead może zmienić jego stan,
+        # a w tej fazie zwraca to samo dla każdego pocisku lecącego w ten cel)
+        slots = {}
+        rows = []
+        index = []
+        for target, generation in zip(self.targets, self.generations):
+            key = (id(target), generation)
+            slot = slots.get(key)
+            if slot is None:
+                slot = slots[key] = len(rows)
+                if not target or target.generation != generation or target.is_dead():
+                    rows.append((0.0, 0.0, 0.0, 1.0))
+                else:
+                    rows.append((target.x, target.y, target.radius, 0.0))
+            index.append(slot)
+
+        index = np.array(index, dtype=np.int64)
+        table = np.array(rows, dtype=np.float64)[index]
+        tx, ty, tr = table[:, 0], table[:, 1], table[:, 2]
+        dead = table[:, 3] != 0
+
+        x, y = self.x[:n], self.y[:n]
+        too_far = ~dead & (np.hypot(x - self.start_x[:n], y - self.start_y[:n]) > MAX_BULLET_DISTANCE)
+        live = ~dead & ~too_far
+
+        dx = tx - x
+        dy = ty - y
+        distance = np.hypot(dx, dy)
+        nonzero = distance != 0
+        dx[nonzero] /= distance[nonzero]
+        dy[nonzero] /= distance[nonzero]
+
+        hits = live & (distance < self.radius[:n] + tr)
+        moving = live & ~hits
+
+        # Ruch i animacja pocisków, które nie trafiły
+        speed = self.speed[:n]
+        x[moving] += dx[moving] * speed[moving] * dt
+        y[moving] += dy[moving] * speed[moving] * dt
+
+        animated = np.flatnonzero(moving & (self.anim_len[:n] > 0))
+        self.anim_timer[animated] += dt
+        wrap = animated[self.anim_timer[animated] >= self.anim_speed[animated]]
+        self.anim_timer[wrap] = 0
+        self.anim_index[wrap] = (self.anim_index[wrap] + 1) % self.anim_len[wrap]
+
+        hit_indices = np.flatnonzero(hits).tolist()
+        if hit_indices:
+            self.resolve_hits(hit_indices, index)
+
+        self.compact(~(dead | too_far | hits))
+
+    def resolve_hits(self, hit_indices, target_index):
+        """Zadaje obrażenia w kolejności wystrzelenia i zbiorczo nakłada spowolnienia.
+
+        target_index to numer celu każdego pocisku (wspólny dla pocisków lecących w ten sam cel)."""
+        targets = self.targets
+        last_shot = np.zeros(target_index.max() + 1, dtype=np.int64)
+        last_shot[target_index] = np.arange(len(target_index)) # przy powtórzeniach zostaje ostatni
+        last_shot = last_shot[target_index].tolist()
+        damage = self.damage
+
+        for i in hit_indices:
+            target = targets[i]
+            target.hp -= float(damage[i])
+            # Wcześniej kolejny pocisk lecący w ten cel wywołałby is_dead jeszcze w tej klatce
+            if target.hp <= 0 and target.state != 'death' and last_shot[i] > i:
+                target.is_dead()
+
+        ice = [i for i in hit_indices if self.is_ice[i]]
+        if ice:
+            apply_slows([targets[i] for i in ice], self.slow_duration[ice], self.slow_factor[ice])
+
+    def compact(self, keep):
+        """Usuwa zużyte pociski, zachowując kolejność pozostałych."""
+        n = self.count
+        kept = int(keep.sum())
+        if kept == n:
+            return
+        for name in FIELDS:
+            array = getattr(self, name)
+            array[:kept] = array[:n][keep]
+
+        mask = keep.tolist()
+        self.targets = [t for t, k in zip(self.targets, mask) if k]
+        self.generations = [g for g, k in zip(self.generations, mask) if k]
+        self.anims = [a for a, k in zip(self.anims, mask) if k]
+        self.kinds = [a for a, k in zip(self.kinds, mask) if k]
+        self.spare_views.extend(v for v, k in zip(self.views, mask) if not k)
+        self.views = [v for v, k in zip(self.views, mask) if k]
+        # Numery zmieniają się dopiero od pierwszego usuniętego pocisku
+        first = mask.index(False)
+        for i in range(first, kept):
+            self.views[i].index = i
+        self.count = kept
+
+    def draw(self, screen, offset = (0, 0)):
+        """Rysuje wszystkie pociski."""
+        for view in self.views:
+            view.draw(screen, offset)
+
+
+def apply_slows(targets, durations, factors):
+    """Nakłada spowolnienia na trafionych przeciwników (wektorowo dla EnemyStore)."""
+    if all(isinstance(target, EnemyView) for target in targets) \
+        and len({id(target.store) for target in targets}) == 1:
+        store = targets[0].store
+        slots = np.array([target.slot for target in targets], dtype=np.int64)
+        # Czas wyznacza ostatnie trafienie w danego przeciwnika (pierwsze od końca)
+        unique, last = np.unique(slots[::-1], return_index=True)
+        store.slow_timer[unique] = durations[len(slots) - 1 - last]
+        np.minimum.at(store.speed_factor, slots, factors)
+        return
+
+    for target, duration, factor in zip(targets, durations.tolist(), factors.tolist()):
+        target.apply_slow(duration, factor)
+
+
+def projectile_field(name, convert = float):
+    """Tworzy właściwość widoku czytającą pole pocisku z tablic systemu."""
+    def getter(self):
+        return convert(getattr(self.system, name)[self.index])
+    return property(getter)
+
+
+class ProjectileView(BulletBase):
+    """Widok pocisku z ProjectileSystem zgodny z Bullet (rysowanie, prostokąty, skrót stanu)."""
+    __slots__ = ("system", "index")
+
+    def __init__(self, system, index):
+        self.system = system
+        self.index = index
+
+    x = projectile_field("x")
+    y = projectile_field("y")
+    damage = projectile_field("damage")
+    anim_index = projectile_field("anim_index", int)
+
+    @property
+    def target(self):
+        return self.system.targets[self.index]
+
+    @property
+    def target_generation(self):
+        return self.system.generations[self.index]
+
+    @property
+    def anim(self):
+        return self.system.anims[self.index]
+
+    @property
+    def anim_kind(self):
+        return self.system.kinds[self.index]
+
+    def update(self, dt):
+        """Pociski z systemu są aktualizowane zbiorczo przez ProjectileSystem.update."""
+        pass
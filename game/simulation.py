@@ -0,0 +1,371 @@
+# game/simulation.py
+
+import random, math, hashlib, struct
+
+from config import START_GOLD, START_HP, TOTAL_TOWER_NUMBER, MAX_STEPS_PER_FRAME, WAVE_PREWARM, \
+WAVE_PREWARM_PER_STEP
+from game.level import TOWER_SLOTS
+from game.content import ENEMY_DAMAGE, ENEMY_REWARDS, TOWER_BASE_COST, MAX_UPGRADE_LEVEL, \
+EVOLUTION_EXTRA_COST, EVOLUTION_LEVEL, WAVE_SPAWN_DELAY, WAVE_DELAY
+from game.tower import Tower
+from game.assets import play_sound, ASSETS, AUDIO
+from game.spatial import SpatialHash
+from game.enemy_store import EnemyStore
+from game.projectiles import ProjectileSystem, BulletList
+from game.pool import acquire, release, pool_for, pool_stats
+from game.waves import wave_schedule, expected_enemies
+
+# Fazy kroku symulacji w kolejności wykonywania (nazwy metod)
+STEP_PHASES = ("update_enemies", "update_towers", "update_wave_timers", "update_spawn_queue",
+               "update_bullets")
+
+
+class Simulation:
+    """Rdzeń rozgrywki bez renderowania i dźwięku.
+
+    Obsługuje przeciwników, wieże, pociski, strefy ognia, kolejkę pojawiania się
+    wrogów i liczniki fal. Stan gry zmienia się wyłącznie przez step(dt), dzięki
+    czemu symulację można uruchomić bez okna (assets=False) i szybciej niż 60 FPS.
+
+    Tryb deterministyczny: seed ustawia własny generator losowy symulacji,
+    a fixed_dt sprawia, że advance() dzieli czas rzeczywisty na kroki stałej
+    długości. Ten sam seed i te same akcje gracza dają wtedy identyczny stan
+    w każdym kroku (patrz state_hash)."""
+    def __init__(self, difficulty = "Normal", assets = True, seed = None, fixed_dt = None,
+                 record_hashes = False, enemy_store = False, batched_bullets = False):
+        self.headless = not assets
+        if self.headless:
+            ASSETS.set_headless(True) # animacje bez grafik - wystarczy liczba klatek
+
+        # Bez seeda używany jest globalny generator modułu random
+        self.seed = seed
+        self.rng = random.Random(seed) if seed is not None else random
+        self.fixed_dt = fixed_dt
+        self.accumulator = 0.0 # niewykorzystany czas rzeczywisty (tryb stałego kroku)
+        self.record_hashes = record_hashes
+        self.state_hashes = [] # skrót stanu po każdym kroku (gdy record_hashes)
+
+        self.difficulty = difficulty
+        self.gold = START_GOLD
+        self.hp = START_HP
+        self.score = 0
+        self.wave_number = 1
+
+        self.enemies = []  # lista przeciwników
+        self.towers = []   # lista wież
+        self.bullets = ProjectileSystem() if batched_bullets else BulletList()  # pociski
+        self.spawn_schedule = iter(()) # harmonogram bieżącej fali (generator z game.waves)
+        self.next_spawn = None # następna para (odstęp, klasa przeciwnika) albo None po końcu fali
+        self.prewarm = WAVE_PREWARM
+
+        # Opcjonalny magazyn przeciwników w tablicach NumPy (zastępuje też siatkę)
+        self.enemy_store = EnemyStore() if enemy_store else None
+        self.enemy_grid = self.enemy_store if enemy_store else SpatialHash() # wyszukiwanie wrogów w zasięgu
+
+        self.spawn_cooldown = 0
+        self.spawn_delay = WAVE_SPAWN_DELAY  # sekundy między kolejnymi przeciwnikami
+        self.wave_timer = 1  # czas do kolejnej fali
+        self.wave_delay = WAVE_DELAY # domyślny czas między falami
+        self.waiting_for_wave = False
+
+        self.max_towers = TOTAL_TOWER_NUMBER #Liczba wież do postawienia
+        self.used_slots = []
+
+        self.time = 0.0 # czas symulacji w sekundach
+        self.ticks = 0  # liczba wykonanych kroków
+
+        self.spawn_wave() # Rozpoczęcie fali
+
+    def step(self, dt):
+        """Wykonuje jeden krok symulacji o długości dt sekund (fazy w kolejności STEP_PHASES)."""
+        for phase in STEP_PHASES:
+            self.run_phase(phase, dt)
+        self.finish_step(dt)
+
+    def run_phase(self, phase, dt):
+        """Wykonuje jedną fazę kroku symulacji (GameManager mierzy ją tu profilerem)."""
+        getattr(self, phase)(dt)
+
+    def finish_step(self, dt):
+        """Zamyka krok symulacji: przesuwa czas i licznik kroków, zapisuje skrót stanu."""
+        self.time += dt
+        self.ticks += 1
+        if self.headless:
+            AUDIO.discard() # bez okna nikt nie wywoła AUDIO.flush() - zgłoszenia nie mogą się zbierać
+
+        if self.record_hashes:
+            self.state_hashes.append(self.state_hash())
+
+    def advance(self, dt):
+        """Przesuwa symulację o czas rzeczywisty dt. Zwraca liczbę wykonanych kroków.
+
+        Bez fixed_dt wykonuje jeden krok o długości dt. Ze stałym krokiem wykonuje
+        tyle kroków fixed_dt, ile mieści się w zgromadzonym czasie (maksymalnie
+        MAX_STEPS_PER_FRAME - nadwyżka jest porzucana, tak jak wcześniej dt > 0.1)."""
+        if self.fixed_dt is None:
+            self.step(dt)
+            return 1
+
+        self.accumulator += dt
+        steps = 0
+        while self.accumulator >= self.fixed_dt:
+            if steps >= MAX_STEPS_PER_FRAME:
+                self.accumulator = 0.0
+                break
+            self.step(self.fixed_dt)
+            self.accumulator -= self.fixed_dt
+            steps += 1
+        return steps
+
+    def run(self, ticks, dt = None):
+        """Wykonuje podaną liczbę kroków symulacji (lub do przegranej)."""
+        if dt is None:
+            dt = self.fixed_dt or 1 / 60
+        for _ in range(ticks):
+            if self.is_over():
+                break
+            self.step(dt)
+
+    def state_hash(self):
+        """Zwraca skrót stanu gry (złoto, HP, punkty, fala, wieże, przeciwnicy, pociski).
+
+        Liczby zmiennoprzecinkowe są haszowane bitowo, a skrót obejmuje wszystkie
+        pola, od których zależą kolejne kroki (także stan i liczniki przeciwników
+        oraz cele pocisków), więc identyczny skrót oznacza identyczny stan."""
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(struct.pack("<qdqqqq", self.ticks, self.time, int(self.gold), int(self.hp),
+                                  int(self.score), int(self.wave_number)))
+        for tower in self.towers:
+            digest.update(type(tower).__name__.encode())
+            digest.update(struct.pack("<dddqd", tower.x, tower.y, tower.range, tower.level, tower.cooldown))
+        positions = {}
+        for i, enemy in enumerate(self.enemies):
+            positions[id(enemy)] = i
+            digest.update(f"{enemy.name}/{enemy.state}".encode())
+            digest.update(struct.pack("<ddddddd", enemy.x, enemy.y, enemy.distance, enemy.hp, enemy.speed_factor,
+                                      enemy.slow_timer, enemy.death_timer))
+        for bullet in self.bullets:
+            # Cel jako numer przeciwnika na liście (-1: cel zniknął lub obiekt został użyty ponownie)
+            target = bullet.target
+            current = target is not None and target.generation == bullet.target_generation
+            target_index = positions.get(id(target), -1) if current else -1
+            digest.update(struct.pack("<dddq", bullet.x, bullet.y, bullet.damage, target_index))
+        return digest.hexdigest()
+
+    def is_over(self):
+        """Sprawdza czy gracz przegrał."""
+        return self.hp <= 0
+
+    def update_towers(self, dt):
+        """Aktualizuje wieże (wraz z ich strefami ognia)."""
+        self.enemy_grid.rebuild(self.enemies)
+        for tower in self.towers:
+            tower.update(dt, self.enemies, self.bullets, self.enemy_grid)
+
+    def update_bullets(self, dt):
+        """Aktualizuje pociski i usuwa te, które trafiły."""
+        self.bullets.update(dt)
+
+    def update_enemies(self, dt):
+        """Aktualizuje wrogów, usuwa zabitych i nalicza nagrody."""
+        if self.enemy_store is not None:
+            damage, gold_reward, score_reward, killed = self.enemy_store.update(dt)
+            self.hp -= damage
+            self.gold += gold_reward
+            self.score += score_reward
+            if killed:
+                play_sound("enemy_death", killed)
+            self.enemies = self.enemy_store.enemies()
+            return
+
+        # Usuwanie w miejscu (bez nowej listy), usunięci przeciwnicy wracają do puli
+        # Obrażenia i nagrody z tablic treści gry, indeks: numer typu przeciwnika
+        enemies = self.enemies
+        kept = 0
+        enemy_dmg = ENEMY_DAMAGE
+        enemy_drop = ENEMY_REWARDS
+
+        for enemy in enemies:
+            enemy.update(dt)
+
+            # przeciwnik dotarł do końca - zadaj dmg
+            if enemy.reached_end:
+                self.hp -= enemy_dmg[enemy.type_id]
+                release(enemy)
+                continue
+
+            # Pokonanie przeciwnika - dodaj nagrody
+            if enemy.is_dead():
+                gold_reward, score_reward = enemy_drop[enemy.type_id]
+                self.gold += gold_reward
+                self.score += score_reward
+                release(enemy)
+            else:
+                enemies[kept] = enemy
+                kept += 1
+        del enemies[kept:]
+
+    def update_wave_timers(self, dt):
+        """Obsługuje licznik fali i uruchamianie nowej fali."""
+
+        if not self.enemies and not self.waiting_for_wave and self.next_spawn is None:
+            play_sound("wave_cleared")
+            self.waiting_for_wave = True
+            self.wave_timer = self.wave_delay
+
+        if self.waiting_for_wave:
+            if self.prewarm:
+                self.prewarm_wave(self.wave_number + 1)
+            self.wave_timer -= dt
+            if self.wave_timer <= 0:
+                self.wave_number += 1
+                self.spawn_wave()
+                self.waiting_for_wave = False
+
+    def update_spawn_queue(self, dt):
+        """Stopniowo wypuszcza przeciwników z harmonogramu fali (tworząc ich dopiero teraz)."""
+        if self.next_spawn is not None:
+            self.spawn_cooldown -= dt
+            if self.spawn_cooldown <= 0:
+                delay, enemy_type = self.next_spawn
+                self.add_enemy(acquire(enemy_type, difficulty=self.difficulty))
+                self.spawn_cooldown = delay
+                self.next_spawn = next(self.spawn_schedule, None)
+
+    def prewarm_wave(self, wave_number):
+        """Tworzy w pulach przeciwników na zapas dla podanej fali (kilku na krok)."""
+        budget = WAVE_PREWARM_PER_STEP
+        for enemy_type, count in expected_enemies(wave_number).items():
+            budget -= pool_for(enemy_type).prewarm(count, limit=budget, difficulty=self.difficulty)
+            if budget <= 0:
+                break
+
+    def add_enemy(self, enemy):
+        """Wprowadza przeciwnika na planszę."""
+        if self.enemy_store is not None:
+            self.enemy_store.add(enemy, ENEMY_DAMAGE[enemy.type_id], ENEMY_REWARDS[enemy.type_id])
+            self.enemies = self.enemy_store.enemies()
+            release(enemy) # stan został skopiowany do magazynu
+        else:
+            self.enemies.append(enemy)
+
+    def spawn_wave(self):
+        """Rozpoczyna nową falę przeciwników (przeciwnicy tworzeni są dopiero przy pojawieniu się)."""
+        play_sound("wave_start")
+
+        self.spawn_schedule = wave_schedule(self.wave_number, self.rng, lambda: self.spawn_delay)
+        self.next_spawn = next(self.spawn_schedule, None)
+
+    def tower_at(self, x, y):
+        """Zwraca wieżę znajdującą się w podanym punkcie (lub None)."""
+        for tower in self.towers:
+            if math.hypot(tower.x - x, tower.y - y) <= tower.radius:
+                return tower
+        return None
+
+    def build_tower(self, x, y):
+        """Buduje wieżę w najbliższym wolnym slocie. Zwraca wieżę lub None."""
+        closest_slot = min(TOWER_SLOTS, key=lambda pos: math.hypot(pos[0] - x, pos[1] - y))
+        if closest_slot not in self.used_slots \
+            and math.hypot(closest_slot[0] - x, closest_slot[1] - y) < 40 \
+            and self.gold >= TOWER_BASE_COST \
+            and len(self.towers) < self.max_towers:
+
+            self.gold -= TOWER_BASE_COST
+            tower = Tower(*closest_slot)
+            self.towers.append(tower)
+            self.used_slots.append(closest_slot)
+            return tower
+        return None
+
+    def sell_tower(self, tower):
+        """Sprzedaje wieżę i zwalnia jej slot."""
+        self.gold += tower.sell_value() # dodanie wartości sprzedaży do posiadanych środków
+        slot_pos = (tower.x, tower.y)
+        if slot_pos in self.used_slots:
+            self.used_slots.remove(slot_pos) # zwolnienie slota
+        self.towers.remove(tower) # usunięcie wieży
+        tower.release_pooled() # strefy ognia wracają do puli
+
+    def upgrade_tower(self, tower):
+        """Ulepsza wieżę, jeśli gracza na to stać. Zwraca True przy powodzeniu."""
+        if tower.level < MAX_UPGRADE_LEVEL and self.gold >= tower.upgrade_cost:
+            self.gold -= tower.upgrade_cost
+            tower.upgrade()
+            return True
+        return False
+
+    def can_evolve(self, tower):
+        """Sprawdza czy wieżę można ewoluować."""
+        return tower.level == MAX_UPGRADE_LEVEL and self.gold >= tower.upgrade_cost + EVOLUTION_EXTRA_COST
+
+    def evolve_tower(self, tower, type_name):
+        """Ewoluuje wieżę do wybranego typu. Zwraca nową wieżę."""
+        for i, current in enumerate(self.towers):
+            if current is tower:
+                evolved = tower.evolve(type_name)
+                evolved.level = EVOLUTION_LEVEL
+                self.gold -= tower.upgrade_cost + EVOLUTION_EXTRA_COST
+                self.towers[i] = evolved
+                if evolved is not tower:
+                    tower.release_pooled()
+                return evolved
+        return None
+
+
+if __name__ == "__main__":
+    # Szybki przebieg symulacji bez okna i dźwięku, np.:
+    #   python -m game.simulation --ticks 100000 --difficulty Hard --towers 10
+    import argparse, time
+
+    parser = argparse.ArgumentParser(description="Symulacja rozgrywki bez renderowania.")
+    parser.add_argument("--ticks", type=int, default=60 * 60 * 10)
+    parser.add_argument("--dt", type=float, default=1 / 60)
+    parser.add_argument("--difficulty", default="Normal", choices=["Normal", "Hard"])
+    parser.add_argument("--towers", type=int, default=0, help="liczba wież budowanych na start")
+    parser.add_argument("--seed", type=int, default=None, help="seed trybu deterministycznego")
+    parser.add_argument("--enemy-store", action="store_true", help="przeciwnicy w tablicach NumPy")
+    parser.add_argument("--batched-bullets", action="store_true", help="pociski w tablicach NumPy")
+    parser.add_argument("--compare-store", action="store_true",
+                        help="porównuje skrót stanu po każdym kroku z przeciwnikami w liście i w EnemyStore")
+    args = parser.parse_args()
+
+    def build_simulation(enemy_store, record_hashes = False):
+        """Tworzy symulację z opcjami z linii poleceń i buduje wieże startowe."""
+        sim = Simulation(args.difficulty, assets=False, seed=args.seed, fixed_dt=args.dt,
+                         record_hashes=record_hashes, enemy_store=enemy_store,
+                         batched_bullets=args.batched_bullets)
+        sim.gold += TOWER_BASE_COST * args.towers
+        for slot in TOWER_SLOTS[:args.towers]:
+            sim.build_tower(*slot)
+        return sim
+
+    if args.compare_store:
+        # Ta sama partia z listą obiektów Enemy i z EnemyStore musi dawać bitowo ten sam stan
+        if args.seed is None:
+            parser.error("--compare-store wymaga --seed")
+        runs = []
+        for enemy_store in (False, True):
+            sim = build_simulation(enemy_store, record_hashes=True)
+            sim.run(args.ticks, args.dt)
+            runs.append(sim.state_hashes)
+        mismatch = next((tick for tick, (a, b) in enumerate(zip(*runs), 1) if a != b), None)
+        if mismatch is None and len(runs[0]) == len(runs[1]):
+            print(f"lista i EnemyStore: identyczny stan przez {len(runs[0])} kroków ({runs[0][-1]})")
+        else:
+            print(f"lista i EnemyStore: stan różni się od kroku {mismatch or min(map(len, runs)) + 1}")
+            raise SystemExit(1)
+        raise SystemExit(0)
+
+    sim = build_simulation(args.enemy_store)
+
+    start = time.perf_counter()
+    sim.run(args.ticks, args.dt)
+    elapsed = time.perf_counter() - start
+
+    print(f"ticks: {sim.ticks}  ({sim.ticks / elapsed:.0f} ticks/s)")
+    print(f"wave: {sim.wave_number}  hp: {sim.hp}  gold: {sim.gold}  score: {sim.score}")
+    print(f"state hash: {sim.state_hash()}")
+    for name, stats in pool_stats().items():
+        print(f"pool {name}: utworzono {stats['created']} (na zapas {stats['prewarmed']}), "
+              f"ponownie użyto {stats['reused']}, w puli {stats['free']}")
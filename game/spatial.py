@@ -0,0 +1,97 @@
+# game/spatial.py
+
+import math
+from config import TILE_SIZE
+
+
+class SpatialHash:
+    """Równomierna siatka przestrzenna przyspieszająca wyszukiwanie przeciwników w pobliżu.
+
+    Komórki mają rozmiar kafelka mapy (TILE_SIZE). Siatka jest przebudowywana
+    raz na krok symulacji, a zapytania zwracają obiekty w kolejności z listy
+    źródłowej - dzięki temu wybór celu (np. min po HP) działa tak samo jak
+    przy przeszukiwaniu całej listy."""
+    def __init__(self, cell_size=TILE_SIZE):
+        self.cell_size = cell_size
+        self.cells = {}
+        self.items = []
+
+    def __len__(self):
+        return len(self.items)
+
+    def cell_of(self, x, y):
+        """Zwraca współrzędne komórki zawierającej punkt."""
+        return int(x // self.cell_size), int(y // self.cell_size)
+
+    def rebuild(self, items):
+        """Buduje siatkę od nowa na podstawie aktualnych pozycji obiektów."""
+        cells = {}
+        size = self.cell_size
+        for index, item in enumerate(items):
+            key = (int(item.x // size), int(item.y // size))
+            cell = cells.get(key)
+            if cell is None:
+                cells[key] = [index]
+            else:
+                cell.append(index)
+        self.cells = cells
+        self.items = items
+
+    def query_radius(self, x, y, radius):
+        """Zwraca obiekty w odległości nie większej niż radius od punktu."""
+        min_cx, min_cy = self.cell_of(x - radius, y - radius)
+        max_cx, max_cy = self.cell_of(x + radius, y + radius)
+        span = (max_cx - min_cx + 1) * (max_cy - min_cy + 1)
+
+        # Przy niewielu zajętych komórkach taniej jest przejrzeć tylko je
+        if len(self.cells) < span:
+            candidate_cells = [cell for (cx, cy), cell in self.cells.items()
+                               if min_cx <= cx <= max_cx and min_cy <= cy <= max_cy]
+        else:
+            candidate_cells = []
+            for cx in range(min_cx, max_cx + 1):
+                for cy in range(min_cy, max_cy + 1):
+                    cell = self.cells.get((cx, cy))
+                    if cell:
+                        candidate_cells.append(cell)
+
+        items = self.items
+        found = []
+        for cell in candidate_cells:
+            for index in cell:
+                item = items[index]
+                if math.hypot(item.x - x, item.y - y) <= radius:
+                    found.append(index)
+
+        found.sort()
+        return [items[index] for index in found]
+
+    def nearest(self, x, y, radius=None):
+        """Zwraca najbliższy obiekt (opcjonalnie w zadanym promieniu) lub None."""
+        if radius is not None:
+            candidates = self.query_radius(x, y, radius)
+        elif not self.items:
+            return None
+        else:
+            # Podwajanie promienia aż do znalezienia kandydatów - obiekt spoza
+            # promienia nie może być bliżej niż któryś ze znalezionych
+            search = self.cell_size
+            candidates = self.query_radius(x, y, search)
+            while not candidates:
+                search *= 2
+                candidates = self.query_radius(x, y, search)
+        return min(candidates, key=lambda item: math.hypot(item.x - x, item.y - y), default=None)
+
+    def lowest_hp(self, x, y, radius, alive_only=True, unslowed_only=False):
+        """Zwraca obiekt w promieniu o najmniejszym HP (przy remisie - pierwszy z listy)."""
+        candidates = self.query_radius(x, y, radius)
+        if alive_only:
+            candidates = [item for item in candidates if item.hp > 0]
+        if unslowed_only:
+            candidates = [item for item in candidates if item.slow_timer <= 0]
+        return min(candidates, key=lambda item: item.hp, default=None)
+
+    def damage_in_radius(self, x, y, radius, amount):
+        """Odejmuje amount HP wszystkim obiektom w promieniu."""
+        for item in self.query_radius(x, y, radius):
+            item.hp -= amount
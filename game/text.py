@@ -0,0 +1,82 @@
+# game/text.py
+
+import pygame
+from collections import OrderedDict
+
+from config import TEXT_CACHE_SIZE
+
+
+# Czcionki wczytane przez SysFont, klucz: (nazwa, rozmiar)
+FONTS = {}
+
+def get_font(name, size):
+    """Zwraca czcionkę systemową, wyszukując ją tylko za pierwszym razem."""
+    key = (name, size)
+    font = FONTS.get(key)
+    if font is None:
+        font = FONTS[key] = pygame.font.SysFont(name, size)
+    return font
+
+
+class TextCache:
+    """Pamięć podręczna wyrenderowanych napisów z usuwaniem najdawniej używanych (LRU).
+
+    Kluczem jest (czcionka, tekst, kolor, przezroczystość). Zwracane powierzchnie
+    są współdzielone - nie wolno ich modyfikować (np. set_alpha), przezroczystość
+    podaje się parametrem alpha."""
+    def __init__(self, max_entries = TEXT_CACHE_SIZE):
+        self.max_entries = max_entries
+        self.entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def render(self, font, text, color, alpha = None):
+        """Zwraca napis wyrenderowany czcionką font = (nazwa, rozmiar)."""
+        key = (font, text, color, alpha)
+        surface = self.entries.get(key)
+        if surface is not None:
+            self.hits += 1
+            self.entries.move_to_end(key)
+            return surface
+
+        self.misses += 1
+        surface = get_font(*font).render(text, True, color)
+        if alpha is not None:
+            surface.set_alpha(alpha)
+
+        self.entries[key] = surface
+        if len(self.entries) > self.max_entries:
+            self.entries.popitem(last=False)
+            self.evictions += 1
+        return surface
+
+    def stats(self):
+        """Zwraca statystyki pamięci podręcznej."""
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self.entries),
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+        }
+
+    def reset_stats(self):
+        """Zeruje liczniki trafień, chybień i usunięć."""
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def clear(self):
+        """Usuwa wszystkie napisy z pamięci."""
+        self.entries.clear()
+
+
+# Globalna pamięć napisów współdzielona przez całą grę
+TEXT = TextCache()
+
+
+def render_text(font, text, color, alpha = None):
+    """Zwraca napis z globalnej pamięci podręcznej TEXT."""
+    return TEXT.render(font, text, color, alpha)
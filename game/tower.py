@@ -3,46 +3,110 @@
 import pygame, math, os
 from game.effects import FireZone
 from game.bullet import Bullet, IceBullet, ARROW_ANIMATIONS
-from config import TOWER_BASE_COST
-from game.assets import SOUNDS
+from game.content import TOWER_IDS, TOWER_RANGE, TOWER_DAMAGE, TOWER_RELOAD, TOWER_SLOW_DURATION, \
+TOWER_SLOW_FACTOR, TOWER_BASE_COST, MAX_UPGRADE_LEVEL, UPGRADE_FIRST_COST, UPGRADE_COST_STEP, \
+UPGRADE_RANGE, UPGRADE_DAMAGE, UPGRADE_RELOAD, UPGRADE_TOTALS, SELL_REFUND
+from game.assets import play_sound, ASSETS, load_strip_frames, mirror_frames
+from game.coverage import range_circle
+from game.text import render_text
+from game.pool import acquire, release, compact
 
 BASE_FRAME_WIDTH = 70
 BASE_FRAME_HEIGHT = 70
 ANIMATION_SPEED = 0.15
 ARCHER_FRAME_WIDTH = ARCHER_FRAME_HEIGHT = 48
 
+def tower_image_paths():
+    """Zwraca istniejące arkusze wież: ({poziom: ścieżka podstawy}, {akcja_kierunek: ścieżka łucznika})."""
+    base_paths = {lvl: f"images/towers/{lvl}.png" for lvl in range(1, 5)
+                  if os.path.exists(f"images/towers/{lvl}.png")}
+    archer_paths = {}
+    for action in ["attack", "idle"]:
+        for direction in ["down", "left", "up"]:
+            key = f"{action}_{direction}"
+            path = f"images/towers/archer/{key}.png"
+            if os.path.exists(path):
+                archer_paths[key] = path
+    return base_paths, archer_paths
+
+
+def load_tower_images():
+    """Zwraca (wczytując raz) animacje podstaw wież i łucznika."""
+    def build():
+        base_animations = []
+        archer_animations = {}
+        base_paths, archer_paths = tower_image_paths()
+
+        # Wczytaj obrazy podstawy
+        for lvl, path in base_paths.items():
+            # Określ liczbę klatek na podstawie poziomu
+            frames_count = 4 if lvl in [1, 2] else 6
+            base_animations.append(load_strip_frames(path, frames_count))
+
+        # Wczytaj animacje łucznika
+        actions = ["attack", "idle"]
+        directions = ["down", "left", "up"]
+
+        for action in actions:
+            for direction in directions:
+                key = f"{action}_{direction}"
+                if key in archer_paths:
+                    # Określ liczbę klatek na podstawie akcji
+                    frames_number = 4 if action == "idle" else 6
+                    archer_animations[key] = load_strip_frames(archer_paths[key], frames_number)
+
+            # Łucznik celujący w prawo to odbita raz animacja w lewo
+            if f"{action}_left" in archer_animations:
+                archer_animations[f"{action}_right"] = mirror_frames(archer_animations[f"{action}_left"])
+
+        return base_animations, archer_animations
+    return ASSETS.get(("tower",), build)
+
+
 class Tower:
     """Klasa bazowa wieży"""
+    __slots__ = ("x", "y", "range", "damage", "reload_time", "fire_rate", "level", "upgrade_cost",
+                 "cooldown", "shot_pending", "target_pending", "target_generation", "bullets_pending",
+                 "archer_state", "archer_direction", "archer_frame", "archer_animation_timer",
+                 "archer_offset_y", "base_animation_timer", "base_frame", "base_animations",
+                 "archer_animations")
+
+    # Dane wspólne dla wszystkich wież danego typu
+    type_id = TOWER_IDS["Tower"] # numer typu w tablicach game.content
+    radius = 20
+    shot_frame = 2 # klatka animacji ataku, w której wylatuje strzała
+    archer_offsets_y = \
+    {
+        1: -24,
+        2: -32,
+        3: -32,
+        4: -32
+    } #offsety łucznika względem podstawy
+
     def __init__(self, x, y):
         self.x = x
         self.y = y
-        self.range = 120
-        self.damage = 40
-        self.reload_time = 1.0  # sekundy między strzałami
+
+        # Statystyki typu z tablic treści gry
+        type_id = self.type_id
+        self.range = TOWER_RANGE[type_id]
+        self.damage = TOWER_DAMAGE[type_id]
+        self.reload_time = TOWER_RELOAD[type_id]  # sekundy między strzałami
         self.fire_rate = 1 / self.reload_time
 
-        self.radius = 20
         self.level = 1
-        self.upgrade_cost = 50
+        self.upgrade_cost = UPGRADE_FIRST_COST
         self.cooldown = 0.0
 
         self.shot_pending = False
         self.target_pending = None
+        self.target_generation = None # pokolenie celu z chwili wycelowania
         self.bullets_pending = None
-        self.shot_frame = 2
 
         self.archer_state = "idle"
         self.archer_direction = "down"
-        self.archer_flipped = False
         self.archer_frame = 0
         self.archer_animation_timer= 0
-        self.archer_offsets_y = \
-        {
-            1: -24,
-            2: -32,
-            3: -32,
-            4: -32
-        } #offsety łucznika względem podstawy
         self.archer_offset_y = self.archer_offsets_y.get(self.level, -32)
 
         self.base_animation_timer = 0
@@ -53,48 +117,8 @@ class Tower:
         self.load_images()
 
     def load_images(self):
-        """Wczytuje animacje podstawy i łucznika z plików."""
-
-        # Wczytaj obrazy podstawy
-        for lvl in range(1, 5):
-            path = f"images/towers/{lvl}.png"
-            if os.path.exists(path):
-                img = pygame.image.load(path).convert_alpha()
-                frames = []
-
-                # Określ liczbę klatek na podstawie poziomu
-                frames_count = 4 if lvl in [1, 2] else 6
-                frame_width = img.get_width() // frames_count
-                frame_height = img.get_height()
-                
-                for i in range(frames_count):
-                    frame = img.subsurface((i * frame_width, 0, frame_width, frame_height))
-                    frames.append(frame)
-                
-                self.base_animations.append(frames)
-
-        # Wczytaj animacje łucznika
-        actions = ["attack", "idle"]
-        directions = ["down", "left", "up"]
-
-        for action in actions:
-            for direction in directions:
-                key = f"{action}_{direction}"
-                path = f"images/towers/archer/{key}.png"
-
-                if os.path.exists(path):
-                    img = pygame.image.load(path).convert_alpha()
-                    
-                    # Określ liczbę klatek na podstawie akcji
-                    frames_number = 4 if action == "idle" else 6
-                    frame_width = img.get_width() // frames_number
-
-                    frames = []
-                    for i in range(frames_number):
-                        frame = img.subsurface((i * frame_width, 0, frame_width, img.get_height()))
-                        frames.append(frame)
-                    
-                    self.archer_animations[key] = frames
+        """Pobiera współdzielone animacje podstawy i łucznika z rejestru grafik."""
+        self.base_animations, self.archer_animations = load_tower_images()
 
     def get_base_animation(self):
         """Zwraca obraz podstawy odpowiedni dla poziomu wieży"""
@@ -114,11 +138,9 @@ class Tower:
         dy = target.y - self.y
         
         if abs(dx) > abs(dy):
-            self.archer_direction = "left"
-            self.archer_flipped = dx > 0
+            self.archer_direction = "right" if dx > 0 else "left"
         else:
             self.archer_direction = "up" if dy < 0 else "down"
-            self.archer_flipped = False
 
     def update_animation(self, dt):
         """Aktualizuje stan animacji"""
@@ -139,7 +161,9 @@ class Tower:
 
             if self.archer_state == "attack" and self.archer_frame == self.shot_frame:
                 if self.shot_pending and self.target_pending:
-                    self.fire_at_target(self.target_pending, self.bullets_pending)
+                    # Cel, który w międzyczasie wrócił do puli i został użyty ponownie, jest nieaktualny
+                    if self.target_pending.generation == self.target_generation:
+                        self.fire_at_target(self.target_pending, self.bullets_pending)
                     self.cooldown = 1 / self.fire_rate
                     self.shot_pending = False
                     self.target_pending = None
@@ -149,29 +173,30 @@ class Tower:
                 self.archer_state = "idle"
                 self.archer_frame = 0
 
-    def update(self, dt, enemies, bullets=None):
-        """Aktualizuje stan wieży."""
+    def update(self, dt, enemies, bullets=None, grid=None):
+        """Aktualizuje stan wieży (grid - opcjonalna siatka przestrzenna przeciwników)."""
         self.bullets_pending = bullets
         # animacja łucznika
         self.cooldown -= dt
         self.update_animation(dt)
 
         if self.cooldown <= 0 and not self.shot_pending:
-            target = self.get_target(enemies)
+            target = self.get_target(enemies, grid)
             if target: #and not self.shot_pending:
                 self.set_direction(target)
                 self.archer_state = "attack"
                 self.archer_frame = 0
                 self.target_pending = target
+                self.target_generation = target.generation
                 self.shot_pending = True
 
     def fire_at_target(self, target, bullets):
         """Tworzy pocisk w kierunku celu"""
-        SOUNDS["arrow"].play()
+        play_sound("arrow")
         if bullets is not None:
             # Oblicz pozycję startową pocisku
             start_x, start_y = self.get_bullet_start_pos()
-            bullets.append(Bullet(start_x, start_y, target, damage=self.damage))
+            bullets.append(acquire(Bullet, start_x, start_y, target, damage=self.damage))
 
     def get_bullet_start_pos(self):
         """Zwraca pozycję startową pocisku"""
@@ -184,15 +209,17 @@ class Tower:
         elif self.archer_direction == "down":
             y += 10
         elif self.archer_direction == "left":
-            if self.archer_flipped:
-                x += 20
-            else:
-                x -= 25
+            x -= 25
+        elif self.archer_direction == "right":
+            x += 20
             
         return x, y
 
-    def get_target(self, enemies):
+    def get_target(self, enemies, grid=None):
         """Wybiera cel w zasięgu o najmniejszym HP."""
+        if grid is not None:
+            return grid.lowest_hp(self.x, self.y, self.range)
+
         enemies_in_range = [ e for e in enemies if e.hp > 0 and self.distance_to(e) <= self.range]
         return min(enemies_in_range, key=lambda e: e.hp, default=None)
        
@@ -202,26 +229,17 @@ class Tower:
 
     def sell_value(self):
         """Oblicza wartość sprzedaży wieży."""
-        base = TOWER_BASE_COST
-        upgrades_total = 0
-
-        if self.level >= 2:
-            upgrades_total += 50
-        if self.level >= 3:
-            upgrades_total += 100
-        if self.level == 4:
-            upgrades_total += 200
-
-        return int(base + upgrades_total * 0.5) #baza + 50% ulepszeń
+        upgrades_total = UPGRADE_TOTALS[self.level] # łączny koszt ulepszeń do obecnego poziomu
+        return int(TOWER_BASE_COST + upgrades_total * SELL_REFUND) #baza + część kosztu ulepszeń
 
     def upgrade(self):
         """Ulepsza wieżę na wyższy poziom."""
-        if self.level < 3:
+        if self.level < MAX_UPGRADE_LEVEL:
             self.level += 1
-            self.range *= 1.2
-            self.damage *= 1.2
-            self.reload_time *= 0.9  # szybciej strzela
-            self.upgrade_cost += 50  # wzrost kosztu kolejnego ulepszenia
+            self.range *= UPGRADE_RANGE
+            self.damage *= UPGRADE_DAMAGE
+            self.reload_time *= UPGRADE_RELOAD  # szybciej strzela
+            self.upgrade_cost += UPGRADE_COST_STEP  # wzrost kosztu kolejnego ulepszenia
             self.fire_rate = 1 / self.reload_time
 
             # Reset stanu animacji
@@ -240,57 +258,72 @@ class Tower:
         elif type_name == "SpeedyTower":
             return SpeedyTower(self.x, self.y)
         return self
+
+    def release_pooled(self):
+        """Oddaje do pul obiekty należące do wieży (przy sprzedaży lub ewolucji)."""
+        pass
     
-    def draw(self, screen):
-        """Rysuje wieżę na ekranie."""
-        self.draw_base(screen)
-        self.draw_archer(screen)
-        self.draw_level(screen)
-        self.draw_range(screen)
+    def draw(self, screen, offset = (0, 0)):
+        """Rysuje wieżę na ekranie (offset - pozycja kamery na mapie)."""
+        self.draw_base(screen, offset)
+        self.draw_archer(screen, offset)
+        self.draw_level(screen, offset)
     
-    def draw_base(self, screen):
+    def draw_base(self, screen, offset = (0, 0)):
         """Rysuje podstawę wieży."""
         base_animation = self.get_base_animation()
         if base_animation:
             frame = base_animation[self.base_frame % len(base_animation)]
-            base_rect = frame.get_rect(midbottom=(int(self.x - 1), int(self.y + 29)))
+            base_rect = frame.get_rect(midbottom=(int(self.x - 1) - offset[0], int(self.y + 29) - offset[1]))
             screen.blit(frame, base_rect)
 
 
-    def draw_archer(self, screen):
+    def draw_archer(self, screen, offset = (0, 0)):
         """Rysuje łucznika na szczycie wieży."""
         frames = self.get_archer_animation()
         self.archer_offset_y = self.archer_offsets_y.get(self.level, -32)
         if frames:
             frame = frames[self.archer_frame % len(frames)]
-
-            # Odbicie lustrzane dla prawej strony
-            if self.archer_flipped:
-                frame = pygame.transform.flip(frame, True, False)
-
-            archer_rect = frame.get_rect(center=(int(self.x - 1), int(self.y + self.archer_offset_y)))
+            archer_rect = frame.get_rect(center=(int(self.x - 1) - offset[0],
+                                                 int(self.y + self.archer_offset_y) - offset[1]))
             screen.blit(frame, archer_rect)
         
 
-    def draw_level(self, screen):
+    def level_text(self):
+        """Zwraca napis z poziomem wieży."""
+        return render_text(("arial", 16), f"Lv{self.level}", (255, 255, 255))
+
+    def draw_level(self, screen, offset = (0, 0)):
         """Rysuje aktualny poziom wieży."""
-        font = pygame.font.SysFont("arial", 16)
-        level_text = font.render(f"Lv{self.level}", True, (255, 255, 255))
-        screen.blit(level_text, (self.x - 10, self.y - 10))
+        screen.blit(self.level_text(), (self.x - 10 - offset[0], self.y - 10 - offset[1]))
 
     def draw_range(self, screen):
-        """Rysuje zasięg wieży jako półprzezroczyste koło."""
-        surface = pygame.Surface((self.range*2, self.range*2), pygame.SRCALPHA)
-        pygame.draw.circle(surface, (0, 100, 255, 40), (self.range, self.range), self.range)
-        screen.blit(surface, (self.x - self.range, self.y - self.range))
+        """Rysuje zasięg wieży jako półprzezroczyste koło.
+
+        W grze zasięgi rysuje CoverageOverlay (jedna warstwa dla wszystkich wież)."""
+        screen.blit(range_circle(self.range), (self.x - self.range, self.y - self.range))
+
+    def get_rects(self):
+        """Zwraca prostokąty obejmujące wszystko, co rysuje wieża (bez zasięgu - jest w tle)."""
+        rect = self.level_text().get_rect(topleft=(int(self.x - 10), int(self.y - 10)))
+        base_animation = self.get_base_animation()
+        if base_animation:
+            frame = base_animation[self.base_frame % len(base_animation)]
+            rect.union_ip(frame.get_rect(midbottom=(int(self.x - 1), int(self.y + 29))))
+        frames = self.get_archer_animation()
+        if frames:
+            frame = frames[self.archer_frame % len(frames)]
+            rect.union_ip(frame.get_rect(center=(int(self.x - 1), int(self.y + self.archer_offset_y))))
+        return [rect]
 
 class FireTower(Tower):
     """Wieża ognia, zadająca obrażenia obszarowe"""
+    __slots__ = ("fire_zones",)
+
+    type_id = TOWER_IDS["FireTower"]
+
     def __init__(self, x, y):
         super().__init__(x, y)
-        self.range = 150
-        self.reload_time = 2
-        self.fire_rate = 1 / self.reload_time
         self.fire_zones = []
 
     def fire_at_target(self, target, bullets):
@@ -301,24 +334,29 @@ class FireTower(Tower):
     
     def create_fire_zone(self, target):
         """Tworzy nową strefe ognia"""
-        self.fire_zones.append(FireZone(target.x, target.y))
+        self.fire_zones.append(acquire(FireZone, target.x, target.y))
 
-    def update(self, dt, enemies, bullets = None):
+    def release_pooled(self):
+        """Oddaje strefy ognia do puli (przy sprzedaży lub ewolucji)."""
+        for zone in self.fire_zones:
+            release(zone)
+        self.fire_zones.clear()
+
+    def update(self, dt, enemies, bullets = None, grid = None):
         """Aktualizuje stan wieży ognia """
 
         self.update_animation(dt)
 
-        # aktualizuje strefy ognia
+        # aktualizuje strefy ognia (wygasłe wracają do puli)
         for zone in self.fire_zones:
-            zone.update(dt, enemies)
-            if zone.is_expired():
-                self.fire_zones.remove(zone)
+            zone.update(dt, enemies, grid)
+        compact(self.fire_zones, lambda zone: not zone.is_expired())
 
         self.cooldown -= dt
 
         # sprawdzenie czy można stworzyć kolejne pole ognia
         if self.cooldown <= 0:
-            target = self.get_target(enemies)
+            target = self.get_target(enemies, grid)
 
             if target:
                 self.set_direction(target)
@@ -329,21 +367,24 @@ class FireTower(Tower):
 
 
 
-    def draw(self, screen):
+    def get_rects(self):
+        """Zwraca prostokąty wieży oraz jej stref ognia"""
+        return super().get_rects() + [zone.get_rect() for zone in self.fire_zones]
+
+    def draw(self, screen, offset = (0, 0)):
         """Rysuje wieżę i strefy ognia"""
-        super().draw(screen)
+        super().draw(screen, offset)
 
         for patch in self.fire_zones:
-            patch.draw(screen)
+            patch.draw(screen, offset)
 
 class IceTower(Tower):
     """Lodowa wieża, spowalniająca przeciwników."""
-    def __init__(self, x, y):
-        super().__init__(x, y)
-        self.range = 150
+    __slots__ = ()
 
-        self.slow_duration = 2.0
-        self.slow_factor = 0.5
+    type_id = TOWER_IDS["IceTower"]
+    slow_duration = TOWER_SLOW_DURATION[type_id]
+    slow_factor = TOWER_SLOW_FACTOR[type_id]
 
     def fire_at_target(self, target, bullets):
         """Wystrzeliwuje lodowy pocisk spowalniający cel."""
@@ -351,19 +392,23 @@ class IceTower(Tower):
             start_x, start_y = self.get_bullet_start_pos()
 
             # Utworzenie lodowego pocisku
-            bullet = IceBullet(start_x, start_y, target, damage=self.damage,
+            bullet = acquire(IceBullet, start_x, start_y, target, damage=self.damage,
                 slow_duration=self.slow_duration, slow_factor=self.slow_factor)
             
-            SOUNDS["arrow"].play()
+            play_sound("arrow")
             bullets.append(bullet)
             self.archer_state = "attack"
             self.archer_frame = 0
     
-    def get_target(self, enemies):
+    def get_target(self, enemies, grid=None):
         """Wybór za cel, przeciwnika który nie jest spowolniony (priorytet) lub z najmniejszym HP."""
 
         enemies_in_range = [] #lista wrogow w zasiegu
 
+        if grid is not None: # siatka sama wybiera wroga w zasięgu
+            return grid.lowest_hp(self.x, self.y, self.range, alive_only=False,
+                                  unslowed_only=len(enemies) != 1)
+
         for enemy in enemies: #sprawdzanie odleglosci miedzy wieza a wrogiem
             dx = enemy.x - self.x
             dy = enemy.y - self.y
@@ -380,30 +425,28 @@ class IceTower(Tower):
 
 class SpeedyTower(Tower):
     """Wieża o zwiększonej szybkostrzelności."""
-    def __init__(self, x, y):
-        super().__init__(x, y)
-        self.range = 150
+    __slots__ = ()
 
-        self.reload_time = 0.4
-        self.fire_rate = 1 / self.reload_time
-        self.shot_frame = 1
+    type_id = TOWER_IDS["SpeedyTower"]
+    shot_frame = 1
 
     def fire_at_target(self, target, bullets):
         """Wystrzeliwuje szybkiego pocisku w stronę celu."""
         if bullets is not None:
             start_x, start_y = self.get_bullet_start_pos()
-            bullet = Bullet(start_x, start_y, target)
+            bullet = acquire(Bullet, start_x, start_y, target)
             bullet.damage = self.damage
 
+            bullet.anim_kind = "speed"
             bullet.anim = ARROW_ANIMATIONS.get("speed", [])
-            SOUNDS["arrow"].play()
+            play_sound("arrow")
             bullets.append(bullet)
 
     
 
 class EvolutionMenu:
     """Menu umożliwiające ewolucję wieży do typu specjalnego."""
-    def __init__(self, tower):
+    def __init__(self, tower, offset = (0, 0)):
         self.tower = tower
         self.options = ["FireTower", "IceTower", "SpeedyTower"]
         self.menu_width = 100
@@ -411,14 +454,20 @@ class EvolutionMenu:
         self.menu_height = self.button_height * len(self.options)
         self.selected_option = None
 
-        self.x = tower.x - self.menu_width // 2
+        # pozycja wieży na ekranie (offset - pozycja kamery na mapie)
+        tower_x, tower_y = tower.x - offset[0], tower.y - offset[1]
+        self.x = tower_x - self.menu_width // 2
 
         # domyślnie menu nad wieżą
-        self.y = tower.y - self.menu_height - 50
+        self.y = tower_y - self.menu_height - 50
 
         # jeśli menu nie mieści się nad — przenieś pod wieżę
         if self.y < 0:
-            self.y = tower.y + 30
+            self.y = tower_y + 30
+
+    def get_rect(self):
+        """Zwraca prostokąt zajmowany przez menu."""
+        return pygame.Rect(self.x, self.y, self.menu_width, self.menu_height)
 
     def handle_click(self, pos):
         """Obsługuje kliknięcie w menu ewolucji."""
@@ -434,8 +483,6 @@ class EvolutionMenu:
 
     def draw(self, screen):
         """Rysuje menu ewolucji na ekranie"""
-        font = pygame.font.SysFont("arial", 16)
-
         background_colors = \
         {
             "FireTower" : (255,100,100),
@@ -455,7 +502,7 @@ class EvolutionMenu:
             pygame.draw.rect(screen, (0, 0, 0), (bx, by, self.menu_width, self.button_height), 2)
 
             # Tekst przycisków
-            label = font.render(option.capitalize(), True, (0, 0, 0))
+            label = render_text(("arial", 16), option.capitalize(), (0, 0, 0))
             text_x = bx + (self.menu_width - label.get_width()) // 2
             text_y = by + (self.button_height - label.get_height()) // 2
             screen.blit(label, (text_x, text_y))
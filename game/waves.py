@@ -0,0 +1,38 @@
+# game/waves.py
+
+import math
+
+from game.enemy import ENEMY_TYPES
+from game.content import WAVE_BASE_SIZE, WAVE_SIZE_STEP, WAVE_WEIGHTS
+
+
+def wave_size(wave_number):
+    """Zwraca liczbę przeciwników w fali."""
+    return WAVE_BASE_SIZE + (wave_number * WAVE_SIZE_STEP)
+
+
+def wave_weights(wave_number):
+    """Zwraca szanse na poszczególne typy wrogów (zmieniają się z kolejnymi falami)."""
+    for from_wave, weights in WAVE_WEIGHTS:
+        if wave_number >= from_wave:
+            return weights
+    return WAVE_WEIGHTS[-1][1]
+
+
+def wave_schedule(wave_number, rng, spawn_delay):
+    """Harmonogram fali generowany leniwie: pary (odstęp do następnego przeciwnika, klasa przeciwnika).
+
+    Typ przeciwnika jest losowany dopiero, gdy symulacja po niego sięga, więc
+    fala nie trzyma w pamięci wszystkich przeciwników naraz. spawn_delay to
+    funkcja zwracająca bieżący odstęp - czytana przy każdej parze, więc zmiana
+    odstępu w trakcie fali działa od razu, a nie dopiero od następnej fali."""
+    weights = wave_weights(wave_number)
+    for _ in range(wave_size(wave_number)):
+        yield spawn_delay(), rng.choices(ENEMY_TYPES, weights=weights)[0]
+
+
+def expected_enemies(wave_number):
+    """Zwraca spodziewaną liczbę przeciwników każdego typu w fali (zaokrągloną w górę)."""
+    size = wave_size(wave_number)
+    return {cls: math.ceil(size * weight)
+            for cls, weight in zip(ENEMY_TYPES, wave_weights(wave_number)) if weight}
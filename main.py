@@ -1,41 +1,30 @@
 # main.py
 
-import pygame, sys
-from config import WIDTH, HEIGHT, TILE_SIZE, BLACK, WHITE, GLOBAL_VOLUME
+import pygame, sys, time
+from config import WIDTH, HEIGHT, TILE_SIZE, BLACK, WHITE, GLOBAL_VOLUME, ASSET_BUNDLE
 from game.game_manager import GameManager, interface_images
 from game.map_builder import MapBuilder
-from game.bullet import load_arrow_animations
-from game.assets import mute_sounds, unmute_sounds
+from game.assets import ASSETS, mute_sounds, unmute_sounds, load_scaled_image
+from game.bundle import open_bundle, refresh_bundle
+from game.loader import AssetLoader, FIRST_FRAME, add_game_assets
+from game.text import render_text
+from game.menu import MenuScreen
+from game.profiler import PROFILER
+
+START_TIME = time.perf_counter() # do pomiaru czasu do pierwszej klatki
+first_frame_ms = None
+load_ms = None
 
 # Inicjalizacja pygame
 pygame.init()
 screen = pygame.display.set_mode((WIDTH, HEIGHT))
 clock = pygame.time.Clock()
-font = pygame.font.SysFont(None, 48)
-
-def draw_menu_background(map_builder, dt, opacity):
-    """Wyświetla tło menu z nałożoną ciemną przejrzystą nakładką."""
-    map_builder.update_animation(dt)
-    map_builder.draw_map(screen)
-    
-    # Ciemna nakładka
-    overlay = pygame.Surface((WIDTH, HEIGHT))
-    overlay.set_alpha(opacity)  # Stopień przyciemnienia
-    overlay.fill((0, 0, 0))
-    screen.blit(overlay, (0, 0))
-
-
-def draw_title_background(text, offset_y):
-    """Rysuje baner tytułowy z wyśrodkowanym tekstem"""
+font = (None, 48) # domyślna czcionka pygame (nazwa, rozmiar) z rejestru game.text
 
+def title_image():
+    """Zwraca tło banera tytułowego (wczytywane raz)."""
     _, _, _, _, bg_img = interface_images()
-
-    title_surface = font.render(text, True, (255, 255, 255))
-    board_rect = bg_img.get_rect(center=(WIDTH // 2, offset_y))
-    text_rect = title_surface.get_rect(center=board_rect.center)
-
-    screen.blit(bg_img, board_rect)
-    screen.blit(title_surface, text_rect)
+    return bg_img
 
 
 # Ustawienia głośności
@@ -49,30 +38,38 @@ pygame.mixer.music.load("sounds/background.mp3")
 pygame.mixer.music.set_volume(0.1)
 pygame.mixer.music.play(-1)  # zapętlenie
 
+def rebuild_bundle():
+    """Odświeża paczkę grafik (na wątku loadera - będzie użyta od następnego uruchomienia)."""
+    decoded = refresh_bundle()
+    print(f"Zbudowano paczkę grafik (zdekodowano {decoded} plików PNG)")
+
+# Grafiki z paczki surowych pikseli, jeśli jest aktualna - w przeciwnym razie z plików PNG
+ASSETS.bundle = open_bundle() if ASSET_BUNDLE else None
 
-load_arrow_animations()
+# Wczytywanie zasobów w tle: mapa i interfejs przed pierwszą klatką, reszta w trakcie menu
+loader = add_game_assets(AssetLoader())
+if ASSET_BUNDLE and ASSETS.bundle is None:
+    loader.add_job("bundle", rebuild_bundle)
+loader.start()
 
-def draw_volume_slider(current_volume, offset_y = 50):
-    """Rysuje suwak głośności oraz przycisk wyciszenia."""
+def draw_volume_slider(surface, current_volume, offset_y = 50):
+    """Rysuje suwak głośności oraz przycisk wyciszenia na podanej powierzchni."""
     bar_rect = pygame.Rect(WIDTH - 130, offset_y, 120, 20)
     handle_x = bar_rect.x + int(current_volume * bar_rect.width)
     handle_rect = pygame.Rect(handle_x - 5, bar_rect.y - 5, 10, 30)
 
-    pygame.draw.rect(screen, (100, 100, 100), bar_rect)
-    pygame.draw.rect(screen, (200, 200, 200), handle_rect)
+    pygame.draw.rect(surface, (100, 100, 100), bar_rect)
+    pygame.draw.rect(surface, (200, 200, 200), handle_rect)
     
-    vol_text = pygame.font.SysFont(None, 24).render("Głośność", True, (255, 255, 255))
-    screen.blit(vol_text, (bar_rect.x, bar_rect.y - 20))
+    vol_text = render_text((None, 24), "Głośność", (255, 255, 255))
+    surface.blit(vol_text, (bar_rect.x, bar_rect.y - 20))
 
     # Przyciski mute/unmute
-    icon_font = pygame.font.SysFont(None, 36)
-    icon_img = pygame.image.load("images/effects/volume/muted.png").convert_alpha() if muted else pygame.image.load("images/effects/volume/unmuted.png").convert_alpha()
-    icon_img_scaled = pygame.transform.scale(icon_img, (32, 32))
+    icon_path = "images/effects/volume/muted.png" if muted else "images/effects/volume/unmuted.png"
+    icon_img_scaled = load_scaled_image(icon_path, (32, 32))
     icon_rect = icon_img_scaled.get_rect()
     icon_rect.topleft = (bar_rect.x - 50, bar_rect.y - 5)
-    screen.blit(icon_img_scaled, icon_rect)
-
-    return bar_rect, handle_rect, icon_rect
+    surface.blit(icon_img_scaled, icon_rect)
 
 def handle_volume_slider_click(pos, bar_rect):
     """Zmiana głośności po kliknięciu paska głośności."""
@@ -92,168 +89,139 @@ def handle_volume_slider_click(pos, bar_rect):
     
     return volume
 
-def draw_button(text, rect, color, text_color=(255, 255, 255)):
-    """Tworzy przyciski UI."""
-    pygame.draw.rect(screen, color, rect, border_radius=20)
-    rendered = font.render(text, True, text_color)
-    rendered_rect = rendered.get_rect(center=rect.center)
-    screen.blit(rendered, rendered_rect)
-
-def draw_menu(map_builder):
-    """Tworzy menu wyboru poziomu trudności."""
-    global volume
-
-    dt = clock.tick(60) / 1000
-    draw_menu_background(map_builder, dt, 160)
-    draw_title_background("Choose difficulty", 100)
-
-    normal_button = pygame.Rect(WIDTH//2 - 125, 200, 250, 80)
-    hard_button = pygame.Rect(WIDTH//2 - 125, 320, 250, 80)
-
-    draw_button("Normal", normal_button, (0,150,0))
-    draw_button("Hard",hard_button, (150,0,0))
+def handle_volume_event(event, widget):
+    """Obsługuje suwak głośności i przycisk wyciszenia. Zwraca True, jeśli zdarzenie dotyczyło głośności."""
+    global volume, dragging_slider, muted, previous_volume
 
-    bar_rect, handle_rect, icon_rect = draw_volume_slider(volume, offset_y = 30)
+    if event.type == pygame.MOUSEBUTTONDOWN:
+        if widget.bar_rect.collidepoint(event.pos):
+            dragging_slider = True
+            volume = handle_volume_slider_click(event.pos, widget.bar_rect)
+            return True
+        elif widget.icon_rect.collidepoint(event.pos):
+            if muted:
+                volume = previous_volume
+                muted = False
+                pygame.mixer.music.set_volume(volume)
+                unmute_sounds()
+            else:
+                previous_volume = volume
+                volume = 0.0
+                muted = True
+                pygame.mixer.music.set_volume(0)
+                mute_sounds()
+            pygame.mixer.music.set_volume(volume)
+            return True
+
+    elif event.type == pygame.MOUSEBUTTONUP:
+        dragging_slider = False
+    elif event.type == pygame.MOUSEMOTION and dragging_slider:
+        volume = handle_volume_slider_click(event.pos, widget.bar_rect)
+        return True
+    return False
+
+
+class VolumeWidget:
+    """Suwak głośności z przyciskiem wyciszenia jako widżet ekranu menu."""
+    def __init__(self, offset_y = 30):
+        self.offset_y = offset_y
+        self.bar_rect = pygame.Rect(WIDTH - 130, offset_y, 120, 20)
+        self.icon_rect = pygame.Rect(self.bar_rect.x - 50, self.bar_rect.y - 5, 32, 32)
+        # Obszar obejmujący napis, ikonę oraz pasek z uchwytem w skrajnych położeniach
+        self.rect = pygame.Rect(self.icon_rect.x, self.bar_rect.y - 20, WIDTH - self.icon_rect.x, 50)
+
+    def state(self):
+        """Zwraca wartości, od których zależy wygląd widżetu."""
+        return volume, muted
+
+    def draw(self, surface):
+        """Rysuje suwak na podanej powierzchni."""
+        draw_volume_slider(surface, volume, self.offset_y)
 
-    pygame.display.flip()
-    return normal_button, hard_button, bar_rect, icon_rect
 
 def main_menu(map_builder):
     """Główne menu gry umożliwiające zmianę głośności, wybór poziomu trudności lub przejście do gry."""
-    global volume, dragging_slider, muted, previous_volume
+    menu = MenuScreen("Choose difficulty",
+                      [("Normal", pygame.Rect(WIDTH//2 - 125, 200, 250, 80), (0,150,0)),
+                       ("Hard", pygame.Rect(WIDTH//2 - 125, 320, 250, 80), (150,0,0))],
+                      title_image(), font, map_builder=map_builder, opacity=160,
+                      widget=VolumeWidget(offset_y = 30))
+    dt = 0
 
     while True:
-        normal_button, hard_button, vol_bar, mute_rect = draw_menu(map_builder)
+        loader.pump()
+        menu.draw(screen, dt)
 
         for event in pygame.event.get():
             if event.type == pygame.QUIT:
                 pygame.quit()
                 sys.exit()
 
+            if handle_volume_event(event, menu.widget):
+                continue
+
             if event.type == pygame.MOUSEBUTTONDOWN:
-                if normal_button.collidepoint(event.pos):
-                    return "Normal"
-                elif hard_button.collidepoint(event.pos):
-                    return "Hard"
-                elif vol_bar.collidepoint(event.pos):
-                    dragging_slider = True
-                    volume = handle_volume_slider_click(event.pos, vol_bar)
-                elif mute_rect.collidepoint(event.pos):
-                    if muted:
-                        volume = previous_volume
-                        muted = False
-                        pygame.mixer.music.set_volume(volume)
-                        unmute_sounds()
-                    else:
-                        previous_volume = volume
-                        volume = 0.0
-                        muted = True
-                        pygame.mixer.music.set_volume(0)
-                        mute_sounds()
-                    pygame.mixer.music.set_volume(volume)
-
-            elif event.type == pygame.MOUSEBUTTONUP:
-                dragging_slider = False
-            elif event.type == pygame.MOUSEMOTION and dragging_slider:
-                volume = handle_volume_slider_click(event.pos, vol_bar)
+                chosen = menu.button_at(event.pos)
+                if chosen:
+                    return chosen
 
-        clock.tick(60)
+        dt = clock.tick(60) / 1000
 
 def end_screen(result_text, score, wave):
     """Ekran końcowy z wynikiem gry i opcją zapisu wyniku lub przejścia do menu"""
-    saved = False
-    small_font = pygame.font.SysFont(None, 36)
+    small_font = (None, 36)
+    texts = [(f"Wynik końcowy: {score}", small_font, (255, 255, 255), (WIDTH // 2, 220)),
+             (f"Fala: {wave}", small_font, (255, 255, 255), (WIDTH // 2, 260))]
+    menu = MenuScreen(result_text,
+                      [("Zapisz wynik", pygame.Rect(WIDTH // 2 - 125, 370, 250, 80), (0, 100, 100)),
+                       ("Menu", pygame.Rect(WIDTH // 2 - 125, 490, 250, 80), (0, 120, 255)),
+                       ("Wyjdź", pygame.Rect(WIDTH // 2 - 125, 610, 250, 80), (200, 50, 50))],
+                      title_image(), font, backdrop=(30, 30, 30), texts=texts)
 
     while True:
-        screen.fill((30, 30, 30))
-  
-
-        draw_title_background(result_text, 100)
-
-        score_surface = small_font.render(f"Wynik końcowy: {score}", True, (255, 255, 255))
-        wave_surface = small_font.render(f"Fala: {wave}", True, (255, 255, 255))
-        score_rect = score_surface.get_rect(center=(WIDTH // 2, 220))
-        wave_rect = wave_surface.get_rect(center=(WIDTH // 2, 260))
-        screen.blit(score_surface, score_rect)
-        screen.blit(wave_surface, wave_rect)
-
-        if saved:
-            confirm_surface = small_font.render("Zapisano wynik do pliku!", True, (0, 255, 0))
-            confirm_rect = confirm_surface.get_rect(center=(WIDTH // 2, 320))
-            screen.blit(confirm_surface, confirm_rect)
-
-        save_button = pygame.Rect(WIDTH // 2 - 125, 370, 250, 80)
-        menu_button = pygame.Rect(WIDTH // 2 - 125, 490, 250, 80)
-        exit_button = pygame.Rect(WIDTH // 2 - 125, 610, 250, 80)
-
-        draw_button("Zapisz wynik", save_button, (0, 100, 100))
-        draw_button("Menu", menu_button, (0, 120, 255))
-        draw_button("Wyjdź", exit_button, (200, 50, 50))
-        
-        pygame.display.flip()
+        menu.draw(screen)
 
         for event in pygame.event.get():
             if event.type == pygame.QUIT:
                 pygame.quit()
                 sys.exit()
             if event.type == pygame.MOUSEBUTTONDOWN:
-                if save_button.collidepoint(event.pos):
+                chosen = menu.button_at(event.pos)
+                if chosen == "Zapisz wynik":
                     save_score(score, wave)
-                    saved = True
-                elif menu_button.collidepoint(event.pos):
+                    menu.set_texts(texts + [("Zapisano wynik do pliku!", small_font, (0, 255, 0),
+                                             (WIDTH // 2, 320))])
+                elif chosen == "Menu":
                     return "menu"
-                elif exit_button.collidepoint(event.pos):
+                elif chosen == "Wyjdź":
                     pygame.quit()
                     sys.exit()
+        clock.tick(60)
 
 def pause_menu(background):
     """Menu pauzy podczas gry."""
-    global volume, dragging_slider, muted, previous_volume
-    while True:
-        screen.blit(background, (0,0))
-        draw_title_background("Pauza", 100)
-        bar_rect, handle_rect, mute_rect = draw_volume_slider(volume, offset_y= 30)
-
-        resume_button = pygame.Rect(WIDTH // 2 - 125, 200, 250, 80)
-        menu_button = pygame.Rect(WIDTH // 2 - 125, 320, 250, 80)
-
-        draw_button("Kontynuuj", resume_button, (0, 150, 0))
-        draw_button("Menu", menu_button, (0, 120, 255))
-
+    menu = MenuScreen("Pauza",
+                      [("Kontynuuj", pygame.Rect(WIDTH // 2 - 125, 200, 250, 80), (0, 150, 0)),
+                       ("Menu", pygame.Rect(WIDTH // 2 - 125, 320, 250, 80), (0, 120, 255))],
+                      title_image(), font, backdrop=background, widget=VolumeWidget(offset_y = 30))
 
-        pygame.display.flip()
+    while True:
+        menu.draw(screen)
 
         for event in pygame.event.get():
             if event.type == pygame.QUIT:
                 pygame.quit()
                 sys.exit()
+
+            if handle_volume_event(event, menu.widget):
+                continue
+
             if event.type == pygame.MOUSEBUTTONDOWN:
-                if resume_button.collidepoint(event.pos):
+                chosen = menu.button_at(event.pos)
+                if chosen == "Kontynuuj":
                     return "resume"
-                elif menu_button.collidepoint(event.pos):
+                elif chosen == "Menu":
                     return "menu"
-                elif bar_rect.collidepoint(event.pos):
-                    dragging_slider = True
-                    volume = handle_volume_slider_click(event.pos, bar_rect)
-                elif mute_rect.collidepoint(event.pos):
-                    if muted:
-                        volume = previous_volume
-                        muted = False
-                        pygame.mixer.music.set_volume(volume)
-                        unmute_sounds()
-                    else:
-                        previous_volume = volume
-                        volume = 0.0
-                        muted = True
-                        pygame.mixer.music.set_volume(0)
-                        mute_sounds()
-                    pygame.mixer.music.set_volume(volume)
-            
-            elif event.type == pygame.MOUSEBUTTONUP:
-                dragging_slider = False
-
-            elif event.type == pygame.MOUSEMOTION and dragging_slider:
-                volume = handle_volume_slider_click(event.pos, bar_rect)
                     
             if event.type == pygame.KEYDOWN:
                 if event.key == pygame.K_ESCAPE:
@@ -262,32 +230,62 @@ def pause_menu(background):
 
 def start_screen(map_builder):
     """Ekran startowy umożliwiający przejście do gry."""
+    menu = MenuScreen("Tower Defense Game",
+                      [("Start", pygame.Rect(WIDTH // 2 - 125, 200, 250, 80), (0, 150, 0)),
+                       ("Wyjdź", pygame.Rect(WIDTH // 2 - 125, 320, 250, 80), (150, 0, 0))],
+                      title_image(), font, map_builder=map_builder, opacity=230)
+    global first_frame_ms
+    dt = 0
 
     while True:
-        dt = clock.tick(60) / 1000
-        draw_menu_background(map_builder, dt, 230)
-        draw_title_background("Tower Defense Game", 100)
-
-
-        start_button = pygame.Rect(WIDTH // 2 - 125, 200, 250, 80)
-        exit_button = pygame.Rect(WIDTH // 2 - 125, 320, 250, 80)
-
-        draw_button("Start", start_button, (0, 150, 0))
-        draw_button("Wyjdź", exit_button, (150, 0, 0))
-
-        pygame.display.flip()
+        loader.pump()
+        menu.draw(screen, dt)
+        if first_frame_ms is None:
+            first_frame_ms = (time.perf_counter() - START_TIME) * 1000
+            print(f"Pierwsza klatka po {first_frame_ms:.0f} ms")
 
         for event in pygame.event.get():
             if event.type == pygame.QUIT:
                 pygame.quit()
                 sys.exit()
             if event.type == pygame.MOUSEBUTTONDOWN:
-                if start_button.collidepoint(event.pos):
+                chosen = menu.button_at(event.pos)
+                if chosen == "Start":
                     return "start"
-                elif exit_button.collidepoint(event.pos):
+                elif chosen == "Wyjdź":
                     pygame.quit()
                     sys.exit()
 
+        dt = clock.tick(60) / 1000
+
+
+def loading_screen():
+    """Pasek postępu wyświetlany do wczytania zasobów potrzebnych na pierwszą klatkę."""
+    bar_rect = pygame.Rect(WIDTH // 2 - 200, HEIGHT // 2 - 10, 400, 20)
+    while not loader.is_done(FIRST_FRAME):
+        for event in pygame.event.get():
+            if event.type == pygame.QUIT:
+                pygame.quit()
+                sys.exit()
+
+        loader.pump(priority=FIRST_FRAME)
+        screen.fill(BLACK)
+        pygame.draw.rect(screen, WHITE, bar_rect, 2)
+        fill_rect = bar_rect.inflate(-6, -6)
+        fill_rect.width = int(fill_rect.width * loader.progress())
+        pygame.draw.rect(screen, WHITE, fill_rect)
+        pygame.display.flip()
+        clock.tick(60)
+
+
+def finish_loading():
+    """Dokańcza wczytywanie zasobów (przed rozpoczęciem rozgrywki)."""
+    global load_ms
+    loader.wait()
+    if load_ms is None:
+        load_ms = loader.elapsed_ms()
+        print(f"Zasoby wczytane po {load_ms:.0f} ms")
+
 
 def save_score(score, wave):
     """Zapisuje wynik gry do pliku tekstowego."""
@@ -298,36 +296,61 @@ def save_score(score, wave):
 
 def main():
     """Główna funkcja zarządzająca przepływem gry."""
+    loading_screen()
     map_builder = MapBuilder()
     action = start_screen(map_builder)
 
     if action == "start":
         difficulty = main_menu(map_builder)
 
+        finish_loading()
         game = GameManager(screen, difficulty)
 
         while True:
-            dt = clock.tick(60) / 1000  # delta time in sec
+            PROFILER.end_frame()
+            PROFILER.begin_frame()
+
+            with PROFILER.section("wait"):
+                dt = clock.tick(60) / 1000  # delta time in sec
             if dt > 0.1:
                 dt = 0.1
             
-            for event in pygame.event.get():
-                if event.type == pygame.QUIT:
-                    pygame.quit()
-                    sys.exit()
-
-                if event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE:
-                    game_ss = screen.copy()
-                    action = pause_menu(game_ss)
-                    if action == "menu":
-                        return main()
+            with PROFILER.section("events"):
+                for event in pygame.event.get():
+                    if event.type == pygame.QUIT:
+                        pygame.quit()
+                        sys.exit()
+
+                    if event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE:
+                        game_ss = screen.copy()
+                        action = pause_menu(game_ss)
+                        if action == "menu":
+                            return main()
+                        game.request_full_redraw()
+
+                    elif event.type == pygame.KEYDOWN and event.key == pygame.K_F3:
+                        PROFILER.toggle()
+                        game.request_full_redraw() # usunięcie wykresu z ekranu
+
+                    elif event.type == pygame.KEYDOWN and event.key == pygame.K_F4:
+                        print("Zapisano ślad profilera:", PROFILER.dump_trace())
                 
+                    else:
+                        game.handle_event(event)
+
+            with PROFILER.section("update"):
+                game.update(dt)
+            with PROFILER.section("draw"):
+                dirty_rects = game.draw()
+                if PROFILER.enabled:
+                    overlay_rect = PROFILER.draw_overlay(screen)
+                    if dirty_rects is not None:
+                        dirty_rects.append(overlay_rect)
+            with PROFILER.section("flip"):
+                if dirty_rects is None:
+                    pygame.display.flip()
                 else:
-                    game.handle_event(event)
-
-            game.update(dt)
-            game.draw()
-            pygame.display.flip()
+                    pygame.display.update(dirty_rects)
 
             if game.hp <= 0:
                 result = end_screen("Game over!", game.score, game.wave_number)